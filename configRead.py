@@ -23,6 +23,529 @@
 import yaml
 import sys
 import os
+import functools
+import getpass
+import hashlib
+import json
+import marshal
+import mmap
+import operator
+import pickle
+import struct
+import re
+import tempfile
+import threading
+import types
+
+# Marker for a key that is not present, as None is a valid YAML value
+_MISSING = object()
+
+# Use the libyaml parser when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Serialises ConfigRead._refresh() updates
+_refreshLock = threading.Lock()
+
+# Parsed YAML files shared by the whole process: absolute path -> ((mtime_ns, size), data)
+_parseCache = {}
+_parseCacheLock = threading.Lock()
+
+class _FrozenDict(dict):
+    """
+    Read-only dictionary used for parse results shared through the parse cache.
+    """
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Cached configuration data is read-only, set attributes on the ConfigRead object instead")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+class _FrozenList(list):
+    """
+    Read-only list used for parse results shared through the parse cache.
+    """
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Cached configuration data is read-only, set attributes on the ConfigRead object instead")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = pop = remove = clear = sort = reverse = _readonly
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+def _freeze(data):
+    """
+    Recursively converts parsed YAML data to read-only containers.
+    """
+    if isinstance(data, dict):
+        return _FrozenDict((key, _freeze(value)) for key, value in data.items())
+    if isinstance(data, list):
+        return _FrozenList(_freeze(value) for value in data)
+    return data
+
+def _user_cache_directory(cacheDirectory):
+    """
+    Returns this user's private directory under cacheDirectory, creating it if needed.
+
+    Pickles are only loaded from a directory that belongs to the current user and that nobody
+    else can write to, as unpickling a file planted by someone else would run their code.
+
+    Returns:
+        str: The directory, or None if it cannot be created or is not private.
+    """
+    user = str(os.getuid()) if hasattr(os, "getuid") else getpass.getuser()
+    directory = os.path.join(cacheDirectory, f"ut_raft-{user}")
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        stat = os.stat(directory, follow_symlinks=False)
+    except OSError:
+        return None
+    if hasattr(os, "getuid") and (stat.st_uid != os.getuid() or stat.st_mode & 0o077):
+        return None
+    return directory
+
+def _load_yaml_file(path, cacheDirectory=None):
+    """
+    Parses a YAML file through the process-wide parse cache.
+
+    Results are keyed by absolute path, modification time and size, so an edited file is parsed
+    again while unchanged files are parsed once per process. The returned data is shared and
+    read-only. When cacheDirectory is set, parse results are also pickled to a private per-user
+    directory within it, which speeds up the first load in new processes.
+
+    Args:
+        path (str): Path of the YAML file.
+        cacheDirectory (str, optional): Directory for the on-disk cache. Defaults to None (disabled).
+
+    Returns:
+        The parsed (frozen) YAML data.
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    with _parseCacheLock:
+        cached = _parseCache.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    data = _MISSING
+    cacheFile = None
+    directory = _user_cache_directory(cacheDirectory) if cacheDirectory else None
+    if directory:
+        cacheFile = os.path.join(directory, hashlib.sha1(path.encode()).hexdigest() + ".pickle")
+        try:
+            with open(cacheFile, "rb") as source:
+                cachedSignature, cachedData = pickle.load(source)
+            if cachedSignature == signature:
+                data = cachedData
+        except Exception:
+            # Missing, truncated or otherwise unusable: parse the YAML instead
+            pass
+
+    if data is _MISSING:
+        with open(path, 'r') as file:
+            data = yaml.load(file, Loader=_YAML_LOADER)
+        if cacheFile is not None:
+            temporaryPath = None
+            try:
+                descriptor, temporaryPath = tempfile.mkstemp(dir=directory, suffix=".tmp")
+                with os.fdopen(descriptor, "wb") as output:
+                    pickle.dump((signature, data), output, protocol=pickle.HIGHEST_PROTOCOL)
+                # Atomic replace, so a concurrent reader never sees a partial file
+                os.replace(temporaryPath, cacheFile)
+            except Exception:
+                if temporaryPath is not None and os.path.exists(temporaryPath):
+                    os.unlink(temporaryPath)
+
+    _compile_templates(data)
+    data = _freeze(data)
+    with _parseCacheLock:
+        _parseCache[path] = (signature, data)
+    return data
+
+# Snapshot file layout: header, JSON metadata, then the data serialised with marshal (or pickle)
+_SNAPSHOT_MAGIC = b"UTCFGSNP"
+_SNAPSHOT_VERSION = 1
+_SNAPSHOT_HEADER = struct.Struct("<8sHBI")    # magic, version, format, metadata length
+_SNAPSHOT_MARSHAL = 0
+_SNAPSHOT_PICKLE = 1
+
+def _file_fingerprint(path):
+    """
+    Returns the SHA-256 digest (hex) of a file's contents.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _thaw(data):
+    """
+    Converts read-only containers back to plain ones, as marshal only handles built-in types.
+    """
+    if isinstance(data, dict):
+        return {key: _thaw(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [_thaw(value) for value in data]
+    return data
+
+def _attribute_name(key, value):
+    """
+    Returns the name of the attribute _set_attributes() creates for a key.
+    """
+    if isinstance(key, int) or (isinstance(value, dict) and str(key).isdigit()):
+        return '_' + str(key)
+    return key
+
+def _hoisted_names(value):
+    """
+    Returns the names of the attributes _set_attributes() creates on the enclosing object
+    for the dictionaries held in a list value.
+    """
+    names = set()
+    if isinstance(value, list):
+        for item in value:
+            if isinstance(item, dict):
+                for key, itemValue in item.items():
+                    names.add(_attribute_name(key, itemValue))
+                    names |= _hoisted_names(itemValue)
+    return names
+
+def _lookup_field(data, name):
+    """
+    Finds the YAML value that _set_attributes() would store in the attribute called name.
+
+    Numeric keys are reached through their '_' prefixed name (e.g. `_0`), and the keys of
+    dictionaries held in a list are exposed on the dictionary holding the list.
+
+    Args:
+        data (dict): The YAML data of the object.
+        name (str): The attribute name.
+
+    Returns:
+        The value, or _MISSING if there is no such attribute.
+    """
+    keys = [name]
+    if name.startswith("_") and name[1:].isdigit():
+        keys += [int(name[1:]), name[1:]]
+    for key in keys:
+        if key in data:
+            return data[key]
+
+    for value in data.values():
+        if isinstance(value, list):
+            for item in value:
+                if isinstance(item, dict):
+                    for key in keys:
+                        if key in item:
+                            return item[key]
+    return _MISSING
+
+class ConfigPath:
+    """
+    Pre-parsed accessor for a dot-separated field path, see ConfigRead.compile_path().
+
+    Each part of the path is resolved the same way whatever the node it is applied to:
+
+    * ConfigRead objects (and other objects): attribute lookup, numeric parts select the `_N` attribute.
+    * Dictionaries: key lookup, numeric parts match integer, string and `_N` style keys.
+    * Lists: numeric parts, with or without the '_' prefix, are indexes.
+
+    Runs of non-numeric parts are read with one operator.attrgetter, so a path through ConfigRead
+    objects is resolved in C; other nodes fall back to a step by step walk.
+    """
+    __slots__ = ("path", "_steps", "_segments")
+
+    def __init__(self, field_path: str):
+        """
+        Args:
+            field_path (str): A dot-separated path (e.g., "section.0.key" or "section._0.key").
+        """
+        self.path = field_path
+        steps = []
+        for part in field_path.split('.'):
+            index = None
+            attribute = part
+            if part.isdigit():
+                index = int(part)
+                attribute = '_' + part
+            elif part.startswith('_') and part[1:].isdigit():
+                index = int(part[1:])
+            steps.append((attribute, index))
+        self._steps = tuple(steps)
+
+        # (attrgetter, None, None) for a run of attributes, (None, attribute, index) for a numeric part
+        segments = []
+        run = []
+        for attribute, index in steps:
+            if index is None:
+                run.append(attribute)
+                continue
+            if run:
+                segments.append((operator.attrgetter(".".join(run)), None, None))
+                run = []
+            segments.append((None, attribute, index))
+        if run:
+            segments.append((operator.attrgetter(".".join(run)), None, None))
+        self._segments = tuple(segments)
+
+    def get(self, node, default=None):
+        """
+        Resolves the path starting at node.
+
+        Args:
+            node: ConfigRead object, dictionary or list to start from.
+            default (optional): Returned when the path does not exist. Defaults to None.
+
+        Returns:
+            The value at the path, or default.
+        """
+        value = node
+        try:
+            for getter, attribute, index in self._segments:
+                if getter is not None:
+                    value = getter(value)
+                elif isinstance(value, (list, tuple)):
+                    value = value[index]
+                else:
+                    value = getattr(value, attribute)
+        except (AttributeError, IndexError):
+            return self._walk(node, default)
+        # Dictionaries and lists answer some names with their own methods, e.g. "items" or "count"
+        if isinstance(value, types.BuiltinMethodType):
+            return self._walk(node, default)
+        return value
+
+    def _walk(self, node, default):
+        """
+        Resolves the path one part at a time, for paths through dictionaries and lists.
+        """
+        for attribute, index in self._steps:
+            # Objects first, they are by far the most common nodes
+            if not isinstance(node, (dict, list, tuple)):
+                try:
+                    node = getattr(node, attribute)
+                except AttributeError:
+                    return default
+            elif isinstance(node, dict):
+                node = _lookup_field(node, attribute)
+                if node is _MISSING:
+                    return default
+            elif index is None or index >= len(node):
+                return default
+            else:
+                node = node[index]
+        return node
+
+    __call__ = get
+
+    def __repr__(self):
+        return f"ConfigPath({self.path!r})"
+
+# Compiled paths used by resolve() and compile_path(), the same few paths tend to be looked up repeatedly
+_compile_path = functools.lru_cache(maxsize=1024)(ConfigPath)
+
+class _Template:
+    """
+    A string split into literal text and `${name}` references, see ConfigRead.resolve().
+    """
+    __slots__ = ("parts", "names")
+
+    def __init__(self, text):
+        self.parts = []
+        position = 0
+        for match in _TEMPLATE_REFERENCE.finditer(text):
+            self.parts.append((text[position:match.start()], match.group(1).strip(), match.group(0)))
+            position = match.end()
+        self.parts.append((text[position:], None, ""))
+        self.names = frozenset(name for _, name, _ in self.parts if name)
+
+    def render(self, values):
+        """
+        Builds the string, keeping references without a value as they are.
+        """
+        return "".join(literal + (values.get(name, original) if name else "") for literal, name, original in self.parts)
+
+_TEMPLATE_REFERENCE = re.compile(r"\$\{([^}]+)\}")
+
+# Templates of the strings in loaded configuration data, compiled as the data is loaded
+_loadedTemplates = {}
+
+# Other strings passed to interpolate() are compiled on first use
+_compile_template = functools.lru_cache(maxsize=4096)(_Template)
+
+def _compile_templates(data):
+    """
+    Compiles the `${name}` templates found in YAML data, so resolve() never parses them.
+    """
+    if isinstance(data, str):
+        if "${" in data and data not in _loadedTemplates:
+            _loadedTemplates[data] = _Template(data)
+    elif isinstance(data, dict):
+        for value in data.values():
+            _compile_templates(value)
+    elif isinstance(data, list):
+        for value in data:
+            _compile_templates(value)
+
+# Bumped whenever a value resolve() may have used changes, which discards every memoised result
+_resolveGeneration = 0
+
+def _invalidate_resolved():
+    global _resolveGeneration
+    _resolveGeneration += 1
+
+def _index_key(value):
+    """
+    Hashable key for a scalar YAML value, keeping booleans apart from the integers 0 and 1.
+    """
+    return (isinstance(value, bool), value)
+
+class _ConfigIndex:
+    """
+    Inverted indexes over the YAML data of a ConfigRead object, used by ConfigRead.where().
+
+    Every mapping in the data is a node, identified by the ConfigRead.get() path of the object
+    built for it. For each node, scalar fields are indexed by value and lists of scalars by item,
+    so a query is answered with set operations instead of a scan of the profile.
+    """
+    def __init__(self, data):
+        self.paths = []            # node id -> path, in document order
+        self.equals = {}           # (field, value key) -> node ids
+        self.contains = {}         # (field, item key) -> node ids
+        self.fields = {}           # field -> node ids having it
+        self._add_node(data, None)
+
+    def _add_node(self, data, path):
+        node = len(self.paths)
+        self.paths.append(path)
+        self._add_fields(data, node, path)
+
+    def _add_fields(self, data, node, path):
+        for key, value in data.items():
+            name = str(_attribute_name(key, value))
+            self.fields.setdefault(name, set()).add(node)
+            if isinstance(value, dict):
+                self._add_node(value, name if path is None else f"{path}.{name}")
+            elif isinstance(value, list):
+                for item in value:
+                    if isinstance(item, dict):
+                        # Keys of dictionaries in lists belong to the enclosing node
+                        self._add_fields(item, node, path)
+                    elif not isinstance(item, list):
+                        self.contains.setdefault((name, _index_key(item)), set()).add(node)
+            else:
+                self.equals.setdefault((name, _index_key(value)), set()).add(node)
+
+    def evaluate(self, query):
+        """
+        Evaluates a compiled query (see _compile_query) to a set of node ids.
+        """
+        operator = query[0]
+        if operator == "or":
+            return self.evaluate(query[1]) | self.evaluate(query[2])
+        if operator == "and":
+            return self.evaluate(query[1]) & self.evaluate(query[2])
+        if operator == "not":
+            return set(range(len(self.paths))) - self.evaluate(query[1])
+        _, field, value = query
+        if operator == "contains":
+            return set(self.contains.get((field, _index_key(value)), ()))
+        matches = self.equals.get((field, _index_key(value)), set())
+        if operator == "==":
+            return set(matches)
+        return self.fields.get(field, set()) - matches
+
+_QUERY_TOKEN = re.compile(r"\s*(?:(\(|\))|(==|!=)|\"([^\"]*)\"|'([^']*)'|([^\s()=!]+))")
+
+@functools.lru_cache(maxsize=256)
+def _compile_query(expression):
+    """
+    Parses a ConfigRead.where() expression into a tree of tuples.
+
+    Grammar (keywords are case-insensitive, 'and' binds tighter than 'or'):
+        expression := term ('or' term)*
+        term       := factor ('and' factor)*
+        factor     := 'not' factor | '(' expression ')' | field ('==' | '!=' | 'contains') value
+
+    Raises:
+        ValueError: If the expression is not valid.
+    """
+    tokens = []
+    position = 0
+    expression = expression.strip()
+    while position < len(expression):
+        match = _QUERY_TOKEN.match(expression, position)
+        if not match or match.end() == position:
+            raise ValueError(f"Invalid query at [{expression[position:]}]")
+        paren, operator, double, single, word = match.groups()
+        if double is not None or single is not None:
+            tokens.append(("literal", double if double is not None else single))
+        elif word is not None and word.lower() in ("and", "or", "not", "contains"):
+            tokens.append(("keyword", word.lower()))
+        else:
+            tokens.append(("word", paren or operator or word))
+        position = match.end()
+        while position < len(expression) and expression[position].isspace():
+            position += 1
+
+    def peek(offset=0):
+        return tokens[index[0] + offset] if index[0] + offset < len(tokens) else (None, None)
+
+    def take():
+        token = peek()
+        index[0] += 1
+        return token
+
+    def value_of(token):
+        kind, text = token
+        if kind == "literal":
+            return text
+        if text is None:
+            raise ValueError("Query ends before a value")
+        # Unquoted values follow the YAML scalar rules, e.g. true, 10, 1.5
+        return yaml.safe_load(text)
+
+    def factor():
+        kind, text = take()
+        if (kind, text) == ("keyword", "not"):
+            return ("not", factor())
+        if (kind, text) == ("word", "("):
+            result = parse_or()
+            if take() != ("word", ")"):
+                raise ValueError("Missing ')' in query")
+            return result
+        if kind != "word" or text in ("(", ")", "==", "!="):
+            raise ValueError(f"Expected a field name, found [{text}]")
+        operator = take()
+        if operator in (("word", "=="), ("word", "!="), ("keyword", "contains")):
+            return (operator[1], text, value_of(take()))
+        raise ValueError(f"Expected '==', '!=' or 'contains' after [{text}]")
+
+    def parse_and():
+        result = factor()
+        while peek() == ("keyword", "and"):
+            take()
+            result = ("and", result, factor())
+        return result
+
+    def parse_or():
+        result = parse_and()
+        while peek() == ("keyword", "or"):
+            take()
+            result = ("or", result, parse_and())
+        return result
+
+    index = [0]
+    result = parse_or()
+    if index[0] != len(tokens):
+        raise ValueError(f"Unexpected [{peek()[1]}] in query")
+    return result
 
 class ConfigRead:
     """
@@ -41,20 +564,36 @@ class ConfigRead:
     It automatically prefixes such keys with an underscore '_' to ensure they're valid Python
     attribute names, enabling seamless access.
 
+    In lazy mode, nested objects are only built when an attribute is first accessed, which keeps
+    the start-up cost of large profiles proportional to the keys actually used.
+
+    YAML files are parsed once per process and shared read-only between all the ConfigRead objects
+    created from them. Setting `ConfigRead.cacheDirectory` (or the UT_RAFT_CONFIG_CACHE environment
+    variable) also keeps parse results on disk for new processes.
+
     This class empowers you to effectively integrate YAML-based configuration into your
     Python projects, simplifying the management and retrieval of settings in a structured
     and user-friendly manner.
     """
 
-    def __init__(self, data=None, start_key=None ):
+    cacheDirectory = os.environ.get("UT_RAFT_CONFIG_CACHE")
+
+    def __init__(self, data=None, start_key=None, lazy:bool=False, write_through:bool=False, variables:dict=None ):
         """
         Initializes the ConfigRead object by loading data from a YAML file.
 
         Args:
             data (str or file-like object):
                 Either a YAML string or a file-like object (e.g., opened file) containing YAML data.
+                A ConfigRead object creates a view sharing that object's data.
             start_key (str, optional):
                 If provided, processing starts from this key within the YAML data. Defaults to None (process the entire YAML).
+            lazy (bool, optional):
+                If True, attributes are created on first access and memoised instead of all up front. Defaults to False.
+            write_through (bool, optional):
+                Views only: if True, setting an attribute on the view also sets it on the source object. Defaults to False.
+            variables (dict, optional):
+                Values for `${name}` references resolved by resolve(). `startKey` is set to start_key. Defaults to None.
 
         Returns:
             None
@@ -66,22 +605,40 @@ class ConfigRead:
         Behaviour:
             * Creates attributes on the object based on YAML keys.
             * Numeric keys in the YAML are prefixed with an underscore '_' to ensure valid attribute names.
+            * A view reads its attributes from the source object, so creating one is O(1) whatever the size
+              of the data. Attributes set on the view are kept on the view (copy-on-write) unless write_through
+              is requested, and lists are copied on first access so they can be modified safely.
 
         Example:
             YAML: `A: 0: key: value`
             Result: `self.A._0.key` will contain the value 'value'
         """
+        self._variables = dict(variables or {})
         if data is not None:
             if self.__class__.__name__ == type(data).__name__:
-                # We've been passed a ConfigRead object
-                self._copy_attributes(data, start_key)
+                # We've been passed a ConfigRead object, share its data through a view
+                source = data
+                fields = getattr(data, "fields", None)
                 if start_key:
-                    self.fields = data.fields.get(start_key)
-                else:
-                    self.fields = data.fields
+                    start_key = start_key.rstrip(":")
+                    source = getattr(data, start_key, None)
+                    if self.__class__.__name__ != type(source).__name__:
+                        raise ValueError(f"start_key [{start_key}] must be a valid attribute")
+                    fields = _lookup_field(fields, start_key) if isinstance(fields, dict) else None
+                    if fields is _MISSING:
+                        fields = None
+                self.__class__ = _with_hooks(type(self), _WriteThroughAttributes if write_through else _DeferredAttributes)
+                self.__dict__["_source"] = source
+                self.__dict__["_write_through"] = write_through
+                self.__dict__["fields"] = fields
+                self.__dict__["_variables"] = {**getattr(data, "_variables", {}), **self._variables}
             else:
                 # Read YAML data
                 yaml_data = self.__load_yaml__(data)
+                if isinstance(data, str) and os.path.isfile(data):
+                    # Recorded for ConfigWatcher
+                    self._sourcePath = os.path.abspath(data)
+                    self._startKey = start_key.rstrip(":") if start_key else None
                 activate_data = yaml_data
 
                 if start_key:
@@ -89,42 +646,27 @@ class ConfigRead:
                     activate_data = yaml_data.get(start_key, {})
                     if not activate_data:
                         raise ValueError(f"start_key [{start_key}] must be present in the data")
+                    self._variables.setdefault("startKey", start_key)
 
-                # Recursively set attributes
-                self._set_attributes(activate_data)
+                if lazy and isinstance(activate_data, dict):
+                    # Attributes are materialised by __getattr__ on first access
+                    self.__class__ = _with_hooks(type(self), _DeferredAttributes)
+                    self._lazy = True
+                else:
+                    # Recursively set attributes
+                    self._set_attributes(activate_data)
                 self.fields = activate_data
 
-    def _copy_attributes(self, data, start_key):
+    @staticmethod
+    def _lazy_node(data):
         """
-        Recursively copies attributes from another ConfigRead object.
+        Creates a lazy ConfigRead object over an already loaded dictionary.
         """
-        if start_key is None:
-            # Copy all attributes if no start_key is provided
-            for name, value in vars(data).items():
-                self._recursive_copy_attribute(name, value)
-        else:
-            start_key = start_key.rstrip(":")
-            try:
-                # Copy the attribute corresponding to the start_key
-                value = getattr(data, start_key)
-                for name, value in vars(value).items():
-                    self._recursive_copy_attribute(name, value)
-            except AttributeError:
-                raise ValueError(f"start_key [{start_key}] must be a valid attribute")
-
-    def _recursive_copy_attribute(self, name, value):
-        """
-        Recursively copies an attribute and its value.
-        """
-        if isinstance(value, ConfigRead):
-            # Create a new ConfigRead object for nested attributes
-            setattr(self, name, ConfigRead())
-            # Recursively copy attributes from the nested object
-            for nested_name, nested_value in vars(value).items():
-                getattr(self, name)._recursive_copy_attribute(nested_name, nested_value)
-        else:
-            # Directly set the attribute value
-            setattr(self, name, value)
+        node = ConfigRead()
+        node.__class__ = _with_hooks(ConfigRead, _DeferredAttributes)
+        node._lazy = True
+        node.fields = data
+        return node
 
     def __str__(self):
         # Customize this to display relevant parts of the YAML data
@@ -141,23 +683,24 @@ class ConfigRead:
                 * If a dictionary, it's assumed to be the already-loaded YAML data.
 
         Returns:
-            dict: A dictionary containing the parsed YAML data.
+            dict: A dictionary containing the parsed YAML data. Data loaded from a file is shared and read-only.
 
         Raises:
             ValueError: If `input_var` is neither a valid file path, a YAML string, nor a dictionary.
         """
         if isinstance(input_var, str) and os.path.isfile(input_var):
-            with open(input_var, 'r') as file:
-                data = yaml.safe_load(file)
-                if data is None:
-                    self.log.error("Invalid Input File: [{}]".format(input_var))
-                return data
+            data = _load_yaml_file(input_var, self.cacheDirectory)
+            if data is None:
+                self.log.error("Invalid Input File: [{}]".format(input_var))
+            return data
         elif isinstance(input_var, str):
-                data = yaml.safe_load(input_var)
+                data = yaml.load(input_var, Loader=_YAML_LOADER)
                 if data is None:
                     self.log.error("Invalid Input File: [{}]".format(input_var))
+                _compile_templates(data)
                 return data
         elif isinstance(input_var, dict):
+                _compile_templates(input_var)
                 return input_var
         raise ValueError("Input must be a valid file path or a dictionary")
 
@@ -206,6 +749,98 @@ class ConfigRead:
                 else:
                     self.append(value)  # Append simple value to the list
 
+    def _refresh(self, data):
+        """
+        Updates the object in place to match newly loaded YAML data, see configWatcher.ConfigWatcher.
+
+        The old and new data are compared key by key: nested objects whose data changed are updated
+        recursively, other changed attributes are rebuilt, and attributes of unchanged keys (including
+        nested objects held by callers) are left as they are.
+
+        The new attributes are built aside and then installed under a lock, replacing each updated
+        node's attributes in one assignment, so other threads reading the object see either the old
+        or the new attributes of a node, never a partly updated one.
+
+        Args:
+            data: The new YAML data for this object.
+
+        Returns:
+            list: Dot-separated paths of the fields that changed.
+        """
+        swaps = []
+        _compile_templates(data)
+        changed = self._refresh_node(self.fields, data, "", swaps)
+        with _refreshLock:
+            for node, attributes in swaps:
+                object.__setattr__(node, "__dict__", attributes)
+        _invalidate_resolved()
+        return changed
+
+    def _refresh_node(self, old, new, prefix, swaps):
+        """
+        Works out the new attributes of this node for two versions of its YAML data.
+
+        Nothing is changed: (node, attributes) is added to swaps for this node and for every nested
+        node that is updated, and _refresh() installs them.
+        """
+        attributes = dict(self.__dict__)
+        swaps.append((self, attributes))
+        # The where() index was built from the old data
+        attributes.pop("_index", None)
+        if "fields" in attributes:
+            attributes["fields"] = new
+
+        if not isinstance(old, dict) or not isinstance(new, dict):
+            # Not a mapping any more (or yet): rebuild the whole node
+            kept = {name: attributes[name] for name in ("_variables", "_sourcePath", "_startKey", "_lazy", "fields") if name in attributes}
+            attributes.clear()
+            attributes.update(kept)
+            if not kept.get("_lazy") or not isinstance(new, dict):
+                attributes.pop("_lazy", None)
+                attributes.update(self._build_attributes(new))
+            return [prefix.rstrip(".") or "."]
+
+        lazy = attributes.get("_lazy")
+        changed = []
+        hoisted = set()
+        for key in list(old) + [key for key in new if key not in old]:
+            oldValue = old.get(key, _MISSING)
+            newValue = new.get(key, _MISSING)
+            if oldValue == newValue:
+                continue
+            name = _attribute_name(key, newValue if newValue is not _MISSING else oldValue)
+            path = prefix + str(key)
+            current = attributes.get(name)
+            if isinstance(current, ConfigRead) and isinstance(oldValue, dict) and isinstance(newValue, dict):
+                changed += current._refresh_node(oldValue, newValue, path + ".", swaps)
+                continue
+            changed.append(path)
+            attributes.pop(name, None)
+            # Attributes hoisted from dictionaries in the old and new lists (memoised ones in lazy mode)
+            names = _hoisted_names(oldValue) | _hoisted_names(newValue)
+            for hoistedName in names:
+                attributes.pop(hoistedName, None)
+            hoisted |= names
+            if newValue is not _MISSING and not lazy:
+                attributes.update(self._build_attributes({key: newValue}))
+
+        if hoisted and not lazy:
+            # Rebuild unchanged keys whose attributes were removed with the hoisted ones
+            for key, value in new.items():
+                names = {_attribute_name(key, value)} | _hoisted_names(value)
+                if any(name in hoisted and name not in attributes for name in names):
+                    attributes.update(self._build_attributes({key: value}))
+        return changed
+
+    @staticmethod
+    def _build_attributes(data):
+        """
+        Returns the attributes _set_attributes() creates for data, without touching any existing object.
+        """
+        scratch = ConfigRead()
+        scratch._set_attributes(data)
+        return {name: value for name, value in scratch.__dict__.items() if name != "_variables"}
+
     def append(self, value):
         """
         Appends an item to the internal list.
@@ -228,26 +863,583 @@ class ConfigRead:
         Args:
             field_path (str, optional): A dot-separated path to the 
                                        desired field (e.g., "section.subsection.key").
+                                       Numeric parts index lists and select `_N` attributes.
 
         Returns:
             The attribute (or object itself) associated with the field path.
         """
         if field_path is None:
             return self  # Return the entire object
+        return _compile_path(field_path).get(self)
 
-        current_level = self
-        for part in field_path.split('.'):
-            try:
-                # Check if the part is an integer
-                if part.isdigit():
-                    index = int(part)
-                    current_level = current_level[index]  # Access list element by index
+    def resolve(self, field_path: str = None, **variables):
+        """
+        Retrieves a value like get(), with `${name}` references in strings substituted.
+
+        References are resolved, in order, from the keyword arguments, the variables given to the
+        constructor (including `startKey`), the fields of this configuration (dot-separated paths,
+        themselves resolved recursively) and the environment. Unknown references are left unchanged.
+        Lists of strings are resolved item by item.
+
+        The strings of the configuration are compiled into templates when it is loaded, and resolved
+        results are memoised. Change values with set() (or set_variables()) rather than by assigning
+        attributes, so memoised results are discarded; a reload by ConfigWatcher discards them too.
+        Environment variables are read when a result is first resolved, see invalidate_resolved().
+
+        Example:
+            With `targetWorkspace: "/tmp/${startKey}/"` and `execute: "run.sh -p ${targetWorkspace}/profile.yaml"`,
+            `ConfigRead(profile, "dsAudio").resolve("test.execute")` returns "run.sh -p /tmp/dsAudio//profile.yaml".
+
+        Args:
+            field_path (str, optional): A dot-separated path to the desired field. Defaults to None (the object itself).
+            **variables: Values taking precedence over all other sources.
+
+        Returns:
+            The value associated with the field path, with references resolved.
+        """
+        value = self.get(field_path)
+        if isinstance(value, str):
+            return self.interpolate(value, **variables)
+        if isinstance(value, list):
+            return [self.interpolate(item, **variables) if isinstance(item, str) else item for item in value]
+        return value
+
+    def interpolate(self, text: str, **variables):
+        """
+        Substitutes `${name}` references in a string, see resolve().
+
+        Args:
+            text (str): The string to resolve.
+            **variables: Values taking precedence over all other sources.
+
+        Returns:
+            str: The resolved string.
+        """
+        return self._interpolate(text, variables, ())
+
+    def set_variables(self, **variables):
+        """
+        Sets variables used by resolve(), replacing any with the same name.
+        """
+        self._variables.update(variables)
+        _invalidate_resolved()
+
+    def set(self, field_path: str, value):
+        """
+        Sets the value at a dot-separated field path, and discards the results memoised by resolve().
+
+        Args:
+            field_path (str): A dot-separated path (e.g., "test.root"). Numeric parts index lists and select `_N` attributes.
+            value: The new value.
+
+        Raises:
+            ValueError: If the object holding the field does not exist.
+        """
+        parent, _, name = field_path.rpartition(".")
+        node = self.get(parent) if parent else self
+        if node is None or isinstance(node, dict):
+            raise ValueError(f"Cannot set [{field_path}]: [{parent}] is not a configuration object or list")
+        if isinstance(node, list):
+            node[int(name.lstrip("_"))] = value
+        else:
+            setattr(node, "_" + name if name.isdigit() else name, value)
+        _invalidate_resolved()
+
+    @staticmethod
+    def invalidate_resolved():
+        """
+        Discards the results memoised by resolve(), e.g. after changing environment variables they use.
+        """
+        _invalidate_resolved()
+
+    def _interpolate(self, text, variables, active):
+        template = _loadedTemplates.get(text)
+        if template is None:
+            if "${" not in text:
+                return text
+            template = _compile_template(text)
+
+        resolved = self.__dict__.get("_resolved")
+        if resolved is None or resolved[0] != _resolveGeneration:
+            resolved = self.__dict__["_resolved"] = (_resolveGeneration, {})
+        key = (text, tuple(sorted(variables.items())) if variables else (), active)
+        result = resolved[1].get(key)
+        if result is not None:
+            return result
+
+        values = {}
+        for name in template.names:
+            if name in active:
+                continue    # Circular reference, leave it unresolved
+            if name in variables:
+                values[name] = str(variables[name])
+            elif name in self._variables:
+                values[name] = str(self._variables[name])
+            else:
+                value = _compile_path(name).get(self)
+                if value is not None and not isinstance(value, (ConfigRead, list, dict)):
+                    if isinstance(value, str):
+                        value = self._interpolate(value, variables, active + (name,))
+                    values[name] = str(value)
                 else:
-                    current_level = getattr(current_level, part)
-            except (AttributeError, IndexError):
-                return None
+                    environment = os.environ.get(name)
+                    if environment is not None:
+                        values[name] = environment
+
+        result = template.render(values)
+        resolved[1][key] = result
+        return result
+
+    def where(self, expression: str, refresh: bool = False):
+        """
+        Finds the objects in the configuration whose fields match an expression.
+
+        Conditions compare a field of an object with a value and can be combined with 'and', 'or',
+        'not' and parentheses:
+
+        * `field == value` / `field != value` for scalar fields
+        * `field contains value` for lists of scalars
+
+        Values are YAML scalars (`true`, `10`, `AAC`) or quoted strings. Inverted indexes over the
+        YAML data are built on the first query and reused, so repeated queries do not scan the data.
+
+        Example:
+            `IAudioDecoderManager.where("supportedCodecs contains DOLBY_AC4 and supportsSecure == true")`
+            returns the `_0` and `_1` decoder objects.
+
+        Args:
+            expression (str): The query expression.
+            refresh (bool, optional): Rebuild the indexes, e.g. after the data changed. Defaults to False.
+
+        Returns:
+            list: Matching objects in document order, the object itself if its own fields match.
+
+        Raises:
+            ValueError: If the expression is not valid.
+        """
+        query = _compile_query(expression)
+        index = self.__dict__.get("_index")
+        if index is None or refresh:
+            data = self._index_data()
+            if not isinstance(data, dict):
+                raise ValueError("where() requires configuration data held in a dictionary")
+            index = _ConfigIndex(data)
+            self.__dict__["_index"] = index
+        return [self.get(index.paths[node]) for node in sorted(index.evaluate(query))]
+
+    # Attributes that hold bookkeeping rather than configuration data
+    _internalAttributes = frozenset(("fields", "_variables", "_resolved", "_index", "_sourcePath", "_startKey",
+                                     "_lazy", "_source", "_write_through", "_data"))
+
+    def _index_data(self):
+        """
+        Returns the data where() indexes: the YAML data of the object, or for nested objects of an
+        eagerly built configuration (which have no `fields`), a dictionary rebuilt from their attributes.
+        """
+        fields = self.__dict__.get("fields")
+        if fields is not None:
+            return fields
+        source = self.__dict__.get("_source")
+        if source is not None:
+            return source._index_data()
+        data = {}
+        for name, value in self.__dict__.items():
+            if name in self._internalAttributes:
+                continue
+            data[name] = value._index_data() if isinstance(value, ConfigRead) else value
+        return data
+
+    @staticmethod
+    def compile_path(field_path: str):
+        """
+        Compiles a dot-separated field path into a reusable accessor.
+
+        Use this for paths looked up repeatedly, e.g. `codecs = ConfigRead.compile_path("_0.supportedCodecs")`
+        then `codecs(config)`; the path is only parsed once.
+
+        Args:
+            field_path (str): A dot-separated path to the desired field (e.g., "section.0.key").
+
+        Returns:
+            ConfigPath: The accessor for the path.
+        """
+        return _compile_path(field_path)
+
+    def export_snapshot(self, snapshot_path: str):
+        """
+        Writes this object's YAML data to a binary snapshot file, see from_snapshot().
+
+        The snapshot records the YAML file the object was loaded from (if any), its fingerprint
+        and the start_key, so a stale snapshot can be detected and rebuilt.
 
-        return current_level
+        Args:
+            snapshot_path (str): Path of the snapshot file to write.
+
+        Returns:
+            str: The snapshot path.
+        """
+        sourcePath = self.__dict__.get("_sourcePath")
+        metadata = {"source": sourcePath, "start_key": self.__dict__.get("_startKey"), "fingerprint": None, "signature": None}
+        if sourcePath and os.path.isfile(sourcePath):
+            stat = os.stat(sourcePath)
+            metadata["signature"] = [stat.st_mtime_ns, stat.st_size]
+            metadata["fingerprint"] = _file_fingerprint(sourcePath)
+
+        data = _thaw(self.fields)
+        try:
+            payload = marshal.dumps(data)
+            payloadFormat = _SNAPSHOT_MARSHAL
+        except ValueError:
+            # Values marshal cannot handle (e.g. YAML timestamps)
+            payload = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+            payloadFormat = _SNAPSHOT_PICKLE
+
+        encodedMetadata = json.dumps(metadata).encode()
+        temporaryPath = f"{snapshot_path}.{os.getpid()}.tmp"
+        with open(temporaryPath, "wb") as output:
+            output.write(_SNAPSHOT_HEADER.pack(_SNAPSHOT_MAGIC, _SNAPSHOT_VERSION, payloadFormat, len(encodedMetadata)))
+            output.write(encodedMetadata)
+            output.write(payload)
+        # Atomic replace, so workers attaching at the same time never see a partial file
+        os.replace(temporaryPath, snapshot_path)
+        return snapshot_path
+
+    @staticmethod
+    def read_snapshot_metadata(snapshot_path: str):
+        """
+        Reads the metadata recorded in a snapshot file.
+
+        Args:
+            snapshot_path (str): Path of the snapshot file.
+
+        Returns:
+            dict: The source path, start_key, fingerprint and signature (mtime_ns, size) of the source.
+
+        Raises:
+            ValueError: If the file is not a snapshot of a supported version.
+        """
+        with open(snapshot_path, "rb") as file:
+            header = file.read(_SNAPSHOT_HEADER.size)
+            metadata = ConfigRead._snapshot_header(header)[2]
+            return json.loads(file.read(metadata))
+
+    @staticmethod
+    def _snapshot_header(header):
+        if len(header) < _SNAPSHOT_HEADER.size:
+            raise ValueError("Not a ConfigRead snapshot")
+        magic, version, payloadFormat, metadataLength = _SNAPSHOT_HEADER.unpack_from(header)
+        if magic != _SNAPSHOT_MAGIC or version != _SNAPSHOT_VERSION:
+            raise ValueError("Not a ConfigRead snapshot, or an unsupported version")
+        return version, payloadFormat, metadataLength
+
+    @staticmethod
+    def snapshot_is_current(snapshot_path: str):
+        """
+        Checks whether a snapshot still matches the YAML file it was created from.
+
+        The source's modification time and size are compared first; the contents are only hashed
+        when those differ (e.g. after a checkout that rewrote the file unchanged).
+
+        Args:
+            snapshot_path (str): Path of the snapshot file.
+
+        Returns:
+            bool: True if the source is unchanged, or the snapshot was not created from a file.
+        """
+        metadata = ConfigRead.read_snapshot_metadata(snapshot_path)
+        source = metadata.get("source")
+        if not source:
+            return True
+        if not os.path.isfile(source):
+            return False
+        stat = os.stat(source)
+        if metadata.get("signature") == [stat.st_mtime_ns, stat.st_size]:
+            return True
+        return metadata.get("fingerprint") == _file_fingerprint(source)
+
+    @classmethod
+    def from_snapshot(cls, snapshot_path: str, lazy:bool=True, rebuild:bool=True, variables:dict=None):
+        """
+        Creates a ConfigRead object from a snapshot written by export_snapshot().
+
+        The snapshot is memory-mapped and deserialised directly from the mapping, so worker processes
+        attaching to the same snapshot read it from the shared page cache instead of parsing YAML.
+        Lazy mode (the default) only builds the nodes that are accessed.
+
+        Example:
+            ConfigRead(profilePath, "dsAudio").export_snapshot("/tmp/dsAudio.snapshot")   # once
+            profile = ConfigRead.from_snapshot("/tmp/dsAudio.snapshot")                    # in each worker
+
+        Args:
+            snapshot_path (str): Path of the snapshot file.
+            lazy (bool, optional): Create attributes on first access. Defaults to True.
+            rebuild (bool, optional): If the source YAML changed since the snapshot was written, load the
+                                      YAML instead and rewrite the snapshot. Defaults to True.
+            variables (dict, optional): Values for `${name}` references, see resolve(). Defaults to None.
+
+        Returns:
+            ConfigRead: The configuration object.
+
+        Raises:
+            ValueError: If the file is not a snapshot, or it is stale and rebuild is False.
+        """
+        if not cls.snapshot_is_current(snapshot_path):
+            metadata = cls.read_snapshot_metadata(snapshot_path)
+            if not rebuild:
+                raise ValueError(f"Snapshot [{snapshot_path}] is stale, source [{metadata['source']}] has changed")
+            config = cls(metadata["source"], metadata["start_key"], lazy=lazy, variables=variables)
+            try:
+                config.export_snapshot(snapshot_path)
+            except OSError:
+                pass
+            return config
+
+        with open(snapshot_path, "rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+                _, payloadFormat, metadataLength = cls._snapshot_header(mapping[:_SNAPSHOT_HEADER.size])
+                start = _SNAPSHOT_HEADER.size + metadataLength
+                metadata = json.loads(mapping[_SNAPSHOT_HEADER.size:start])
+                with memoryview(mapping) as view:
+                    payload = view[start:]
+                    try:
+                        if payloadFormat == _SNAPSHOT_MARSHAL:
+                            data = marshal.loads(payload)
+                        else:
+                            data = pickle.loads(payload)
+                    finally:
+                        payload.release()
+
+        variables = dict(variables or {})
+        if metadata.get("start_key"):
+            variables.setdefault("startKey", metadata["start_key"])
+        config = cls(data, lazy=lazy, variables=variables)
+        if metadata.get("source"):
+            # Lets ConfigWatcher follow the original YAML file
+            config.__dict__["_sourcePath"] = metadata["source"]
+            config.__dict__["_startKey"] = metadata["start_key"]
+        return config
+
+class _DeferredAttributes:
+    """
+    Attribute lookup for lazy ConfigRead objects and views.
+
+    ConfigRead itself has no __getattr__, so eager objects keep plain attribute lookup; lazy
+    objects and views are switched to a subclass with this class mixed in, see _with_hooks().
+    """
+    def __getattr__(self, name):
+        """
+        Materialises an attribute of a lazy object from its YAML data on first access,
+        or reads it through from the source object of a view.
+
+        Only called when normal attribute lookup fails. The result is stored on the object, so
+        later accesses are plain attribute lookups. Dictionaries become lazy ConfigRead objects,
+        and other values follow the same rules as _set_attributes().
+        """
+        if name.startswith("__"):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        source = self.__dict__.get("_source")
+        if source is not None:
+            # View: read through to the source, wrapping nested objects in views of their own
+            value = getattr(source, name)
+            if self.__class__.__name__ == type(value).__name__:
+                value = ConfigRead(value, write_through=self._write_through)
+            elif isinstance(value, list) and not self._write_through:
+                value = list(value)
+            else:
+                return value
+            self.__dict__[name] = value
+            return value
+
+        if not self.__dict__.get("_lazy") or "fields" not in self.__dict__:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        value = _lookup_field(self.fields, name)
+        if value is _MISSING:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        if isinstance(value, dict):
+            value = ConfigRead._lazy_node(value)
+        elif isinstance(value, list):
+            # Dictionaries inside lists are exposed on the parent object, as in _set_attributes()
+            value = [None if isinstance(item, dict) else item for item in value]
+        self.__dict__[name] = value
+        return value
+
+    def __reduce_ex__(self, protocol):
+        # The subclass is created at run time and cannot be pickled by name
+        return (_restore_with_hooks, (type(self).__bases__[1], type(self).__bases__[0], self.__dict__.copy()))
+
+class _WriteThroughAttributes(_DeferredAttributes):
+    """
+    Attribute lookup and assignment for write-through views: attributes set on the view are set on its source object.
+    """
+    def __setattr__(self, name, value):
+        if name == "fields":
+            self.__dict__[name] = value
+        else:
+            setattr(self._source, name, value)
+            self.__dict__.pop(name, None)
+
+@functools.lru_cache(maxsize=None)
+def _with_hooks(cls, hooks):
+    """
+    Returns the subclass of cls with the attribute hooks mixed in. It keeps the name of cls, as
+    ConfigRead objects are recognised by class name.
+    """
+    return type(cls.__name__, (hooks, cls), {"__module__": cls.__module__, "__qualname__": cls.__qualname__, "__doc__": cls.__doc__, "__slots__": ()})
+
+def _restore_with_hooks(cls, hooks, state):
+    """
+    Recreates a pickled lazy object or view, see _DeferredAttributes.__reduce_ex__().
+    """
+    node = cls.__new__(cls)
+    node.__class__ = _with_hooks(cls, hooks)
+    node.__dict__.update(state)
+    return node
+
+class ConfigNode:
+    """
+    Compact, read-mostly alternative to ConfigRead for large, long-lived configuration trees.
+
+    A ConfigNode keeps a reference to its part of the YAML data and nothing else: scalars are read
+    from the data on every access, and nested nodes are only created when first accessed. Nodes use
+    `__slots__`, so there is no per-node `__dict__`, and each value is held once (in the parsed data,
+    which is shared through the parse cache when loaded from a file).
+
+    The attribute and path API follows ConfigRead:
+
+    * Dot notation (e.g., `node.section.key`), with numeric keys reached as `_N` (e.g., `node._0`).
+    * Indexing (e.g., `node['section']['key']` or `node[0]`).
+    * `node.fields` for the underlying dictionary, and `node.get("section.key")` for dotted paths.
+    * Keys of dictionaries held in lists are exposed on the parent node, and the list holds None in their place.
+
+    Attributes set on a node are kept as overrides on that node; the shared data is never modified.
+    """
+    __slots__ = ("_data", "_children")
+
+    def __init__(self, data=None, start_key:str=None):
+        """
+        Initializes the node from YAML data.
+
+        Args:
+            data (str or dict):
+                A YAML file path, a YAML string or already loaded data, as accepted by ConfigRead.
+            start_key (str, optional):
+                If provided, the node starts from this key within the YAML data. Defaults to None (the entire YAML).
+
+        Raises:
+            ValueError: If `start_key` is not present in the data.
+        """
+        if data is not None and not isinstance(data, dict):
+            # Same loading rules (and parse cache) as ConfigRead
+            data = ConfigRead.__load_yaml__(ConfigRead, data)
+        if start_key:
+            start_key = start_key.rstrip(":")
+            data = data.get(start_key) if isinstance(data, dict) else None
+            if not data:
+                raise ValueError(f"start_key [{start_key}] must be present in the data")
+        object.__setattr__(self, "_data", data if data is not None else {})
+        object.__setattr__(self, "_children", None)
+
+    @classmethod
+    def _wrap(cls, data):
+        """
+        Creates a node over an already loaded dictionary.
+        """
+        node = cls.__new__(cls)
+        object.__setattr__(node, "_data", data)
+        object.__setattr__(node, "_children", None)
+        return node
+
+    def __getattr__(self, name):
+        """
+        Reads an attribute from the node's data, see ConfigRead for the naming rules.
+
+        Only called when normal attribute lookup fails. Scalars are returned directly, nested
+        dictionaries and lists are converted on first access and kept on the node.
+        """
+        if name.startswith("__") or name in ConfigNode.__slots__:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        children = self._children
+        if children is not None and name in children:
+            return children[name]
+
+        value = _lookup_field(self._data, name) if isinstance(self._data, dict) else _MISSING
+        if value is _MISSING:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        if isinstance(value, dict):
+            value = ConfigNode._wrap(value)
+        elif isinstance(value, list):
+            # Dictionaries inside lists are exposed on the parent node, as in ConfigRead
+            value = [None if isinstance(item, dict) else item for item in value]
+        else:
+            return value
+
+        if children is None:
+            children = {}
+            object.__setattr__(self, "_children", children)
+        children[name] = value
+        return value
+
+    def __setattr__(self, name, value):
+        """
+        Sets an attribute as an override on this node, leaving the shared data unchanged.
+        """
+        if self._children is None:
+            object.__setattr__(self, "_children", {})
+        self._children[name] = value
+
+    def __getitem__(self, key):
+        """
+        Reads a field by key; integer keys select the `_N` attribute.
+
+        Raises:
+            KeyError: If the field does not exist.
+        """
+        name = f"_{key}" if isinstance(key, int) else key
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key):
+        name = f"_{key}" if isinstance(key, int) else key
+        return hasattr(self, name)
+
+    def __dir__(self):
+        names = set(super().__dir__())
+        if isinstance(self._data, dict):
+            names.update(f"_{key}" if isinstance(key, int) or str(key).isdigit() else str(key) for key in self._data)
+        if self._children:
+            names.update(self._children)
+        return sorted(names)
+
+    @property
+    def fields(self):
+        """
+        dict: The YAML data of this node (without overrides).
+        """
+        return self._data
+
+    def get(self, field_path: str = None):
+        """
+        Retrieves the value associated with a dot-separated field path, as ConfigRead.get().
+
+        Args:
+            field_path (str, optional): A dot-separated path to the desired field (e.g., "section.0.key").
+
+        Returns:
+            The value (or the node itself) associated with the field path, or None.
+        """
+        if field_path is None:
+            return self
+        return _compile_path(field_path).get(self)
+
+    def __str__(self):
+        return f"Configuration: {self._data}"
 
 # Test and example usage code
 if __name__ == '__main__':
@@ -316,6 +1508,17 @@ if __name__ == '__main__':
     print(application.languages[1])  # Expected: ['JavaScript']
     assert application.languages[1] == "JavaScript", "Expected JavaScript"
 
+    # Views share the data, writes stay on the view unless write_through is requested
+    application.name = "alice"
+    application.languages.append("C")
+    assert data.application.name == "bob", "Expected: bob"
+    assert data.application.languages == ['Python', 'JavaScript'], "Expected ['Python', 'JavaScript']"
+    shared = ConfigRead( data, "application", write_through=True )
+    shared.version = 2.0
+    assert data.application.version == 2.0, "Expected: 2.0"
+    assert shared.version == 2.0, "Expected: 2.0"
+    assert ConfigRead( data ).database.host == "localhost", "Expected: localhost"
+
     # index method still works if required
     #print(data.field.get(["config"]["database"]["port"]))
 
@@ -349,6 +1552,33 @@ if __name__ == '__main__':
     print(value)  # Output: None
     assert value == None, "Expected: None"
 
+    # Example 4: Numeric parts select _N attributes as well as list indexes
+    assert data.get("config.application.languages._1") == "JavaScript", "Expected: JavaScript"
+    languages = ConfigRead.compile_path("config.application.languages")
+    assert languages(data) == ['Python', 'JavaScript'], "Expected ['Python', 'JavaScript']"
+    assert languages.get(data.fields) == ['Python', 'JavaScript'], "Expected ['Python', 'JavaScript']"
+    # Keys named like dictionary or list methods are data, not methods
+    assert ConfigRead.compile_path("0.items").get([{"items": 3}]) == 3, "Expected: 3"
+    assert ConfigRead.compile_path("ports.count").get({"ports": [1]}) is None, "Expected: None"
+
+    # Per-lookup cost against the original split()/getattr() loop, which failed on numeric parts of objects
+    import timeit
+    def splitLookup(node, field_path):
+        for part in field_path.split('.'):
+            try:
+                node = node[int(part)] if part.isdigit() else getattr(node, part)
+            except (AttributeError, IndexError):
+                return None
+        return node
+    for path in ("config.application.name", "config.application.languages.1"):
+        accessor = ConfigRead.compile_path(path)
+        assert splitLookup(data, path) == data.get(path) == accessor(data), f"Expected: same value for {path}"
+        loops = 20000
+        baseline = min(timeit.repeat(lambda: splitLookup(data, path), number=loops, repeat=5)) / loops * 1e6
+        direct = min(timeit.repeat(lambda: data.get(path), number=loops, repeat=5)) / loops * 1e6
+        compiled = min(timeit.repeat(lambda: accessor(data), number=loops, repeat=5)) / loops * 1e6
+        print(f"get [{path}]: split loop {baseline:.2f}us, get() {direct:.2f}us, compiled {compiled:.2f}us")
+
     IAudioDecoderManager = ConfigRead(profile_check, "IAudioDecoderManager")
     print( IAudioDecoderManager )   # TODO: Doesn't currently list objects, unclear if it should
     print( IAudioDecoderManager.interfaceVersion )  # Expected: 1
@@ -371,3 +1601,154 @@ if __name__ == '__main__':
     print(decoders1.supportsSecure)  # Expected: True
     assert decoders1.supportsSecure == True, "Expected: True"
 
+    # Files are parsed once and shared between objects
+    playerConfig = os.path.join(os.path.dirname(os.path.realpath(__file__)), "configs/utPlayerConfig.yml")
+    amlogic = ConfigRead(playerConfig, "amlogic")
+    realtek = ConfigRead(playerConfig, "realtek")
+    assert amlogic.gstreamer.play_command == "gst-play-1.0", "Expected: gst-play-1.0"
+    assert _load_yaml_file(playerConfig)["realtek"] is realtek.fields, "Expected: shared parse result"
+    try:
+        realtek.fields["gstreamer"] = None
+        assert False, "Expected: read-only cached data"
+    except TypeError:
+        pass
+
+    # The disk cache lives in a private per-user directory, and unusable cache files are ignored
+    with tempfile.TemporaryDirectory() as directory:
+        _parseCache.clear()
+        assert _load_yaml_file(playerConfig, directory)["realtek"] == realtek.fields, "Expected: same data"
+        userDirectory = _user_cache_directory(directory)
+        assert os.stat(userDirectory).st_mode & 0o777 == 0o700, "Expected: private cache directory"
+        cacheFiles = os.listdir(userDirectory)
+        assert len(cacheFiles) == 1 and cacheFiles[0].endswith(".pickle"), f"Unexpected cache files: {cacheFiles}"
+        with open(os.path.join(userDirectory, cacheFiles[0]), "wb") as file:
+            file.write(b"\x80\x05garbage")
+        _parseCache.clear()
+        assert _load_yaml_file(playerConfig, directory)["realtek"] == realtek.fields, "Expected: corrupt cache ignored"
+        os.chmod(userDirectory, 0o777)
+        assert _user_cache_directory(directory) is None, "Expected: shared directory rejected"
+
+    # Lazy mode only builds the nodes that are accessed
+    lazy = ConfigRead(input_data, "config", lazy=True)
+    assert "database" not in vars(lazy), "Expected: database not materialised yet"
+    assert lazy.database.host == "localhost", "Expected: localhost"
+    assert lazy.application.languages[1] == "JavaScript", "Expected JavaScript"
+    assert lazy.get("application.version") == 1.0, "Expected: 1.0"
+    assert lazy.get("nonexistent.field") == None, "Expected: None"
+    assert lazy.database is lazy.database, "Expected: memoised node"
+    # Only lazy objects and views carry the attribute hooks, eager objects use plain lookups
+    assert type(data) is ConfigRead and isinstance(lazy, _DeferredAttributes), "Expected: hooks on lazy objects only"
+    assert type(lazy).__name__ == "ConfigRead", "Expected: ConfigRead"
+    lazy.application.name = "bob"
+    lazyApplication = ConfigRead( lazy, "application" )
+    assert lazyApplication.name == "bob", "Expected: bob"
+    assert lazyApplication.languages == ['Python', 'JavaScript'], "Expected ['Python', 'JavaScript']"
+
+    lazyManager = ConfigRead(profile_check, "IAudioDecoderManager", lazy=True)
+    assert lazyManager.interfaceVersion == 1, "Expected: 1"
+    assert lazyManager._0.supportedCodecs == checkDecoders, f"Expected: {checkDecoders}"
+    assert lazyManager._1.supportsSecure == True, "Expected: True"
+    assert not hasattr(lazyManager, "_2"), "Expected: no _2 attribute"
+    assert lazyManager.get("0.supportsSecure") == True, "Expected: True"
+
+    # Compact nodes expose the same attribute, index and path API
+    compact = ConfigNode(input_data, "config")
+    assert compact.database.host == "localhost", "Expected: localhost"
+    assert compact["application"]["languages"][1] == "JavaScript", "Expected: JavaScript"
+    assert compact.get("application.languages.0") == "Python", "Expected: Python"
+    assert compact.get("nonexistent.field") == None, "Expected: None"
+    assert compact.database is compact.database, "Expected: memoised node"
+    compact.application.name = "bob"
+    assert compact.application.name == "bob", "Expected: bob"
+    assert compact.fields["application"]["name"] == "MyApp", "Expected: data unchanged"
+    compactManager = ConfigNode(profile_check, "IAudioDecoderManager")
+    assert compactManager._0.supportedCodecs == checkDecoders, f"Expected: {checkDecoders}"
+    assert compactManager[1].supportsSecure == True, "Expected: True"
+    assert "_2" not in compactManager, "Expected: no _2 attribute"
+
+    # Memory held by a large profile tree once every node has been visited
+    import tracemalloc
+    largeProfile = {f"component{c}": {f"resource{r}": {"index": r, "name": f"res{r}", "capabilities": {"secure": True, "codecs": ["AAC", "AC3"]}}
+                                      for r in range(50)} for c in range(100)}
+    def visit(node):
+        for key in node.fields:
+            value = getattr(node, key)
+            if isinstance(value, (ConfigRead, ConfigNode)):
+                visit(value)
+    for name, factory in (("ConfigRead", ConfigRead), ("ConfigRead lazy", lambda data: ConfigRead(data, lazy=True)), ("ConfigNode", ConfigNode)):
+        tracemalloc.start()
+        tree = factory(largeProfile)
+        if name != "ConfigRead":
+            visit(tree)
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del tree
+        print(f"{name}: {size / 1024:.0f} KiB for {len(largeProfile) * 50 * 2} nodes")
+
+    # Binary snapshots skip YAML parsing in worker processes
+    with tempfile.TemporaryDirectory() as directory:
+        snapshotPath = os.path.join(directory, "player.snapshot")
+        ConfigRead(playerConfig, "realtek").export_snapshot(snapshotPath)
+        assert ConfigRead.snapshot_is_current(snapshotPath), "Expected: current snapshot"
+        restored = ConfigRead.from_snapshot(snapshotPath)
+        assert restored.fields == realtek.fields, "Expected: same data"
+        assert restored.get("gstreamer.play_command") == realtek.get("gstreamer.play_command"), "Expected: same value"
+        loops = 20
+        yamlTime = timeit.timeit(lambda: yaml.load(open(playerConfig).read(), Loader=_YAML_LOADER), number=loops) / loops * 1e3
+        snapshotTime = timeit.timeit(lambda: ConfigRead.from_snapshot(snapshotPath), number=loops) / loops * 1e3
+        print(f"utPlayerConfig.yml: YAML parse {yamlTime:.2f}ms, snapshot load {snapshotTime:.2f}ms")
+
+        # A changed source is detected, and the snapshot rebuilt from it
+        sourcePath = os.path.join(directory, "profile.yaml")
+        with open(sourcePath, "w") as file:
+            file.write("dsAudio:\n  ports: 2\n")
+        ConfigRead(sourcePath, "dsAudio").export_snapshot(snapshotPath)
+        with open(sourcePath, "w") as file:
+            file.write("dsAudio:\n  ports: 4\n")
+        assert not ConfigRead.snapshot_is_current(snapshotPath), "Expected: stale snapshot"
+        assert ConfigRead.from_snapshot(snapshotPath).ports == 4, "Expected: 4"
+        assert ConfigRead.snapshot_is_current(snapshotPath), "Expected: rebuilt snapshot"
+
+    # ${variable} interpolation
+    suite = ConfigRead("""
+    dsAudio:
+        targetWorkspace: "/tmp/${startKey}"
+        test:
+            execute: "${targetWorkspace}/bin/run.sh -p ${profile} ${UNKNOWN_VARIABLE}"
+            setup:
+                - "mkdir -p ${targetWorkspace}"
+    """, "dsAudio", variables={"profile": "sink.yaml"})
+    assert suite.resolve("test.execute") == "/tmp/dsAudio/bin/run.sh -p sink.yaml ${UNKNOWN_VARIABLE}", suite.resolve("test.execute")
+    assert suite.resolve("test.execute", profile="source.yaml").endswith("-p source.yaml ${UNKNOWN_VARIABLE}"), "Expected: source.yaml"
+    assert suite.resolve("test.setup") == ["mkdir -p /tmp/dsAudio"], "Expected: ['mkdir -p /tmp/dsAudio']"
+    suite.set("targetWorkspace", "/opt/ws")
+    assert suite.resolve("test.execute").startswith("/opt/ws/bin/run.sh"), "Expected: /opt/ws/bin/run.sh"
+    suite.set("targetWorkspace", "${test.root}")
+    suite.set("test.root", "/opt/a")
+    assert suite.resolve("test.execute").startswith("/opt/a/bin/run.sh"), "Expected: /opt/a/bin/run.sh"
+    suite.set("test.root", "/opt/b")
+    assert suite.resolve("test.execute").startswith("/opt/b/bin/run.sh"), "Expected: nested field change seen"
+    os.environ["UNKNOWN_VARIABLE"] = "-v"
+    ConfigRead.invalidate_resolved()
+    assert suite.resolve("test.execute").endswith("-p sink.yaml -v"), "Expected: environment change seen"
+    del os.environ["UNKNOWN_VARIABLE"]
+    ConfigRead.invalidate_resolved()
+    assert suite.resolve("test.execute").endswith("${UNKNOWN_VARIABLE}"), "Expected: environment removal seen"
+    suite.set("test.setup.0", "rm -rf ${targetWorkspace}")
+    assert suite.resolve("test.setup") == ["rm -rf /opt/b"], "Expected: ['rm -rf /opt/b']"
+    assert suite.test.execute.startswith("${targetWorkspace}"), "Expected: raw value unchanged"
+
+    # Capability queries
+    secureAc4 = IAudioDecoderManager.where("supportedCodecs contains DOLBY_AC4 and supportsSecure == true")
+    assert secureAc4 == [IAudioDecoderManager._0, IAudioDecoderManager._1], "Expected: decoders _0 and _1"
+    assert lazyManager.where("supportedCodecs contains 'DOLBY_AC4'")[0] is lazyManager._0, "Expected: decoder _0"
+    assert IAudioDecoderManager.where("supportsSecure != true") == [], "Expected: no decoders"
+    assert IAudioDecoderManager.where("interfaceVersion == 1") == [IAudioDecoderManager], "Expected: the manager"
+    assert IAudioDecoderManager.where("not (supportedCodecs contains AAC_LC) or interfaceVersion == 2") == [IAudioDecoderManager], "Expected: the manager"
+    assert data.where("host == localhost")[0].port == 5432, "Expected: 5432"
+    # Nested objects of an eager configuration have no fields of their own
+    assert "fields" not in vars(data.config), "Expected: eager nested node"
+    assert data.config.where("port == 5432") == [data.config.database], "Expected: the database node"
+    assert data.config.application.where("languages contains Python") == [data.config.application], "Expected: the application node"
+    assert IAudioDecoderManager.get("1.supportedCodecs.6") == "DOLBY_AC4", "Expected: DOLBY_AC4"
+
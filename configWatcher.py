@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+#** *****************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2024 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+
+import sys
+import os
+import ctypes
+import ctypes.util
+import select
+import struct
+import threading
+
+dir_path = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(dir_path+"/../../../")
+sys.path.append(dir_path)
+
+from framework.core.logModule import logModule
+from framework.plugins.ut_raft.configRead import ConfigRead, _load_yaml_file
+
+# inotify(7) constants
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+_EVENT_HEADER = struct.Struct("iIII")
+
+class _Inotify:
+    """
+    Minimal ctypes wrapper around the Linux inotify API, watching directories for written files.
+    """
+    def __init__(self):
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._directories = {}
+
+    def add_directory(self, directory):
+        """
+        Watches a directory. Editors often replace files rather than writing them, so the
+        directory is watched instead of the file itself.
+        """
+        if directory in self._directories.values():
+            return
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for [{directory}]")
+        self._directories[wd] = directory
+
+    def read(self, timeout=0):
+        """
+        Waits up to timeout seconds for events.
+
+        Returns:
+            set: Paths of the files reported by the events.
+        """
+        paths = set()
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return paths
+        while True:
+            try:
+                buffer = os.read(self.fd, 65536)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(buffer):
+                wd, mask, cookie, length = _EVENT_HEADER.unpack_from(buffer, offset)
+                offset += _EVENT_HEADER.size
+                name = buffer[offset:offset + length].rstrip(b"\0")
+                offset += length
+                if wd in self._directories and name:
+                    paths.add(os.path.join(self._directories[wd], os.fsdecode(name)))
+        return paths
+
+    def close(self):
+        os.close(self.fd)
+
+class ConfigWatcher():
+    """
+    Detects edits to the YAML files behind ConfigRead objects and applies them in place.
+
+    Only files that changed are parsed again. The new data is compared with the data the object
+    currently holds, and only the changed subtrees are rebuilt, so nested objects held by callers
+    for unchanged sections stay valid. Change callbacks receive the object and the changed paths.
+
+    inotify is used where available; otherwise the files' modification times are polled.
+
+    Example:
+        watcher = ConfigWatcher()
+        watcher.watch(profile, lambda config, changed: log.info(f"Profile changed: {changed}"))
+        watcher.start()
+    """
+    def __init__(self, interval:float=1.0, useInotify:bool=True, log:logModule=None):
+        """
+        Initializes the watcher.
+
+        Args:
+            interval (float, optional): Seconds between checks when running in the background. Defaults to 1.0.
+            useInotify (bool, optional): Use inotify if the platform provides it. Defaults to True.
+            log (class, optional): Parent log class. Defaults to None.
+        """
+        self.log = log
+        if log is None:
+            self.log = logModule(self.__class__.__name__)
+            self.log.setLevel( self.log.INFO )
+
+        self.interval = interval
+        self._watches = {}
+        self._signatures = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stopEvent = threading.Event()
+        self._inotify = None
+        if useInotify and sys.platform.startswith("linux"):
+            try:
+                self._inotify = _Inotify()
+            except (OSError, AttributeError) as e:
+                self.log.debug(f"inotify unavailable, polling modification times: {e}")
+
+    def watch(self, config:ConfigRead, callback=None):
+        """
+        Starts watching the file a ConfigRead object was loaded from.
+
+        Args:
+            config (ConfigRead): Object created from a YAML file path (views cannot be watched, watch their source).
+            callback (callable, optional): Called as callback(config, changedPaths) after the object is updated. Defaults to None.
+
+        Raises:
+            ValueError: If the object was not loaded from a file.
+        """
+        path = config.__dict__.get("_sourcePath")
+        if path is None:
+            raise ValueError("Only ConfigRead objects loaded from a file can be watched")
+        with self._lock:
+            self._watches.setdefault(path, []).append((config, callback))
+            if path not in self._signatures:
+                self._signatures[path] = self._signature(path)
+            if self._inotify is not None:
+                self._inotify.add_directory(os.path.dirname(path))
+
+    def unwatch(self, config:ConfigRead):
+        """
+        Stops watching a ConfigRead object.
+        """
+        with self._lock:
+            for path, watches in list(self._watches.items()):
+                watches[:] = [watch for watch in watches if watch[0] is not config]
+                if not watches:
+                    del self._watches[path]
+                    self._signatures.pop(path, None)
+
+    def poll(self, timeout:float=0):
+        """
+        Checks the watched files once and applies any changes.
+
+        Args:
+            timeout (float, optional): Seconds to wait for inotify events. Defaults to 0.
+
+        Returns:
+            dict: Changed paths per updated file, e.g. {"/path/profile.yaml": ["dsAudio.ports"]}.
+        """
+        if self._inotify is not None:
+            candidates = self._inotify.read(timeout) & set(self._watches)
+        else:
+            candidates = set(self._watches)
+
+        results = {}
+        for path in candidates:
+            signature = self._signature(path)
+            with self._lock:
+                if signature is None or signature == self._signatures.get(path):
+                    continue
+                self._signatures[path] = signature
+                watches = list(self._watches.get(path, []))
+            try:
+                data = _load_yaml_file(path, ConfigRead.cacheDirectory)
+            except Exception as e:
+                # Most likely a partially written file, the next write triggers another attempt
+                self.log.error(f"Failed to reload [{path}]: {e}")
+                continue
+            for config, callback in watches:
+                changed = self._apply(config, data)
+                if not changed:
+                    continue
+                results.setdefault(path, []).extend(changed)
+                self.log.info(f"Reloaded [{path}]: {changed}")
+                if callback is not None:
+                    try:
+                        callback(config, changed)
+                    except Exception as e:
+                        self.log.error(f"Config change callback failed: {e}")
+        return results
+
+    def start(self):
+        """
+        Starts checking the watched files in a background thread.
+        """
+        if self._thread is not None:
+            return
+        self._stopEvent.clear()
+        self._thread = threading.Thread(target=self._run, name="ConfigWatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops the background thread and releases the inotify descriptor.
+        """
+        self._stopEvent.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+    def _run(self):
+        while not self._stopEvent.is_set():
+            if self._inotify is not None:
+                self.poll(self.interval)
+            else:
+                self.poll()
+                self._stopEvent.wait(self.interval)
+
+    def _apply(self, config, data):
+        """
+        Updates one ConfigRead object from newly loaded file data.
+        """
+        startKey = config.__dict__.get("_startKey")
+        if startKey:
+            data = data.get(startKey) if isinstance(data, dict) else None
+            if not data:
+                self.log.error(f"start_key [{startKey}] no longer present, keeping the previous configuration")
+                return []
+        return config._refresh(data)
+
+    @staticmethod
+    def _signature(path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+# Test and example usage code
+if __name__ == '__main__':
+    import tempfile
+    import time
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "profile.yaml")
+        with open(path, "w") as file:
+            file.write("dsAudio:\n  ports:\n    count: 2\n  codecs:\n    - AAC\n  video:\n    enabled: true\n")
+
+        profile = ConfigRead(path, "dsAudio")
+        video = profile.video
+        changes = []
+
+        watcher = ConfigWatcher(interval=0.1)
+        watcher.watch(profile, lambda config, changed: changes.append(changed))
+        watcher.start()
+
+        time.sleep(0.05)
+        with open(path, "w") as file:
+            file.write("dsAudio:\n  ports:\n    count: 4\n  codecs:\n    - AAC\n    - AC3\n  video:\n    enabled: true\n")
+
+        deadline = time.time() + 5
+        while not changes and time.time() < deadline:
+            time.sleep(0.05)
+        watcher.stop()
+
+        print(changes)
+        assert changes == [["ports.count", "codecs"]], f"Expected: [['ports.count', 'codecs']], got {changes}"
+        assert profile.ports.count == 4, "Expected: 4"
+        assert profile.codecs == ["AAC", "AC3"], "Expected: ['AAC', 'AC3']"
+        assert profile.video is video, "Expected: unchanged subtree kept"
+
+    # Keys of dictionaries in lists are attributes of the enclosing object, e.g. `ports._1`
+    portsYaml = "ports:\n  - 0: {name: HDMI0}\n  - 1: {name: SPDIF0}\nvideo:\n  enabled: true\n"
+    for lazy in (False, True):
+        ports = ConfigRead(portsYaml, lazy=lazy)
+        assert ports._1.name == "SPDIF0", "Expected: SPDIF0"
+        ports._refresh(ConfigRead(portsYaml.replace("  - 1: {name: SPDIF0}\n", "")).fields)
+        assert not hasattr(ports, "_1"), f"Expected: _1 removed (lazy={lazy})"
+        ports._refresh(ConfigRead(portsYaml.replace("SPDIF0", "ARC0")).fields)
+        assert ports._1.name == "ARC0", f"Expected: ARC0 (lazy={lazy})"
+        assert ports._0.name == "HDMI0", f"Expected: HDMI0 (lazy={lazy})"
+
+        # Queries on nested objects see the new data
+        video = ports.video
+        assert video.where("enabled == true") == [video], f"Expected: video matches (lazy={lazy})"
+        ports._refresh(ConfigRead(portsYaml.replace("SPDIF0", "ARC0").replace("true", "false")).fields)
+        assert ports.video is video, f"Expected: unchanged object kept (lazy={lazy})"
+        assert video.where("enabled == true") == [], f"Expected: no match after reload (lazy={lazy})"
@@ -23,7 +23,15 @@
 
 import sys
 import os
+import io
+import base64
+import binascii
+import hashlib
+import json
+import shlex
 import subprocess
+import tarfile
+import tempfile
 import time
 
 dir_path = os.path.dirname(os.path.realpath(__file__))
@@ -33,10 +41,19 @@ sys.path.append(dir_path)
 from framework.core.logModule import logModule
 from framework.plugins.ut_raft.interactiveShell import InteractiveShell
 
+# Target tools the helpers can make use of, detected by probeCapabilities()
+CAPABILITY_TOOLS = ["rsync", "tar", "gzip", "md5sum", "sha256sum", "base64", "uudecode", "dd",
+                    "pidof", "pgrep", "pkill", "netstat", "ss", "head", "tail", "wc", "busybox"]
+
+# Capabilities probed by this process: (address, port, username) -> capabilities
+_capabilityCache = {}
+
 class utBaseUtils():
     """
     UT Base utility class providing reusable functionalities
     """
+    capabilityCacheFile = os.path.expanduser("~/.cache/ut_raft/capabilities.json")
+
     def __init__(self, log:logModule=None):
         """
         Initializes player class.
@@ -48,6 +65,7 @@ class utBaseUtils():
         if log is None:
             self.log = logModule(self.__class__.__name__)
             self.log.setLevel( self.log.INFO )
+        self.consoleSequence = 0
 
     def sftpCopy(self, session, sourcePath, destinationPath):
         """
@@ -116,6 +134,98 @@ class utBaseUtils():
             # Return error message in case of failure
             return f"SFTP copy failed: {e}"
 
+    def resumableCopy(self, session, sourcePath, destinationPath, chunkSize:int=1024*1024, maxRetries:int=5, progressCallback=None):
+        """
+        Copies a large file from the host machine to the target device over SFTP, resuming after failures.
+
+        Data is written to '<filename>.part' on the device. When a transfer attempt fails, the next attempt
+        checks the size of the partial file and continues from that offset instead of restarting from byte zero.
+        Once complete, the file is verified with sha256sum (or md5sum) on the device and renamed into place.
+
+        Args:
+            session (session class): The active SSH session object containing the connection details.
+            sourcePath (str): The full path of the file on the host machine.
+            destinationPath (str): The target directory on the device.
+            chunkSize (int, optional): Size of each written chunk in bytes. Defaults to 1 MiB.
+            maxRetries (int, optional): Number of transfer attempts before giving up. Defaults to 5.
+            progressCallback (callable, optional): Called as progressCallback(bytesTransferred, totalBytes) after every chunk.
+
+        Returns:
+            str: A message indicating the result of the file transfer.
+        """
+        if session.type != "ssh":
+            self.log.fatal("Session type must be 'ssh'")
+
+        if not os.path.isfile(sourcePath):
+            return f"Resumable copy failed: Source file not found: {sourcePath}"
+
+        if not destinationPath.endswith('/'):
+            destinationPath += '/'
+        remote_path = destinationPath + os.path.basename(sourcePath)
+        part_path = remote_path + ".part"
+        total = os.path.getsize(sourcePath)
+
+        for attempt in range(maxRetries):
+            sftp = None
+            try:
+                # Re-establish the connection if the link dropped during the previous attempt
+                transport = session.console.get_transport() if session.is_open else None
+                if transport is None or not transport.is_active():
+                    session.open()
+                # Created on every attempt, after a reconnect the directory may be gone (e.g. a reboot cleared /tmp)
+                status, _, error = self._execCommand(session, f"mkdir -p {destinationPath}")
+                if status != 0:
+                    raise IOError(f"mkdir -p {destinationPath} failed: {error.strip()}")
+
+                sftp = session.console.open_sftp()
+                try:
+                    offset = sftp.stat(part_path).st_size
+                except IOError:
+                    offset = 0
+                if offset > total:
+                    offset = 0
+                if offset:
+                    self.log.info(f"Resuming {part_path} at {offset}/{total} bytes")
+
+                with open(sourcePath, "rb") as local, sftp.open(part_path, "ab" if offset else "wb") as remote:
+                    remote.set_pipelined(True)
+                    local.seek(offset)
+                    for chunk in iter(lambda: local.read(chunkSize), b""):
+                        remote.write(chunk)
+                        offset += len(chunk)
+                        if progressCallback is not None:
+                            progressCallback(offset, total)
+                break
+            except Exception as e:
+                self.log.warn(f"Transfer attempt {attempt + 1}/{maxRetries} failed: {e}")
+                if attempt == maxRetries - 1:
+                    return f"Resumable copy failed: {e}"
+                time.sleep(min(2 ** attempt, 10))
+            finally:
+                if sftp is not None:
+                    try:
+                        sftp.close()
+                    except Exception:
+                        pass
+
+        # Verify the complete file before moving it into place, with the strongest checksum tool available
+        algorithm = next((name for name in ("sha256", "md5") if self.hasTool(session, f"{name}sum")), None)
+        if algorithm is None:
+            self.log.warn(f"No checksum tool on target, {remote_path} not verified")
+        else:
+            status, output, error = self._execCommand(session, f"{algorithm}sum {part_path}")
+            remoteChecksum = output.split()[0] if output.strip() else None
+            if status != 0 or remoteChecksum != self._fileChecksum(sourcePath, algorithm):
+                self._execCommand(session, f"rm -f {part_path}")
+                self.log.error(f"Checksum mismatch for {remote_path}: {output} {error}")
+                return f"Resumable copy failed: checksum mismatch for {remote_path}"
+
+        status, output, error = self._execCommand(session, f"mv -f {part_path} {remote_path}")
+        if status != 0:
+            return f"Resumable copy failed: {error}"
+
+        return f"Resumable: Copied {sourcePath} to {remote_path}"
+
     def scpCopy(self, session, sourcePath, destinationPath, isRemoteSource:bool=False):
         """
         Copies a file between the host machine and a remote device using SCP (Secure Copy Protocol) over SSH.
@@ -180,13 +290,12 @@ class utBaseUtils():
         if session.type != "ssh":
             self.log.fatal("Session type must be 'ssh'")
 
-        session.write("rsync")
-        result = session.read_until("rsync")
         message = ""
-        if "command not found" in result:
-            self.log.error("Target doesn't support rsync, using scp copy to copy the folder")
-            for files in os.listdir(sourcePath):
-                message += self.scpCopy(session, os.path.join(sourcePath, files), destinationPath)
+        if not self.hasTool(session, "rsync"):
+            self.log.error("Target doesn't support rsync, using delta sync to copy the folder")
+            message = self.deltaSync(session, sourcePath, destinationPath)
+            if not message.startswith("DELTA: Synced"):
+                self.log.error(message)
         else:
             username = session.username
             destination = "{}@{}:{}".format(username, session.address, destinationPath)
@@ -208,6 +317,447 @@ class utBaseUtils():
 
         return message
 
+    def probeCapabilities(self, session, refresh:bool=False):
+        """
+        Detects the tools and shell features available on the target device.
+
+        Everything is probed in a single round trip. The result is persisted in capabilityCacheFile
+        keyed by device, firmware build and kernel (uname), so later runs against the same build only
+        need to read the build identifier. Within the process it is reused for every connection to the
+        same address, port and user, so transfers on their own connections don't probe again; pass
+        refresh after reflashing the device.
+
+        Args:
+            session (session class): The active SSH session object.
+            refresh (bool, optional): Ignore the caches and probe again. Defaults to False.
+
+        Returns:
+            dict:
+                build (str): Firmware build identifier.
+                tools (list): Entries of CAPABILITY_TOOLS found on the path.
+                applets (list): Applets of busybox, if present.
+                features (dict): Shell features, "arithmetic" and "tarGzip" (tar supports -z).
+        """
+        device = f"{session.address}:{session.port}"
+        target = (session.address, session.port, session.username)
+        cached = _capabilityCache.get(target)
+        if not refresh and cached is not None:
+            return cached
+
+        buildCommand = "echo \"$(head -n 1 /version.txt 2>/dev/null || grep -m 1 BUILD_ID /etc/os-release 2>/dev/null) $(uname -rv)\""
+        persisted = {} if refresh else self._loadCapabilityCache()
+        if persisted:
+            status, output, error = self._execCommand(session, buildCommand)
+            capabilities = persisted.get(f"{device}|{output.strip()}")
+            if capabilities is not None:
+                _capabilityCache[target] = capabilities
+                return capabilities
+
+        script = [
+            f"echo \"build=$({buildCommand})\"",
+            "for t in " + " ".join(CAPABILITY_TOOLS) + "; do command -v $t >/dev/null 2>&1 && echo \"tool=$t\"; done",
+            "busybox --list 2>/dev/null | sed 's/^/applet=/'",
+            "[ \"$((1+1))\" = 2 ] 2>/dev/null && echo feature=arithmetic",
+            "tar -czf - /dev/null 2>/dev/null | tar -tzf - >/dev/null 2>&1 && echo feature=tarGzip",
+        ]
+        status, output, error = self._execCommand(session, "\n".join(script))
+
+        capabilities = {"build": "", "tools": [], "applets": [], "features": {"arithmetic": False, "tarGzip": False}}
+        for line in output.splitlines():
+            name, _, value = line.strip().partition("=")
+            if name == "build":
+                capabilities["build"] = value.strip()
+            elif name == "tool":
+                capabilities["tools"].append(value)
+            elif name == "applet":
+                capabilities["applets"].append(value)
+            elif name == "feature":
+                capabilities["features"][value] = True
+        self.log.debug(f"Capabilities of [{device}]: {capabilities}")
+
+        _capabilityCache[target] = capabilities
+        persisted = self._loadCapabilityCache()
+        persisted[f"{device}|{capabilities['build']}"] = capabilities
+        temporaryPath = None
+        try:
+            directory = os.path.dirname(self.capabilityCacheFile)
+            os.makedirs(directory, exist_ok=True)
+            descriptor, temporaryPath = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(descriptor, "w") as output:
+                json.dump(persisted, output, indent=2)
+            # Atomic replace, so concurrent runs never read a partial file
+            os.replace(temporaryPath, self.capabilityCacheFile)
+        except OSError as e:
+            self.log.debug(f"Unable to persist capabilities: {e}")
+            if temporaryPath is not None and os.path.exists(temporaryPath):
+                os.unlink(temporaryPath)
+        return capabilities
+
+    def hasTool(self, session, tool:str):
+        """
+        Checks whether a tool is available on the target device, using the cached capability probe.
+
+        Args:
+            session (session class): The active SSH session object.
+            tool (str): Name of the tool, e.g. "rsync".
+
+        Returns:
+            bool: True if the tool is on the target's path.
+        """
+        return tool in self.probeCapabilities(session)["tools"]
+
+    def _loadCapabilityCache(self):
+        try:
+            with open(self.capabilityCacheFile) as source:
+                return json.load(source)
+        except (OSError, ValueError):
+            return {}
+
+    def _extractCommand(self, session, destinationPath, compressed:bool):
+        """
+        Returns the device command that creates destinationPath and extracts a tar stream from stdin into it.
+        Gzip streams go through a separate gzip when the target's tar has no -z support.
+        """
+        if not compressed:
+            return f"mkdir -p {destinationPath} && tar -xf - -C {destinationPath}"
+        if self.probeCapabilities(session)["features"].get("tarGzip") or not self.hasTool(session, "gzip"):
+            return f"mkdir -p {destinationPath} && tar -xzf - -C {destinationPath}"
+        return f"mkdir -p {destinationPath} && gzip -dc | tar -xf - -C {destinationPath}"
+
+    def tarCopy(self, session, sourcePath, destinationPath, compress:bool=False):
+        """
+        Copies a file or directory tree from the host machine to the target device as a single tar stream.
+
+        The archive is generated on the fly and piped into `tar -x` on the device over one SSH exec channel,
+        so nothing is staged on either side and thousands of small files cost one handshake instead of one each.
+
+        Args:
+            session (session class): The active SSH session object containing the connection details.
+            sourcePath (str): File or directory on the host machine. A trailing '/' copies the directory contents only.
+            destinationPath (str): The target directory on the device.
+            compress (bool, optional): Gzip the stream on the fly, useful on slow links. Defaults to False.
+
+        Returns:
+            str: A message indicating the result of the transfer, including bytes sent and elapsed time.
+        """
+        if session.type != "ssh":
+            self.log.fatal("Session type must be 'ssh'")
+
+        if not os.path.exists(sourcePath):
+            return f"TAR: Source not found: {sourcePath}"
+
+        if not session.is_open:
+            session.open()
+
+        # Trailing '/' follows the rsync convention, copy the contents rather than the directory itself
+        if os.path.isdir(sourcePath) and sourcePath.endswith('/'):
+            members = [(os.path.join(sourcePath, name), name) for name in sorted(os.listdir(sourcePath))]
+        else:
+            members = [(sourcePath, os.path.basename(os.path.normpath(sourcePath)))]
+
+        start = time.time()
+        channel = self._openExecChannel(session, self._extractCommand(session, destinationPath, compress))
+        writer = _ChannelWriter(channel)
+        try:
+            with tarfile.open(fileobj=writer, mode="w|gz" if compress else "w|") as archive:
+                for path, name in members:
+                    archive.add(path, arcname=name)
+            channel.shutdown_write()
+            status, error = self._closeExecChannel(channel)
+        except Exception as e:
+            channel.close()
+            return f"TAR copy failed: {e}"
+        elapsed = time.time() - start
+
+        if status != 0:
+            self.log.error(f"tar exited with status {status}: {error}")
+            return f"TAR copy failed: [{status}] {error}"
+
+        rate = writer.bytesSent / elapsed if elapsed > 0 else 0
+        self.log.info(f"TAR: Sent {writer.bytesSent} bytes in {elapsed:.2f}s ({rate / 1024:.1f} KiB/s)")
+        return f"TAR: Copied {sourcePath} to {destinationPath} ({writer.bytesSent} bytes in {elapsed:.2f}s)"
+
+    def deltaSync(self, session, sourcePath, destinationPath, blockSize:int=65536, maxDeltaRatio:float=0.5):
+        """
+        Synchronizes a file or directory tree to the target device sending only the blocks that changed.
+
+        Intended for targets without rsync. Block checksums of the files already on the device are computed
+        in one round trip using `dd`, `split` and `md5sum`, and compared with the host copy. Changed blocks are then
+        sent in a single tar stream together with any new files, and a generated patch script writes them
+        into place with `dd conv=notrunc`. Patched files are verified against the host checksum.
+
+        A file is sent in full when it does not exist on the device, when the device lacks md5sum, or when
+        more than maxDeltaRatio of its blocks changed.
+
+        Args:
+            session (session class): The active SSH session object containing the connection details.
+            sourcePath (str): File or directory on the host machine. A trailing '/' syncs the directory contents only.
+            destinationPath (str): The target directory on the device.
+            blockSize (int, optional): Size of the compared blocks in bytes. Defaults to 65536.
+            maxDeltaRatio (float, optional): Fraction of changed blocks above which the whole file is sent. Defaults to 0.5.
+
+        Returns:
+            str: A message summarising the synchronization.
+        """
+        if session.type != "ssh":
+            self.log.fatal("Session type must be 'ssh'")
+
+        if not os.path.exists(sourcePath):
+            return f"DELTA: Source not found: {sourcePath}"
+
+        if not session.is_open:
+            session.open()
+
+        start = time.time()
+        files = self._listSourceFiles(sourcePath)
+        remoteBlocks = {}
+        if self.hasTool(session, "md5sum"):
+            remoteBlocks = self._remoteBlockChecksums(session, destinationPath, [rel for _, rel in files], blockSize)
+
+        fullFiles = []
+        patches = []
+        unchanged = 0
+        for path, rel in files:
+            localBlocks = self._localBlockChecksums(path, blockSize)
+            remote = remoteBlocks.get(rel)
+            if not remote:
+                fullFiles.append((path, rel))
+                continue
+            changed = [i for i, digest in enumerate(localBlocks) if i >= len(remote) or remote[i] != digest]
+            if not changed and len(remote) == len(localBlocks):
+                unchanged += 1
+            elif len(changed) > maxDeltaRatio * max(len(localBlocks), 1):
+                fullFiles.append((path, rel))
+            else:
+                patches.append((path, rel, changed))
+
+        # Build a single tar stream holding the new files and the changed blocks of each patched file
+        script = []
+        blobs = []
+        for index, (path, rel, changed) in enumerate(patches):
+            blobName = f".ut_delta/{index}.blk"
+            blob = io.BytesIO()
+            with open(path, "rb") as source:
+                for run_start, run_length in self._blockRuns(changed):
+                    script.append(f"dd if={blobName} of={shlex.quote(rel)} bs={blockSize} skip={blob.tell() // blockSize} "
+                                  f"seek={run_start} count={run_length} conv=notrunc 2>/dev/null || exit 1")
+                    source.seek(run_start * blockSize)
+                    blob.write(source.read(run_length * blockSize))
+            # Truncate to the host size, in case the file shrank
+            script.append(f"dd if=/dev/null of={shlex.quote(rel)} bs=1 seek={os.path.getsize(path)} count=0 2>/dev/null")
+            script.append(f"md5sum {shlex.quote(rel)}")
+            blobs.append((blobName, blob.getvalue()))
+
+        bytesSent = 0
+        try:
+            if fullFiles or blobs:
+                command = f"mkdir -p {destinationPath} && tar -xf - -C {destinationPath}"
+                channel = self._openExecChannel(session, command)
+                writer = _ChannelWriter(channel)
+                try:
+                    with tarfile.open(fileobj=writer, mode="w|") as archive:
+                        for path, rel in fullFiles:
+                            archive.add(path, arcname=rel)
+                        for blobName, data in blobs:
+                            info = tarfile.TarInfo(blobName)
+                            info.size = len(data)
+                            archive.addfile(info, io.BytesIO(data))
+                    channel.shutdown_write()
+                    status, error = self._closeExecChannel(channel)
+                except Exception as e:
+                    channel.close()
+                    return f"DELTA sync failed: {e}"
+                if status != 0:
+                    self.log.error(f"tar exited with status {status}: {error}")
+                    return f"DELTA sync failed: [{status}] {error}"
+                bytesSent = writer.bytesSent
+
+            if patches:
+                # The script grows with the number of changed blocks, so it goes over stdin rather than in
+                # the exec request, which is limited by the server's maximum packet size
+                script.insert(0, f"cd {destinationPath} || exit 1")
+                status, output, error = self._execCommand(session, "sh -s", stdin="\n".join(script).encode() + b"\n")
+                checksums = {}
+                for line in output.splitlines():
+                    parts = line.split(None, 1)
+                    if len(parts) == 2:
+                        checksums[parts[1].strip()] = parts[0]
+                for path, rel, _ in patches:
+                    if checksums.get(rel) != self._fileChecksum(path):
+                        self.log.error(f"Delta patch verification failed for [{rel}], copying in full")
+                        self.tarCopy(session, path, os.path.join(destinationPath, os.path.dirname(rel)))
+        finally:
+            if blobs:
+                # Remove the staged blocks whether or not the upload and patching succeeded
+                try:
+                    self._execCommand(session, f"rm -rf {destinationPath}/.ut_delta")
+                except Exception as e:
+                    self.log.warn(f"Unable to remove {destinationPath}/.ut_delta: {e}")
+
+        elapsed = time.time() - start
+        self.log.info(f"DELTA: {unchanged} unchanged, {len(patches)} patched, {len(fullFiles)} copied in full, "
+                      f"{bytesSent} bytes in {elapsed:.2f}s")
+        return (f"DELTA: Synced {sourcePath} to {destinationPath} ({unchanged} unchanged, {len(patches)} patched, "
+                f"{len(fullFiles)} copied in full, {bytesSent} bytes in {elapsed:.2f}s)")
+
+    def _listSourceFiles(self, sourcePath):
+        """
+        Lists the host files to synchronize, with the path each one takes relative to the destination.
+
+        Args:
+            sourcePath (str): File or directory on the host machine. A trailing '/' lists the directory contents only.
+
+        Returns:
+            list: (host path, relative destination path) tuples.
+        """
+        if os.path.isfile(sourcePath):
+            return [(sourcePath, os.path.basename(sourcePath))]
+
+        root = sourcePath if sourcePath.endswith('/') else os.path.dirname(os.path.normpath(sourcePath))
+        files = []
+        for directory, _, names in os.walk(sourcePath):
+            for name in sorted(names):
+                path = os.path.join(directory, name)
+                files.append((path, os.path.relpath(path, root)))
+        return files
+
+    def _localBlockChecksums(self, path, blockSize):
+        """
+        Computes the md5 checksum of every block of a host file.
+        """
+        digests = []
+        with open(path, "rb") as source:
+            for block in iter(lambda: source.read(blockSize), b""):
+                digests.append(hashlib.md5(block).hexdigest())
+        return digests
+
+    def _remoteBlockChecksums(self, session, destinationPath, files, blockSize, batchBlocks:int=256):
+        """
+        Computes the md5 checksum of every block of the given device files in a single round trip.
+
+        Rather than one `dd | md5sum` pair per block, each batch of blocks is read with a single `dd`,
+        cut into block sized pieces by `split` in a scratch directory and hashed with one `md5sum`, so
+        a file costs a handful of processes per batchBlocks blocks and the scratch space stays bounded.
+        Targets without `split` return no checksums, so their files are copied in full.
+
+        Args:
+            session (session class): The active SSH session object.
+            destinationPath (str): Directory on the device the file paths are relative to.
+            files (list): Relative file paths.
+            blockSize (int): Block size in bytes.
+            batchBlocks (int, optional): Blocks hashed per batch. Defaults to 256.
+
+        Returns:
+            dict: Relative path -> list of block checksums, for the files present on the device.
+        """
+        script = [
+            f"cd {destinationPath} 2>/dev/null || exit 0",
+            "t=$(mktemp -d) || exit 0",
+            "trap 'rm -rf \"$t\"' EXIT",
+            f"bs={blockSize}; batch={batchBlocks}",
+            "for f in " + " ".join(shlex.quote(rel) for rel in files) + "; do",
+            "  [ -f \"$f\" ] || continue",
+            "  echo \"F $f\"",
+            "  n=$(( ($(wc -c < \"$f\") + bs - 1) / bs )); i=0",
+            "  [ $n -eq 1 ] && { md5sum \"$f\"; continue; }",
+            "  while [ $i -lt $n ]; do",
+            "    dd if=\"$f\" bs=$bs skip=$i count=$batch 2>/dev/null | split -b $bs -a 3 - \"$t/b.\"",
+            "    md5sum \"$t\"/b.*; rm -f \"$t\"/b.*",
+            "    i=$((i+batch))",
+            "  done",
+            "done",
+        ]
+        # The file list can be long, send the script over stdin rather than in the exec request
+        status, output, error = self._execCommand(session, "sh -s", stdin="\n".join(script).encode() + b"\n")
+
+        checksums = {}
+        current = None
+        for line in output.splitlines():
+            if line.startswith("F "):
+                current = checksums.setdefault(line[2:], [])
+            elif current is not None and line.strip():
+                current.append(line.split()[0])
+        return checksums
+
+    def _blockRuns(self, indices):
+        """
+        Groups a sorted list of block indices into (start, length) runs of consecutive blocks.
+        """
+        runs = []
+        for index in indices:
+            if runs and runs[-1][0] + runs[-1][1] == index:
+                runs[-1][1] += 1
+            else:
+                runs.append([index, 1])
+        return runs
+
+    def _fileChecksum(self, path, algorithm:str="md5"):
+        """
+        Computes the checksum of a whole host file, md5 by default.
+        """
+        digest = hashlib.new(algorithm)
+        with open(path, "rb") as source:
+            for block in iter(lambda: source.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _openExecChannel(self, session, command:str):
+        """
+        Opens a dedicated exec channel on the session's SSH transport and starts a command on it.
+
+        The interactive shell used by session.write() is left untouched, so the command's stdin, stdout
+        and exit status are not mixed with any other console traffic.
+
+        Args:
+            session (session class): The active SSH session object (session.console is the Paramiko client).
+            command (str): The command to execute on the device.
+
+        Returns:
+            paramiko.Channel: The channel the command is running on.
+        """
+        channel = session.console.get_transport().open_session()
+        channel.exec_command(command)
+        return channel
+
+    def _closeExecChannel(self, channel):
+        """
+        Waits for the command on an exec channel to finish and closes it.
+
+        Args:
+            channel (paramiko.Channel): Channel returned by _openExecChannel().
+
+        Returns:
+            tuple: (exit status (int), stderr output (str))
+        """
+        status = channel.recv_exit_status()
+        error = b""
+        while channel.recv_stderr_ready():
+            error += channel.recv_stderr(4096)
+        channel.close()
+        return status, error.decode('utf-8', errors='replace').strip()
+
+    def _execCommand(self, session, command:str, stdin:bytes=None):
+        """
+        Runs a command on a dedicated exec channel and collects its output.
+
+        Args:
+            session (session class): The active SSH session object.
+            command (str): The command (or multi-line script) to execute on the device.
+            stdin (bytes, optional): Data written to the command's standard input. Defaults to None.
+
+        Returns:
+            tuple: (exit status (int), stdout (str), stderr (str))
+        """
+        channel = self._openExecChannel(session, command)
+        if stdin is not None:
+            channel.sendall(stdin)
+        channel.shutdown_write()
+        output = b""
+        for data in iter(lambda: channel.recv(65536), b""):
+            output += data
+        status, error = self._closeExecChannel(channel)
+        return status, output.decode('utf-8', errors='replace'), error
+
     def untar(self, session, tar_gz_path, extract_path):
         """
         Untar a .tar.gz file on the remote device via the SSH session.
@@ -246,6 +796,183 @@ class utBaseUtils():
             self.log.info(f"Successfully untarred {tar_file_name} on remote to {extract_path}")
             return True
 
+    def pushAndExtract(self, session, local_tar, extract_path):
+        """
+        Streams a tar archive from the host machine straight into `tar -x` on the remote device.
+
+        Unlike copying the archive and calling untar(), nothing is staged on the device, so the bundle
+        is only written to flash once, and the result comes from tar's real exit status.
+
+        Args:
+            session (session class): The active SSH session object.
+            local_tar (str): Path of the .tar.gz (or .tgz / .tar) file on the host machine.
+            extract_path (str): Directory on the remote device to extract the files.
+
+        Returns:
+            bool: True if successful, False otherwise.
+        """
+        if session.type != "ssh":
+            self.log.fatal("Session type must be 'ssh'")
+            return False
+
+        if not os.path.isfile(local_tar):
+            self.log.error(f"Archive not found: {local_tar}")
+            return False
+
+        if not session.is_open:
+            session.open()
+
+        channel = self._openExecChannel(session, self._extractCommand(session, extract_path, not local_tar.endswith(".tar")))
+        try:
+            with open(local_tar, "rb") as archive:
+                for chunk in iter(lambda: archive.read(65536), b""):
+                    channel.sendall(chunk)
+            channel.shutdown_write()
+            status, error = self._closeExecChannel(channel)
+        except Exception as e:
+            channel.close()
+            self.log.error(f"Failed to stream {local_tar} to remote: {e}")
+            return False
+
+        if status != 0:
+            self.log.error(f"Failed to extract on remote, tar exited with status {status}: {error}")
+            return False
+
+        self.log.info(f"Successfully extracted {local_tar} on remote to {extract_path}")
+        return True
+
+    def consoleCopy(self, session, sourcePath, destinationPath, window:int=4, chunkSize:int=512, maxChunkSize:int=3072, windowTime:float=1.0, maxRetries:int=5):
+        """
+        Copies a file from the host machine to the target device through the console, for serial-only targets.
+
+        The file is encoded as base64 (or uuencode when base64 is missing) and appended to a temporary
+        file on the device with `printf`, one chunk of lines per command. After every window of chunks the
+        device is asked to echo an acknowledgement, and nothing more is sent until it arrives, so the console
+        buffer is never overrun. If an acknowledgement is lost the size of the temporary file tells whether
+        the window landed, and it is trimmed and resent if needed, at most maxRetries times in a row. The chunk
+        size follows the measured throughput, aiming for windows of about windowTime seconds. The decoded file is verified with md5sum.
+
+        Args:
+            session (session class): The console session object (serial, InteractiveShell, ...).
+            sourcePath (str): The full path of the file on the host machine.
+            destinationPath (str): The target directory on the device.
+            window (int, optional): Number of chunks sent per acknowledgement. Defaults to 4.
+            chunkSize (int, optional): Initial number of encoded characters per chunk. Defaults to 512.
+            maxChunkSize (int, optional): Upper limit for the chunk size, keep below the tty line limit. Defaults to 3072.
+            windowTime (float, optional): Target duration of a window in seconds. Defaults to 1.0.
+            maxRetries (int, optional): Number of times a window is resent before giving up. Defaults to 5.
+
+        Returns:
+            str: A message indicating the result of the file transfer.
+        """
+        if not os.path.isfile(sourcePath):
+            return f"Console copy failed: Source file not found: {sourcePath}"
+
+        if not destinationPath.endswith('/'):
+            destinationPath += '/'
+        filename = os.path.basename(sourcePath)
+        remote_path = destinationPath + filename
+        encoded_path = remote_path + ".enc"
+
+        tools = self._consoleCommand(session, "command -v base64 uudecode md5sum") or ""
+        with open(sourcePath, "rb") as source:
+            data = source.read()
+        if "base64" in tools:
+            lines = [chunk.decode() for chunk in self._splitBytes(base64.b64encode(data), 76)]
+            decode_cmd = f"base64 -d {encoded_path} > {remote_path}"
+        elif "uudecode" in tools:
+            lines = [f"begin 644 {filename}"]
+            lines += [binascii.b2a_uu(chunk).decode().rstrip("\n") for chunk in self._splitBytes(data, 45)]
+            lines += ["`", "end"]
+            decode_cmd = f"uudecode -o {remote_path} {encoded_path}"
+        else:
+            return "Console copy failed: target has neither base64 nor uudecode"
+
+        # Stop the console echoing every line back, which would halve the throughput
+        self._consoleCommand(session, f"stty -echo 2>/dev/null; mkdir -p {destinationPath} && rm -f {encoded_path}")
+
+        start = time.time()
+        sent = 0
+        index = 0
+        retries = 0
+        try:
+            while index < len(lines):
+                windowStart = time.time()
+                commands = []
+                position = index
+                for _ in range(window):
+                    chunk = []
+                    length = 0
+                    while position < len(lines) and (not chunk or length + len(lines[position]) <= chunkSize):
+                        chunk.append(lines[position])
+                        length += len(lines[position]) + 1
+                        position += 1
+                    if chunk:
+                        commands.append(("printf '%s\\n' " + " ".join("'" + line.replace("'", "'\\''") + "'" for line in chunk), length))
+                expected = sent + sum(length for _, length in commands)
+
+                for command, _ in commands:
+                    session.write(f"{command} >> {encoded_path}")
+                if self._consoleCommand(session, ":") is None:
+                    # Acknowledgement lost, check what actually landed before carrying on
+                    size = self._consoleCommand(session, f"wc -c < {encoded_path}")
+                    size = int(size.split()[-1]) if size and size.split() and size.split()[-1].isdigit() else -1
+                    if size != expected:
+                        retries += 1
+                        if retries > maxRetries:
+                            self.log.error(f"Console window lost at {sent} bytes {retries} times, giving up")
+                            self._consoleCommand(session, f"rm -f {encoded_path}")
+                            return f"Console copy failed: no acknowledgement after {maxRetries} retries at {sent} bytes"
+                        self.log.warn(f"Console window lost at {sent} bytes, resending with a smaller chunk size")
+                        self._consoleCommand(session, f"dd if=/dev/null of={encoded_path} bs=1 seek={sent} count=0 2>/dev/null")
+                        chunkSize = max(chunkSize // 2, 128)
+                        continue
+
+                sent = expected
+                index = position
+                retries = 0
+                # Size the next chunks from the measured throughput
+                rate = sum(length for _, length in commands) / max(time.time() - windowStart, 0.001)
+                chunkSize = int(min(max(rate * windowTime / window, 128), maxChunkSize))
+        finally:
+            # Leave the console usable whatever happened
+            self._consoleCommand(session, "stty echo 2>/dev/null")
+
+        output = self._consoleCommand(session, f"{decode_cmd} && rm -f {encoded_path} && md5sum {remote_path}") or ""
+        if self._fileChecksum(sourcePath) not in output:
+            self.log.error(f"Console copy verification failed for {remote_path}: {output}")
+            return f"Console copy failed: checksum mismatch for {remote_path}"
+
+        elapsed = time.time() - start
+        self.log.info(f"Console: Sent {sent} encoded bytes in {elapsed:.2f}s")
+        return f"Console: Copied {sourcePath} to {remote_path}"
+
+    def _consoleCommand(self, session, command:str):
+        """
+        Runs a command through the console and waits for it to finish.
+
+        The command is followed by an echo of a unique marker. The marker is split with empty quotes
+        in the command text, so the terminal echo of the command line cannot match it.
+
+        Args:
+            session (session class): The console session object.
+            command (str): The command to execute on the device.
+
+        Returns:
+            str: The output of the command, or None if the marker did not arrive.
+        """
+        self.consoleSequence += 1
+        marker = f"UT_DONE{self.consoleSequence}"
+        session.write(f'{command}; echo UT_""DONE{self.consoleSequence}')
+        output = session.read_until(marker)
+        if marker not in output:
+            return None
+        output = output[:output.rindex(marker)]
+        return "\n".join(line for line in output.splitlines() if 'UT_""DONE' not in line)
+
+    def _splitBytes(self, data, size):
+        return [data[offset:offset + size] for offset in range(0, len(data), size)]
+
     def change_directory(self, session, directory_path):
         """
         Changes the working directory on the remote device via SSH and verifies the change.
@@ -276,7 +1003,7 @@ class utBaseUtils():
             self.log.error(f"Failed to change directory. Output:\n{output}")
             return False
 
-    def restart_process_by_name(self, session, process_name, binary_dir="/usr/bin"):
+    def restart_process_by_name(self, session, process_name, binary_dir="/usr/bin", timeout:float=10):
         """
         Kills and restarts a process on the remote device via SSH.
 
@@ -284,6 +1011,7 @@ class utBaseUtils():
             session (session class): Active SSH session object.
             process_name (str): The name of the running process (and binary).
             binary_dir (str): Directory where the binary resides (default: /usr/bin)
+            timeout (float): Seconds to wait for the process to come back (default: 10)
 
         Returns:
             bool: True if successfully restarted, False otherwise.
@@ -291,35 +1019,133 @@ class utBaseUtils():
         if session.type != "ssh":
             return False
 
-        binary_path = os.path.join(binary_dir, process_name)
+        result = self.restart_processes(session, [{"name": process_name, "binary_dir": binary_dir}], timeout=timeout)
+        return result[process_name]["ready"]
 
-        # Kill the process
-        kill_cmd = f"pkill -f {binary_path}"
-        session.write(kill_cmd)
-        self.log.info(f"Killing process: {binary_path}")
-        output = session.read_until(session.prompt, timeout=5)
-        self.log.info(output)
+    def restart_processes(self, session, services:list, timeout:float=30, interval:float=0.25):
+        """
+        Restarts a set of processes on the remote device and waits until each one is ready.
 
-        # Start the process
-        start_cmd = f"{binary_path} &"
-        session.write(start_cmd)
-        self.log.info(f"Restarting process: {start_cmd}")
-        output = session.read_until(session.prompt, timeout=5)
-        self.log.info(output)
+        All processes are stopped in one command and started in one console write, so they keep the
+        environment of the interactive session. Readiness is then polled for every service in a single
+        round trip per interval until all are ready or the deadline passes.
+
+        A service is ready once a new PID is running. Optionally it must also be listening on a TCP
+        port and/or have written a line to its log file since the restart.
+
+        Args:
+            session (session class): Active SSH session object.
+            services (list): Process names, or dicts with the keys:
+                name (str): Process name (and binary name).
+                binary_dir (str, optional): Directory where the binary resides (default: /usr/bin).
+                command (str, optional): Start command, defaults to the binary path.
+                port (int, optional): TCP port the service listens on when ready.
+                logFile (str, optional): Log file to watch, used with logLine.
+                logLine (str, optional): Text the service logs when ready.
+            timeout (float): Seconds to wait for all services to become ready (default: 30)
+            interval (float): Seconds between readiness polls (default: 0.25)
 
-        # Verify it's running
-        verify_cmd = f"ps -ef | grep -i {process_name} | grep -v grep"
-        session.write(verify_cmd)
+        Returns:
+            dict: Process name -> {"pid": int or None, "ready": bool, "time": seconds to ready or None}
+        """
+        if session.type != "ssh":
+            self.log.fatal("Session type must be 'ssh'")
+
+        specs = []
+        for service in services:
+            spec = {"name": service} if isinstance(service, str) else dict(service)
+            spec["path"] = os.path.join(spec.get("binary_dir", "/usr/bin"), spec["name"])
+            specs.append(spec)
+
+        # Stop everything in one round trip, remembering the old PIDs and the current log sizes
+        script = []
+        for spec in specs:
+            name = shlex.quote(spec["name"])
+            script.append(f"echo \"pid {spec['name']} $(pidof {name})\"")
+            if spec.get("logFile"):
+                script.append(f"echo \"log {spec['name']} $(wc -c < {shlex.quote(spec['logFile'])} 2>/dev/null || echo 0)\"")
+            # Bracket the first character so the pattern does not match this script's own command line
+            pattern = f"[{spec['path'][0]}]{spec['path'][1:]}"
+            script.append(f"pkill -f {shlex.quote(pattern)}")
+        status, output, error = self._execCommand(session, "\n".join(script))
+        oldPids = {}
+        logOffsets = {}
+        for line in output.splitlines():
+            parts = line.split()
+            if len(parts) >= 2 and parts[0] == "pid":
+                oldPids[parts[1]] = set(parts[2:])
+            elif len(parts) == 3 and parts[0] == "log" and parts[2].isdigit():
+                logOffsets[parts[1]] = int(parts[2])
+        self.log.info(f"Stopped: {', '.join(spec['name'] for spec in specs)}")
+
+        # Start everything in a single write on the console, so the services inherit its environment
+        start_cmd = " ".join(f"{spec.get('command', spec['path'])} &" for spec in specs)
+        session.write(start_cmd)
+        self.log.info(f"Restarting processes: {start_cmd}")
+        start = time.time()
         output = session.read_until(session.prompt, timeout=5)
-        self.log.info(output)
+        self.log.debug(output)
+
+        results = {spec["name"]: {"pid": None, "ready": False, "time": None} for spec in specs}
+        pending = list(specs)
+        while pending:
+            script = []
+            for spec in pending:
+                name = spec["name"]
+                script.append(f"echo \"pid {name} $(pidof {shlex.quote(name)})\"")
+                if spec.get("port"):
+                    script.append(f"(netstat -ltn 2>/dev/null || ss -ltn 2>/dev/null) | grep -q ':{spec['port']} ' && echo \"port {name}\"")
+                if spec.get("logFile") and spec.get("logLine"):
+                    offset = logOffsets.get(name, 0) + 1
+                    script.append(f"tail -c +{offset} {shlex.quote(spec['logFile'])} 2>/dev/null | grep -qF {shlex.quote(spec['logLine'])} && echo \"log {name}\"")
+            status, output, error = self._execCommand(session, "\n".join(script))
+
+            pids = {}
+            checks = set()
+            for line in output.splitlines():
+                parts = line.split()
+                if len(parts) >= 2 and parts[0] == "pid":
+                    pids[parts[1]] = [pid for pid in parts[2:] if pid not in oldPids.get(parts[1], set())]
+                elif len(parts) == 2:
+                    checks.add((parts[0], parts[1]))
+
+            for spec in list(pending):
+                name = spec["name"]
+                ready = bool(pids.get(name))
+                if spec.get("port"):
+                    ready = ready and ("port", name) in checks
+                if spec.get("logFile") and spec.get("logLine"):
+                    ready = ready and ("log", name) in checks
+                if ready:
+                    results[name] = {"pid": int(pids[name][0]), "ready": True, "time": time.time() - start}
+                    self.log.info(f"{name} restarted successfully, pid [{pids[name][0]}] after {results[name]['time']:.2f}s")
+                    pending.remove(spec)
+
+            if pending:
+                if time.time() - start > timeout:
+                    break
+                time.sleep(interval)
+
+        for spec in pending:
+            self.log.error(f"Failed to restart {spec['name']} within {timeout}s.")
+        return results
+
+
+class _ChannelWriter():
+    """
+    Minimal write-only file object over an exec channel, counting the bytes sent.
+    """
+    def __init__(self, channel):
+        self.channel = channel
+        self.bytesSent = 0
 
-        if process_name in output:
-            self.log.info(f"{process_name} restarted successfully.")
-            return True
-        else:
-            self.log.error(f"Failed to restart {process_name}.")
-            return False
+    def write(self, data):
+        self.channel.sendall(data)
+        self.bytesSent += len(data)
+        return len(data)
 
+    def flush(self):
+        pass
 
 # Test and example usage code
 if __name__ == '__main__':
@@ -339,4 +1165,14 @@ if __name__ == '__main__':
 
     print(output)
 
+    # Push a file through the console, as on serial-only targets
+    output = test.consoleCopy(shell, "./file.dat", "/tmp")
+
+    print(output)
+
+    # Stream the bin folder as a compressed tar without relying on rsync
+    output = test.tarCopy(shell, "./bin/", "/tmp", compress=True)
+
+    print(output)
+
     shell.close()
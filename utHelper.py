@@ -32,8 +32,10 @@ sys.path.append(dir_path+"/../../../")
 from framework.core.testControl import testController
 from framework.core.outboundClient import outboundClientClass
 from framework.core.logModule import logModule
+from framework.core.commandModules.sshConsole import sshConsole
 from framework.plugins.ut_raft.interactiveShell import InteractiveShell
 from framework.plugins.ut_raft.utBaseUtils import utBaseUtils
+from framework.plugins.ut_raft.utTransferManager import utTransferManager
 
 class utHelperClass(testController):
     """
@@ -50,6 +52,7 @@ class utHelperClass(testController):
             self.log.setLevel( self.log.INFO )
 
         self.baseUtils = utBaseUtils()
+        self.transferManager = None
 
     def waitForBoot(self):
         """
@@ -114,6 +117,9 @@ class utHelperClass(testController):
             bool: True if cleanup succeeds, False otherwise.
         """
         super().testEndFunction(False)
+        if self.transferManager is not None:
+            self.transferManager.shutdown(wait=True)
+            self.transferManager = None
         if self.log:
             output_dir = os.path.dirname(self.log.logFile.baseFilename)
             output_file = os.path.join(output_dir, "step_summery.csv")
@@ -191,6 +197,7 @@ class utHelperClass(testController):
     def copyFileFromHost(self, sourcePath, destinationPath, targetDevice="dut", use_sftp=False):
         """
         Copies a file from the host machine to the target device using SCP or SFTP.
+        Sessions other than SSH (e.g. serial) fall back to a chunked transfer through the console.
 
         Args:
             sourcePath (str): The source path and filename on the host.
@@ -200,9 +207,6 @@ class utHelperClass(testController):
 
         Returns:
             str: The message from the copy operation.
-
-        Raises:
-            ValueError: If the session type is not "ssh".
         """
         #TODO: Upgrade to support this via the outbound client
         activeDevice = self.devices.getDevice(targetDevice)
@@ -215,9 +219,8 @@ class utHelperClass(testController):
             else:
                 message = self.baseUtils.scpCopy(activeDevice.session, sourcePath, destinationPath)
         else:
-            # self.writeMessageToDeviceSession("cp " + source + " " + destination)  # Commented out code, potentially for serial copy
-            self.log.error("Can't copy for this session type")
-            raise ValueError("Copying files is not supported for this connection type.")
+            self.log.stepMessage("copyFile(" + sourcePath + ", (" + destinationPath + ") via console")
+            message = self.baseUtils.consoleCopy(activeDevice.session, sourcePath, destinationPath)
 
         return message
 
@@ -422,6 +425,56 @@ class utHelperClass(testController):
             else:
                 self.log.error("outboundClient not present")
 
+    def prefetchToDevice(self, sourcePath, destinationPath, targetDevice="dut", priority:int=0):
+        """
+        Starts copying a file from the host machine to the target device in the background.
+
+        The copy runs via the transfer manager on its own SSH connection to the device, opened for the
+        transfer, so it never reconnects or writes through the console session the test carries on using.
+
+        Args:
+            sourcePath (str): The source path and filename on the host.
+            destinationPath (str): The destination directory on the device.
+            targetDevice (str, optional): The device to copy the file to (default: "dut").
+            priority (int, optional): Lower values are transferred first (default: 0).
+
+        Returns:
+            Future: Resolves to the message from the copy operation.
+
+        Raises:
+            ValueError: If the session type is not "ssh".
+        """
+        activeDevice = self.devices.getDevice(targetDevice)
+
+        if activeDevice.session.type != "ssh":
+            self.log.error("Can't prefetch for this session type")
+            raise ValueError("Background copying is not supported for this connection type.")
+
+        if self.transferManager is None:
+            self.transferManager = utTransferManager(log=self.log)
+
+        self.log.stepMessage("prefetchToDevice(" + sourcePath + ", (" + destinationPath + ")")
+        return self.transferManager.submit(self._prefetchCopy, activeDevice.session, sourcePath, destinationPath,
+                                           device=targetDevice, priority=priority)
+
+    def _prefetchCopy(self, session, sourcePath, destinationPath):
+        """
+        Runs resumableCopy() on a dedicated SSH connection to the device of session.
+        """
+        transferSession = sshConsole(self.log, session.address, session.username, session.password,
+                                     key=getattr(session, "key", None), known_hosts=getattr(session, "known_hosts", None),
+                                     port=session.port)
+        try:
+            transferSession.open()
+            return self.baseUtils.resumableCopy(transferSession, sourcePath, destinationPath)
+        except Exception as e:
+            return f"Resumable copy failed: {e}"
+        finally:
+            try:
+                transferSession.close()
+            except Exception:
+                pass
+
     def deleteFromDevice(self, files: list, device: str = "dut", logOutput: bool = True):
         """
         Deletes the file(s) from the device.
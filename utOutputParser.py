@@ -0,0 +1,435 @@
+#!/usr/bin/env python3
+#** *****************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2024 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+
+import re
+import json
+import time
+import xml.etree.ElementTree as ElementTree
+
+# CUnit console / basic run output
+_CUNIT_SUITE = re.compile(r"^\s*(?:Running Suite\s*:|Suite:)\s*(.+?)\s*$")
+_CUNIT_TEST = re.compile(r"^\s*(?:Running Test\s*:|Test:)\s*(.+?)\s*(?:\.\.\.\s*(passed|FAILED))?\s*$")
+_CUNIT_FAILURES = re.compile(r"^\s*Suite\s+(.+?),\s*Test\s+(.+?)\s+had failures:\s*$")
+_CUNIT_ASSERT = re.compile(r"^\s*\d+\.\s+(\S+?):(\d+)\s+-\s+(.*?)\s*$")
+
+# GTest run output
+_GTEST_RUN = re.compile(r"^\[\s+RUN\s+\]\s+(\S+)")
+_GTEST_END = re.compile(r"^\[\s+(OK|FAILED|SKIPPED)\s+\]\s+(\S+?\.\S+)(?:,.*?)?(?:\s+\((\d+)\s*ms\))?\s*$")
+_GTEST_ASSERT = re.compile(r"^(\S+?):(\d+):\s+Failure\s*$")
+_GTEST_TOTAL = re.compile(r"^\[\s+(PASSED|FAILED)\s+\]\s+(\d+)\s+tests?")
+
+# Run Summary table rows, e.g. "tests   3   3   2   1   0"
+_SUMMARY_ROW = re.compile(r"^\s*(suites|tests|asserts)\s+(\d+)\s+(.*?)\s*$", re.IGNORECASE)
+_ELAPSED = re.compile(r"^\s*Elapsed time\s*=\s*([\d.]+)")
+
+class utOutputParser():
+    """
+    Incremental parser for CUnit and GTest run output.
+
+    Output is fed in chunks as it arrives (see feed()); complete lines are parsed once and then
+    discarded, so the full output never needs to be kept. Events are reported to callbacks:
+
+    * "suite_start":    {"suite"}
+    * "test_start":     {"suite", "test"}
+    * "assert_failure": {"suite", "test", "file", "line", "message"}
+    * "test_end":       {"suite", "test", "status" ("passed"/"failed"/"skipped"), "duration" (seconds or None)}
+    * "summary":        {"suites", "tests", "asserts": columns of the Run Summary rows, "elapsed"}
+
+    In fail-fast mode the parser sets `aborted` on the first failure, so a reader can stop waiting
+    for the rest of the run.
+
+    The same pass builds one record per test (see records), which can be exported as JUnit XML or
+    JSON lines. Durations come from the output when it reports them (GTest), otherwise they are the
+    time between the test's start and end lines arriving, which is only meaningful when streaming.
+    """
+    def __init__(self, gtest:bool = False, failFast:bool = False):
+        """
+        Initializes the parser.
+
+        Args:
+            gtest (bool, optional): Parse GTest-style output and summaries. Defaults to False (CUnit).
+            failFast (bool, optional): Set `aborted` at the first failed assert or test. Defaults to False.
+        """
+        self.gtest = gtest
+        self.failFast = failFast
+        self.aborted = False
+        self.failures = 0
+        self.summary = {}
+        self.suite = None
+        self.test = None
+        self._testFailures = 0
+        self._listing = False
+        self._lastTest = (None, None)
+        self._pending = ""
+        self._callbacks = {}
+        self.records = []
+        self._recordIndex = {}
+
+    def on(self, event:str, callback):
+        """
+        Registers a callback for an event, called as callback(event, data).
+
+        Args:
+            event (str): Event name, or "*" for all events.
+            callback (callable): The function to call.
+        """
+        self._callbacks.setdefault(event, []).append(callback)
+
+    def feed(self, data:str):
+        """
+        Parses a chunk of output. Partial lines are kept until the rest arrives.
+
+        Args:
+            data (str): Output received from the session.
+        """
+        if not data:
+            return
+        lines = (self._pending + data).split("\n")
+        self._pending = lines.pop()
+        for line in lines:
+            self.parse_line(line)
+
+    def close(self):
+        """
+        Parses any remaining partial line, e.g. at the end of the output.
+        """
+        if self._pending:
+            line, self._pending = self._pending, ""
+            self.parse_line(line)
+
+    def parse_line(self, line:str):
+        """
+        Parses one complete line of output.
+        """
+        line = line.rstrip("\r")
+        if self.gtest:
+            self._parse_gtest(line)
+        else:
+            self._parse_cunit(line)
+
+    def _parse_cunit(self, line):
+        if "Suite" in line:
+            match = _CUNIT_FAILURES.match(line)
+            if match:
+                # Basic mode lists failures after the run: "Suite X, Test Y had failures:"
+                self._end_test(None)
+                self.suite, self.test = match.group(1), match.group(2)
+                self._listing = True
+                return
+            match = _CUNIT_SUITE.match(line)
+            if match:
+                self._end_test(None)
+                self.suite = match.group(1)
+                self._emit("suite_start", {"suite": self.suite})
+                return
+        if "Test" in line:
+            match = _CUNIT_TEST.match(line)
+            if match:
+                self._end_test(None)
+                self.test = match.group(1)
+                self._emit("test_start", {"suite": self.suite, "test": self.test})
+                if match.group(2):
+                    self._end_test("passed" if match.group(2) == "passed" else "failed")
+                return
+        if " - " in line:
+            match = _CUNIT_ASSERT.match(line)
+            if match:
+                self._assert_failure(match.group(1), int(match.group(2)), match.group(3))
+                return
+        self._parse_summary(line)
+
+    def _parse_gtest(self, line):
+        if line.startswith("["):
+            match = _GTEST_RUN.match(line)
+            if match:
+                self._end_test(None)
+                self.suite, _, self.test = match.group(1).partition(".")
+                self._emit("test_start", {"suite": self.suite, "test": self.test})
+                return
+            match = _GTEST_END.match(line)
+            if match:
+                if self.test is None:
+                    return  # The list of failed tests after the summary
+                status = {"OK": "passed", "FAILED": "failed", "SKIPPED": "skipped"}[match.group(1)]
+                duration = int(match.group(3)) / 1000.0 if match.group(3) else None
+                self._end_test(status, duration)
+                return
+            match = _GTEST_TOTAL.match(line)
+            if match:
+                self.summary.setdefault("gtest", {})[match.group(1).lower()] = int(match.group(2))
+                return
+        if line.endswith("Failure"):
+            match = _GTEST_ASSERT.match(line)
+            if match:
+                self._assert_failure(match.group(1), int(match.group(2)), "")
+                return
+        self._parse_summary(line)
+
+    def _parse_summary(self, line):
+        match = _SUMMARY_ROW.match(line)
+        if match:
+            self._end_test(None)
+            self.summary[match.group(1).lower()] = [match.group(2)] + match.group(3).split()
+            if match.group(1).lower() == "asserts":
+                self._emit("summary", dict(self.summary))
+            return
+        match = _ELAPSED.match(line)
+        if match:
+            self.summary["elapsed"] = float(match.group(1))
+
+    def _assert_failure(self, file, line, message):
+        self.failures += 1
+        self._testFailures += 1
+        # Console mode reports the asserts after the "...FAILED" result of their test
+        suite, test = (self.suite, self.test) if self.test is not None else self._lastTest
+        self._emit("assert_failure", {"suite": suite, "test": test, "file": file, "line": line, "message": message})
+        if self.failFast:
+            self.aborted = True
+
+    def _end_test(self, status, duration=None):
+        """
+        Reports the end of the current test; a None status means the test was followed by other
+        output without an explicit result, so it passed unless an assert failed.
+        """
+        if self.test is None:
+            return
+        if self._listing:
+            # Failures listed after the run belong to a test that has already ended
+            self._listing = False
+        else:
+            if status is None:
+                status = "failed" if self._testFailures else "passed"
+            self._emit("test_end", {"suite": self.suite, "test": self.test, "status": status, "duration": duration})
+            if status == "failed" and self.failFast:
+                self.aborted = True
+        self._lastTest = (self.suite, self.test)
+        self.test = None
+
+    def _emit(self, event, data):
+        if event == "test_start":
+            self._testFailures = 0
+            record = {"suite": data["suite"], "test": data["test"], "status": None, "duration": None, "failures": [],
+                      "_started": time.monotonic()}
+            self.records.append(record)
+            self._recordIndex[(data["suite"], data["test"])] = record
+        elif event == "assert_failure":
+            record = self._recordIndex.get((data["suite"], data["test"]))
+            if record is not None:
+                record["failures"].append({"file": data["file"], "line": data["line"], "message": data["message"]})
+                if record["status"] == "passed":
+                    record["status"] = "failed"
+        elif event == "test_end":
+            record = self._recordIndex.get((data["suite"], data["test"]))
+            if record is not None:
+                record["status"] = data["status"]
+                started = record.pop("_started", None)
+                record["duration"] = data["duration"] if data["duration"] is not None else round(time.monotonic() - started, 3)
+        for callback in self._callbacks.get(event, []) + self._callbacks.get("*", []):
+            callback(event, data)
+
+    def verdict(self):
+        """
+        Interprets the Run Summary, as utCFramework.collect_results().
+
+        Returns:
+            bool: True if no suite, test or assert failed, False otherwise, or None if no summary was seen.
+        """
+        def column(row, index):
+            value = self.summary[row][index] if len(self.summary.get(row, ())) > index else None
+            return int(value) if value is not None and value.isdigit() else None
+
+        if all(row in self.summary for row in ("suites", "tests", "asserts")):
+            if self.gtest:
+                # Suites: Total Ran n/a n/a Inactive n/a
+                counts = (column("suites", 4), column("tests", 3), column("asserts", 3))
+            else:
+                # suites: Total Ran n/a Failed Inactive
+                counts = (column("suites", 3), column("tests", 3), column("asserts", 3))
+            if None in counts:
+                return None
+            return not any(counts)
+        if self.gtest and "gtest" in self.summary:
+            return "failed" not in self.summary["gtest"]
+        return None
+
+    def parse(self, output:str):
+        """
+        Parses a complete output in one pass.
+
+        Args:
+            output (str): The captured output.
+
+        Returns:
+            utOutputParser: This parser, e.g. `utOutputParser().parse(output).records`.
+        """
+        self.feed(output)
+        self.close()
+        return self
+
+    def _completed_records(self):
+        """
+        Returns the test records, ending any test still marked as running (e.g. after a crash) as failed.
+        """
+        for record in self.records:
+            if record["status"] is None:
+                record["status"] = "failed"
+                record.pop("_started", None)
+        return self.records
+
+    def export_junit(self, path:str, name:str = "ut"):
+        """
+        Writes the test records as JUnit XML.
+
+        Args:
+            path (str): Path of the XML file.
+            name (str, optional): Name of the <testsuites> element. Defaults to "ut".
+
+        Returns:
+            str: The path written.
+        """
+        records = self._completed_records()
+        root = ElementTree.Element("testsuites", name=name)
+        suites = {}
+        for record in records:
+            suite = suites.get(record["suite"])
+            if suite is None:
+                suite = suites[record["suite"]] = ElementTree.SubElement(root, "testsuite", name=str(record["suite"]))
+            case = ElementTree.SubElement(suite, "testcase", classname=str(record["suite"]), name=str(record["test"]),
+                                          time=f"{record['duration'] or 0:.3f}")
+            if record["status"] == "skipped":
+                ElementTree.SubElement(case, "skipped")
+            elif record["status"] == "failed":
+                failures = record["failures"] or [{"file": None, "line": None, "message": "Test failed"}]
+                for failure in failures:
+                    element = ElementTree.SubElement(case, "failure", type="assert",
+                                                     message=f"{failure['file']}:{failure['line']}" if failure["file"] else failure["message"])
+                    element.text = failure["message"]
+
+        for suite in [root] + list(suites.values()):
+            cases = suite.iter("testcase")
+            counts = {"tests": 0, "failures": 0, "skipped": 0, "time": 0.0}
+            for case in cases:
+                counts["tests"] += 1
+                counts["failures"] += case.find("failure") is not None
+                counts["skipped"] += case.find("skipped") is not None
+                counts["time"] += float(case.get("time"))
+            for key, value in counts.items():
+                suite.set(key, f"{value:.3f}" if key == "time" else str(value))
+
+        ElementTree.ElementTree(root).write(path, encoding="utf-8", xml_declaration=True)
+        return path
+
+    def export_jsonl(self, path:str):
+        """
+        Writes the test records as JSON lines, one test per line.
+
+        Args:
+            path (str): Path of the file.
+
+        Returns:
+            str: The path written.
+        """
+        with open(path, "w") as output:
+            for record in self._completed_records():
+                output.write(json.dumps(record) + "\n")
+        return path
+
+# Test and example usage code
+if __name__ == '__main__':
+    cunitOutput = """
+Running Suite : L3 dsAudio - Sink
+     Running Test : Initialize dsAudio ...passed
+     Running Test : Enable Audio Port ...FAILED
+    1. test_l3_dsAudio.c:210  - CU_ASSERT_EQUAL(ret,dsERR_NONE)
+     Running Test : Terminate dsAudio ...passed
+
+Run Summary:    Type  Total    Ran Passed Failed Inactive
+              suites      1      1    n/a      0        0
+               tests      3      3      2      1        0
+             asserts     12     12     11      1      n/a
+
+Elapsed time =    0.012 seconds
+"""
+    events = []
+    parser = utOutputParser()
+    parser.on("*", lambda event, data: events.append((event, data.get("test"))))
+    # Feed in small chunks, as it would arrive from a serial console
+    for offset in range(0, len(cunitOutput), 7):
+        parser.feed(cunitOutput[offset:offset + 7])
+    parser.close()
+    print(events)
+    assert ("assert_failure", "Enable Audio Port") in events, "Expected: assert failure in Enable Audio Port"
+    assert ("test_end", "Terminate dsAudio") in events, "Expected: Terminate dsAudio ended"
+    assert parser.verdict() == False, "Expected: False"
+
+    failFast = utOutputParser(failFast=True)
+    started = []
+    failFast.on("test_start", lambda event, data: started.append(data["test"]))
+    for line in cunitOutput.splitlines(keepends=True):
+        failFast.feed(line)
+        if failFast.aborted:
+            break
+    assert failFast.aborted and started[-1] == "Enable Audio Port", "Expected: aborted in Enable Audio Port"
+
+    gtestOutput = """[==========] Running 2 tests from 1 test suite.
+[ RUN      ] dsAudio.Initialize
+[       OK ] dsAudio.Initialize (3 ms)
+[ RUN      ] dsAudio.EnablePort
+test_dsAudio.cpp:42: Failure
+Expected equality of these values:
+[  FAILED  ] dsAudio.EnablePort (5 ms)
+[==========] 2 tests from 1 test suite ran. (8 ms total)
+[  PASSED  ] 1 test.
+[  FAILED  ] 1 test, listed below:
+"""
+    # Per-test records and exports
+    records = utOutputParser().parse(cunitOutput).records
+    assert [record["status"] for record in records] == ["passed", "failed", "passed"], f"Unexpected: {records}"
+    assert records[1]["failures"] == [{"file": "test_l3_dsAudio.c", "line": 210, "message": "CU_ASSERT_EQUAL(ret,dsERR_NONE)"}], f"Unexpected: {records[1]}"
+
+    import os
+    import tempfile
+    with tempfile.TemporaryDirectory() as directory:
+        junit = ElementTree.parse(parser.export_junit(os.path.join(directory, "results.xml"))).getroot()
+        assert junit.get("tests") == "3" and junit.get("failures") == "1", "Expected: 3 tests, 1 failure"
+        with open(parser.export_jsonl(os.path.join(directory, "results.jsonl"))) as file:
+            assert len(file.readlines()) == 3, "Expected: 3 lines"
+
+    # One pass over a large output
+    largeOutput = "Running Suite : L1 dsAudio\n" + "".join(
+        f"     Running Test : test_{index} ...{'FAILED' if index % 100 == 0 else 'passed'}\n" +
+        (f"    1. test_l1_dsAudio.c:{index}  - CU_ASSERT_EQUAL(ret,dsERR_NONE)\n" if index % 100 == 0 else "")
+        for index in range(50000))
+    started = time.time()
+    large = utOutputParser().parse(largeOutput)
+    print(f"Parsed {len(largeOutput) / 1e6:.1f} MB, {len(large.records)} tests in {time.time() - started:.2f}s")
+    assert len(large.records) == 50000 and sum(record["status"] == "failed" for record in large.records) == 500
+
+    gtest = utOutputParser(gtest=True)
+    ended = []
+    gtest.on("test_end", lambda event, data: ended.append((data["test"], data["status"], data["duration"])))
+    gtest.feed(gtestOutput)
+    gtest.close()
+    print(ended)
+    assert ended == [("Initialize", "passed", 0.003), ("EnablePort", "failed", 0.005)], f"Unexpected: {ended}"
+    assert gtest.verdict() == False, "Expected: False"
@@ -26,6 +26,7 @@ import sys
 import os
 import re
 import time
+import hashlib
 
 # Helper always exist in the same directory under raft
 dir_path = os.path.dirname(os.path.realpath(__file__))
@@ -37,16 +38,54 @@ from framework.core.commandModules.consoleInterface import consoleInterface
 from interactiveShell import InteractiveShell
 from configRead import ConfigRead
 from utUserResponse import utUserResponse
+from utOutputParser import utOutputParser
+from utWatchdog import utTestWatchdog, CRASH_PATTERN
+
+# Parsed menus shared by all utCFramework instances: binary identity -> {"suites": menu, "tests": {suite index: menu}}
+_menuIndexCache = {}
+
+# The end of the output looks like a question waiting for input, e.g. "Enter Gain Level[0.0 to 100.0]: "
+_PROMPT_LIKE = re.compile(r"[:?\]>][ \t]*\Z")
+
+# A menu entry line, e.g. "  3. L3 dsAudio - Sink      No     No"
+_MENU_ENTRY = re.compile(r"^\s*(\d+)\.\s*\[?(.*?)\]?(?:\s{2,}.*)?$", re.MULTILINE)
+
+def batch_record(suite_name:str, test_name:str = None, error:str = None):
+    """
+    Returns a new batch result record, the one schema used by run_batch() and utSuiteScheduler.
+
+    Args:
+        suite_name (str): Suite of the entry.
+        test_name (str, optional): Test of the entry, None for the whole suite. Defaults to None.
+        error (str, optional): Why the entry did not complete. Defaults to None.
+
+    Returns:
+        dict: "suite", "test", "output" (None until read), "result" (True, False or None), "duration" in seconds,
+              "error" and "tests" (the per-test records of utOutputParser).
+    """
+    return {"suite": suite_name, "test": test_name, "output": None, "result": None, "duration": 0.0,
+            "error": error, "tests": []}
 
 class utCFramework:
     """This module supports the selection of C Type tests
+
+    The suite and test menus are parsed on the first navigation and cached per test binary
+    (see start()), so later selections send the cached indices without waiting for each menu.
+
+    When `parser` is set to a utOutputParser, test output is fed to it as it arrives (see stream_output()).
+    If a `watchdog` (a utTestWatchdog) is given, test output is also checked by it: a crashed, exited or
+    hung binary fails the test immediately, and is restarted if `restartOnFailure` is set.
     """
+    outputTailSize = 65536
 
-    def __init__(self, session:consoleInterface, log:logModule = None):
+    def __init__(self, session:consoleInterface, log:logModule = None, watchdog:utTestWatchdog = None, restartOnFailure:bool = False):
         """init function
 
         Args:
             session (consoleInterface): console interface to operate on
+            watchdog (utTestWatchdog, optional): watchdog checking test output. Defaults to None, results are
+                                                 read until the command prompt or the timeout.
+            restartOnFailure (bool, optional): restart the binary after a crash, exit or hang. Defaults to False.
         """
         self.prompt=": "
         self.session = session
@@ -57,16 +96,32 @@ class utCFramework:
         self.commandPrompt = r"command: "  # CUnit Prompt
         self.selectPrompt = r") : "
         self.testUserResponse = utUserResponse(self.log)
-
-    def start(self, command:str ):
+        self.identity = None
+        self.parser = None
+        self.lastParser = None
+        self.records = []
+        self._streamed = None
+        self.promptEvent = None
+        self.promptStallTime = 2.0
+        self._pendingOutput = ""
+        self.startCommand = None
+        self.watchdog = watchdog
+        self.restartOnFailure = restartOnFailure
+        self.failure = None
+
+    def start(self, command:str, identity:str = None ):
         """start the suite
 
         Args:
             command (str): start command
+            identity (str, optional): identifies the test binary for the menu cache, e.g. its checksum.
+                                      Defaults to None, see binary_identity().
 
         Returns:
             str: prompt result
         """
+        self.identity = identity or self.binary_identity(command)
+        self.startCommand = command
         self.session.write(command)
         #result = self.session.read_all()
         result = self.session.read_until( self.commandPrompt )
@@ -77,6 +132,33 @@ class utCFramework:
             self.log.info(result)
         return result
 
+    def binary_identity(self, command:str):
+        """
+        Identifies the build of the test binary a start command runs, for the menu cache.
+
+        The names, sizes and modification times of the files next to the executable are read through the
+        session, so a rebuilt binary gets its menus parsed again even if the start command is unchanged.
+
+        Args:
+            command (str): start command, e.g. "cd bin;./run.sh -p profile.yaml"
+
+        Returns:
+            str: The start command with a hash of the file details, or the start command alone if they cannot be read.
+        """
+        setup, _, run = command.rpartition(";")
+        words = run.split()
+        if not words:
+            return command
+        # The echoed command shows "$((6*7))", only the shell's output shows the marker
+        marker = "ut_identity42"
+        self.session.write(f"({setup or ':'}; stat -c '%n %s %Y' \"$(dirname {words[0]})\"/*) 2>/dev/null; echo ut_identity$((6*7))")
+        output = self.session.read_until(marker, 5)
+        details = [line.strip() for line in output.splitlines() if line.strip() and "ut_identity" not in line]
+        if not details:
+            self.log.warn(f"Cannot identify the binary of [{command}], menus are cached by start command")
+            return command
+        return f"{command} [{hashlib.md5(chr(10).join(details).encode()).hexdigest()}]"
+
     def stop(self):
         """stops the active suite
 
@@ -107,6 +189,18 @@ class utCFramework:
             str: Output from the framework.
         """
 
+        menus = _menuIndexCache.setdefault(self.identity, {"suites": None, "tests": {}})
+        suite_index = self.menu_index(menus["suites"], suite_name)
+        test_index = None
+        if suite_index is not None and test_name is not None:
+            test_index = self.menu_index(menus["tests"].get(suite_index), test_name)
+        if suite_index is not None and (test_name is None or test_index is not None):
+            output = self._select_cached(suite_name, suite_index, test_name, test_index, promptWithAnswers, timeout, is_cunit)
+            if output is not None:
+                return output
+            self.log.info("Menu changed, re-reading the menus")
+            menus = _menuIndexCache[self.identity] = {"suites": None, "tests": {}}
+
         # Ensure we're at the top menu depending on the framework
         self.session.write("x" if is_cunit else "m")
         self.session.write("u")
@@ -118,7 +212,8 @@ class utCFramework:
         self.log.debug(output)
 
         # Extract test suite index from the output
-        suite_index = self.find_index_in_output(output, suite_name)
+        menus["suites"] = self.parse_menu(output)
+        suite_index = self.menu_index(menus["suites"], suite_name)
         if suite_index is None:
             self.log.error(f"Suite [{suite_name}] not found in configuration.")
             return None
@@ -131,8 +226,7 @@ class utCFramework:
         if test_name is None:
             # Run the suite of tests
             self.session.write("r")
-            output = self.session.read_until(self.commandPrompt, timeout)
-            self.log.debug(output)
+            output = self._read_result(timeout)
         else:
             # Run the specific test
             self.session.write("s")
@@ -140,7 +234,8 @@ class utCFramework:
             self.log.debug(output)
 
             # Extract test index from the output
-            test_index = self.find_index_in_output(output, test_name)
+            menus["tests"][suite_index] = self.parse_menu(output)
+            test_index = self.menu_index(menus["tests"][suite_index], test_name)
             if test_index is None:
                 self.log.error(f"Test [{test_name}] not found in suite [{suite_name}].")
                 raise ValueError(f"Test [{test_name}] not found in the suite.")
@@ -148,44 +243,461 @@ class utCFramework:
             self.log.info(f"Found test: [{test_name}] @ [{test_index}]")
             self.session.write(str(test_index))
 
-            # If input prompts are present, handle them
-            if promptWithAnswers is not None:
-                output = self.inputPrompts(promptWithAnswers)
-
-            # Wait for the command prompt (final output)
-            output = self.session.read_until(self.commandPrompt, timeout)
-            self.log.debug(output)
+            # Handle any input prompts, then wait for the command prompt (final output)
+            output = self._read_test(promptWithAnswers, timeout)
 
         return output
 
-    def inputPrompts(self, promptsWithAnswers: dict):
+    def run_batch(self, tests: list, timeout: int = 10, is_cunit: bool = True, gtest: bool = False, failFast: bool = False, results: list = None):
         """
-        Sends the ecific prompts and sends corresponding input values.
+        Runs a list of tests in one menu session.
+
+        Consecutive tests of the same suite are selected from within the suite menu without returning
+        to the top menu. Once the suite's test menu is known, the next selection is sent as soon as
+        the previous test's prompt returns.
 
         Args:
-            promptsWithAnswers  A list of prompt strings to wait for.
-        """
-
-        output=""
-        for prompt in promptsWithAnswers:
-            session_output = self.session.read_until(prompt.get("query"))
-            if prompt.get("query_type") == "list":
-                value = self.find_index_in_output(session_output, prompt.get("input"))
-                if value is None:
-                    prompt = prompt.get("input")
-                    self.log.error(f"Test [{prompt}] not found in suite")
-                    raise ValueError(f"Test [{prompt}] not found.")
-                input = str(value)
+            tests (list): Entries of (suite_name, test_name, promptWithAnswers); test_name None runs the
+                          whole suite, and promptWithAnswers may be omitted.
+            timeout (int): Time limit for each test, in seconds. Defaults to 10 seconds.
+            is_cunit (bool): Set to True if running CUnit tests; False for GTest. Controls initial menu navigation.
+            gtest (bool): Parse GTest-style summaries. Defaults to False.
+            failFast (bool): Stop at the first failed assert or test, without waiting for the rest of its output.
+                             The binary may still be running the test afterwards; stop() or restart it. Defaults to False.
+            results (list, optional): List to append each record to as soon as its entry completes, so the
+                                      completed records are kept if a later entry raises. Defaults to None.
+
+        Returns:
+            list: One batch_record() per entry; "error" is None, a message, or "reason: detail" for a timeout
+                  or watchdog event.
+        """
+        if results is None:
+            results = []
+        current_suite = None
+        parser = self.parser
+        for entry in tests:
+            self.failure = None
+            if failFast or parser is None:
+                # A parser per entry, so collect_results() can take its records as they were streamed
+                self.parser = utOutputParser(gtest, failFast=failFast)
+            suite_name, test_name, promptWithAnswers = (tuple(entry) + (None, None))[:3]
+            record = batch_record(suite_name, test_name)
+            started = time.time()
+            try:
+                if suite_name == current_suite:
+                    output = self._select_in_suite(suite_name, test_name, promptWithAnswers, timeout)
+                else:
+                    output = self.select(suite_name, test_name, promptWithAnswers, timeout, is_cunit)
+                    if output is None:
+                        raise ValueError(f"Suite [{suite_name}] not found.")
+                current_suite = suite_name
+                record["output"] = output
+                record["result"] = self.collect_results(output, gtest)
+                record["tests"] = self.records
+                if self.failure is not None:
+                    # The binary was restarted at its top menu, or is still running the test
+                    current_suite = None
+                    record["result"] = False
+                    record["error"] = f"{self.failure['reason']}: {self.failure['detail']}"
+            except ValueError as e:
+                # select() may have stopped part way through a menu, navigate from the top next time
+                current_suite = None
+                record["error"] = str(e)
+                self.log.error(f"Batch entry [{suite_name}] [{test_name}]: {e}")
+            record["duration"] = time.time() - started
+            results.append(record)
+            if failFast and self.parser.aborted:
+                record["result"] = False
+                record["error"] = "Aborted at the first failure"
+                self.log.error(f"Batch stopped at the first failure: [{suite_name}] [{test_name}]")
+                break
+        self.parser = parser
+        return results
+
+    def stream_output(self, parser: utOutputParser = None, timeout: int = 10, prompt: str = None):
+        """
+        Reads output until a prompt, feeding it to a parser and the watchdog as it arrives.
+
+        If the watchdog reports a crash, exit or hang, reading stops at once, the reason is kept in
+        `self.failure` and the binary is restarted if `restartOnFailure` is set (see restart()).
+        Reaching the timeout is kept as a "timeout" failure, and the binary is left running.
+
+        Args:
+            parser (utOutputParser, optional): The parser to feed. Defaults to None.
+            timeout (int): Time limit in seconds. Defaults to 10 seconds.
+            prompt (str, optional): Text ending the output. Defaults to None, the command prompt.
+
+        Returns:
+            str: The output read, or only its last outputTailSize characters when the parser started empty
+                 (its records then stand for the output, see collect_results()). Reading also stops early
+                 when the parser aborts (fail-fast mode).
+        """
+        prompt = prompt or self.commandPrompt
+        fresh = parser is not None and not parser.records and not parser.summary
+        chunks = []
+        kept = ""
+        tail = ""
+        pending = self._take_pending()
+        self.failure = None
+        if self.watchdog is not None:
+            self.watchdog.reset()
+        deadline = time.time() + timeout
+        while True:
+            if pending:
+                data, pending = pending, ""
             else:
-                input = prompt.get("input")
+                data = self.session.read_all()
+            if data:
+                if fresh:
+                    kept = (kept + data)[-self.outputTailSize:]
+                else:
+                    chunks.append(data)
+                if parser is not None:
+                    parser.feed(data)
+                if self.watchdog is not None:
+                    self.watchdog.feed(data)
+                # Only the end of the output is searched, the prompt may be split across reads
+                tail = (tail + data)[-(len(prompt) + len(data)):]
+                if prompt in tail or (parser is not None and parser.aborted):
+                    break
+            event = self.watchdog.check() if self.watchdog is not None else None
+            if event is not None:
+                self._test_failed(*event)
+                break
+            if time.time() >= deadline:
+                self.failure = {"reason": "timeout", "detail": f"No [{prompt}] within {timeout}s"}
+                self.log.error(f"Test timed out: {self.failure['detail']}")
+                break
+            if not data:
+                time.sleep(0.05)
+        if parser is not None:
+            parser.close()
+        output = kept if fresh else "".join(chunks)
+        self.log.debug(output)
+        # collect_results() reuses a parser that saw exactly this output instead of parsing it again
+        self._streamed = (parser, output) if fresh else None
+        return output
+
+    def _test_failed(self, reason: str, detail: str):
+        """
+        Records why the watchdog abandoned a test, and restarts the binary if enabled so that following tests can run.
+        """
+        self.failure = {"reason": reason, "detail": detail}
+        self.log.error(f"Test abandoned ({reason}): {detail}")
+        if self.restartOnFailure and self.startCommand is not None:
+            self.restart(reason)
 
-            if input == "user_prompt":
-                input = self.testUserResponse.getUserYN(prompt.get("query"))
-            self.session.write(input)
-            output += session_output
+    def restart(self, reason: str = None):
+        """
+        Restarts the test binary with the last start() command, e.g. after a crash or hang.
+
+        Args:
+            reason (str, optional): "hang" or "timeout" interrupts the binary first. Defaults to None.
+
+        Returns:
+            str: prompt result
+        """
+        if reason in ("hang", "timeout"):
+            self.session.write("\x03")     # Ctrl-C
+            time.sleep(0.5)
+        self.session.read_all()     # Discard what is left of the failed run
+        self._pendingOutput = ""
+        self.log.info(f"Restarting [{self.startCommand}]")
+        return self.start(self.startCommand, self.identity)
+
+    def _read_test(self, promptWithAnswers: list, timeout: int):
+        """
+        Answers the input prompts of the selected test, if any, and reads its result.
+
+        If answering stops on a crash, an unknown prompt or a timeout (see inputPrompts()), the test will not
+        reach the command prompt, so the output is returned at once and the event is kept in `self.failure`.
+        """
+        self.failure = None
+        if promptWithAnswers is not None:
+            output = self.inputPrompts(promptWithAnswers, timeout)
+            if self.promptEvent not in ("completed", "command_prompt"):
+                output += self._take_pending()
+                self.log.debug(output)
+                if self.promptEvent == "crash":
+                    self._test_failed("crash", "Crashed while answering input prompts")
+                else:
+                    self.failure = {"reason": self.promptEvent, "detail": "Input prompts not answered"}
+                return output
+        return self._read_result(timeout)
 
+    def _read_result(self, timeout: int):
+        """
+        Waits for the command prompt at the end of a test run, streaming the output through `parser` and `watchdog` if set.
+        """
+        if self.parser is not None or self.watchdog is not None:
+            return self.stream_output(self.parser, timeout)
+        pending = self._take_pending()
+        if self.commandPrompt in pending:
+            # inputPrompts() already read up to the prompt
+            end = pending.index(self.commandPrompt) + len(self.commandPrompt)
+            self._pendingOutput = pending[end:]
+            return pending[:end]
+        output = pending + self.session.read_until(self.commandPrompt, timeout)
+        self.log.debug(output)
         return output
 
+    def _select_in_suite(self, suite_name: str, test_name: str, promptWithAnswers: list, timeout: int):
+        """
+        Runs a test of the suite whose menu is active.
+
+        Raises:
+            ValueError: If the test is not found.
+
+        Returns:
+            str: Output from the framework.
+        """
+        if test_name is None:
+            self.session.write("r")
+            output = self._read_result(timeout)
+            return output
+
+        menus = _menuIndexCache.setdefault(self.identity, {"suites": None, "tests": {}})
+        suite_index = self.menu_index(menus["suites"], suite_name)
+        test_index = self.menu_index(menus["tests"].get(suite_index), test_name)
+
+        self.session.write("s")
+        output = self.session.read_until(self.selectPrompt)
+        self.log.debug(output)
+
+        # Nothing is selected until the listing confirms the cached index
+        if test_index is None or self.find_index_in_output(output, test_name) != test_index:
+            if test_index is not None:
+                self.log.info(f"Menu of suite [{suite_name}] changed, re-reading it")
+            menus["tests"][suite_index] = self.parse_menu(output)
+            test_index = self.menu_index(menus["tests"][suite_index], test_name)
+            if test_index is None:
+                self.log.error(f"Test [{test_name}] not found in suite [{suite_name}].")
+                raise ValueError(f"Test [{test_name}] not found in the suite.")
+
+        self.log.info(f"Found test: [{test_name}] @ [{test_index}]")
+        self.session.write(str(test_index))
+        output = self._read_test(promptWithAnswers, timeout)
+        return output
+
+    def _select_cached(self, suite_name: str, suite_index: int, test_name: str, test_index: int, promptWithAnswers: list, timeout: int, is_cunit: bool):
+        """
+        Selects a test using cached menu indices.
+
+        The navigation keys and the cached suite index are sent in one go, and both listings are checked
+        once they have all been received. The test index (or the run command) is only sent if they match,
+        so a changed menu never runs the wrong test.
+
+        Returns:
+            str: Output from the framework, or None if the menus no longer match the cache.
+        """
+        keys = ["x" if is_cunit else "m", "u", "s", str(suite_index)]
+        if test_name is not None:
+            keys.append("s")
+        for key in keys:
+            self.session.write(key)
+
+        suites = self.session.read_until(self.selectPrompt)
+        self.log.debug(suites)
+        # The test listing, or the prompt after the suite selection
+        output = self.session.read_until(self.commandPrompt if test_name is None else self.selectPrompt)
+        self.log.debug(output)
+        if self.find_index_in_output(suites, suite_name) != suite_index or \
+           (test_name is not None and self.find_index_in_output(output, test_name) != test_index):
+            if test_name is not None:
+                self._abandon_selection()
+            return None
+
+        self.log.info(f"Found Suite: [{suite_name}] @ [{suite_index}] (cached)")
+        if test_name is None:
+            self.session.write("r")
+            output = self._read_result(timeout)
+            return output
+
+        self.log.info(f"Found test: [{test_name}] @ [{test_index}] (cached)")
+        self.session.write(str(test_index))
+        output = self._read_test(promptWithAnswers, timeout)
+        return output
+
+    def _abandon_selection(self):
+        """
+        Leaves a selection prompt without selecting anything.
+        """
+        # An out of range entry cancels the selection
+        self.session.write("0")
+        output = self.session.read_until(self.commandPrompt)
+        self.log.debug(output)
+
+    def parse_menu(self, output):
+        """
+        Parses a suite or test menu listing.
+
+        Args:
+            output (str): The shell output containing the listing.
+
+        Returns:
+            dict: {"output": listing, "names": {name: index}} for use with menu_index().
+        """
+        names = {}
+        for match in _MENU_ENTRY.finditer(output):
+            names.setdefault(match.group(2), int(match.group(1)))
+        return {"output": output, "names": names}
+
+    def menu_index(self, menu, target_name):
+        """
+        Finds the index of a suite or test in a parsed menu.
+
+        Names are matched as by find_index_in_output(), so a leading part of the name is enough;
+        such matches are added to the menu for later lookups.
+
+        Args:
+            menu (dict): A menu returned by parse_menu(), or None.
+            target_name (str): The name of the suite or test to find.
+
+        Returns:
+            int: The index of the target_name if found, otherwise None.
+        """
+        if menu is None:
+            return None
+        index = menu["names"].get(target_name)
+        if index is None:
+            index = self.find_index_in_output(menu["output"], target_name)
+            if index is not None:
+                menu["names"][target_name] = index
+        return index
+
+    @staticmethod
+    def invalidate_menu_cache(identity: str = None):
+        """
+        Discards cached menus, e.g. when a rebuilt binary cannot be told apart by binary_identity().
+
+        Args:
+            identity (str, optional): Binary identity to discard. Defaults to None (all).
+        """
+        if identity is None:
+            _menuIndexCache.clear()
+        else:
+            _menuIndexCache.pop(identity, None)
+
+    def inputPrompts(self, promptsWithAnswers: dict, timeout: int = 10):
+        """
+        Answers the input prompts of a test, in whatever order the test asks them.
+
+        All outstanding queries are waited for at once and whichever appears first is answered. Waiting ends
+        as soon as every query has been answered, or on a terminal event:
+
+        * "command_prompt": the test finished (the remaining queries were not asked).
+        * "crash":          a crash signature (e.g. Segmentation fault) appeared.
+        * "unknown_prompt": the output stopped at a prompt that matches no outstanding query.
+        * "timeout":        nothing conclusive happened within the timeout.
+
+        The event is kept in `self.promptEvent` ("completed" when all queries were answered). Output read
+        after the last answer is kept for the next read of the test result.
+
+        Args:
+            promptsWithAnswers (list): Prompts as dictionaries with "query", "input" and optionally
+                                       "query_type" ("list" to answer with the index of "input" in the listed options).
+            timeout (int): Time limit in seconds. Defaults to 10 seconds.
+
+        Raises:
+            ValueError: If a "list" query does not list its input.
+
+        Returns:
+            str: The output up to the last answer.
+        """
+        outstanding = list(promptsWithAnswers)
+        output = ""
+        buffer = self._take_pending()
+        self.promptEvent = "completed"
+        deadline = time.time() + timeout
+        lastData = time.time()
+
+        while outstanding:
+            # Answer the query appearing first, if any
+            found = None
+            for prompt in outstanding:
+                position = buffer.find(prompt.get("query"))
+                if position >= 0 and (found is None or position < found[0]):
+                    found = (position, prompt)
+            if found is not None:
+                position, prompt = found
+                end = position + len(prompt.get("query"))
+                session_output, buffer = buffer[:end], buffer[end:]
+                outstanding.remove(prompt)
+                self._answer_prompt(prompt, session_output)
+                output += session_output
+                continue
+
+            event = self._terminal_event(buffer, time.time() - lastData)
+            if event is None and time.time() >= deadline:
+                event = "timeout"
+            if event is not None:
+                self.promptEvent = event
+                queries = [prompt.get("query") for prompt in outstanding]
+                if event == "command_prompt":
+                    self.log.info(f"Test finished without asking {queries}")
+                else:
+                    self.log.error(f"Prompts stopped ({event}), not asked: {queries}")
+                break
+
+            data = self.session.read_all()
+            if data:
+                buffer += data
+                lastData = time.time()
+            else:
+                time.sleep(0.05)
+
+        self._pendingOutput = buffer
+        return output
+
+    def _answer_prompt(self, prompt: dict, session_output: str):
+        """
+        Sends the answer to a prompt.
+
+        Args:
+            prompt (dict): The prompt, with "query", "input" and optionally "query_type".
+            session_output (str): The output up to and including the query.
+        """
+        if prompt.get("query_type") == "list":
+            value = self.find_index_in_output(session_output, prompt.get("input"))
+            if value is None:
+                prompt = prompt.get("input")
+                self.log.error(f"Test [{prompt}] not found in suite")
+                raise ValueError(f"Test [{prompt}] not found.")
+            input = str(value)
+        else:
+            input = prompt.get("input")
+
+        if input == "user_prompt":
+            input = self.testUserResponse.getUserYN(prompt.get("query"))
+        self.session.write(input)
+
+    def _terminal_event(self, buffer: str, idle: float):
+        """
+        Classifies output that ends the wait for prompts.
+
+        Args:
+            buffer (str): Output received since the last answer.
+            idle (float): Seconds since output was last received.
+
+        Returns:
+            str: "command_prompt", "crash" or "unknown_prompt", or None to keep waiting.
+        """
+        if self.commandPrompt in buffer:
+            return "command_prompt"
+        if CRASH_PATTERN.search(buffer):
+            return "crash"
+        # Only an unterminated last line can be a prompt waiting for input
+        if idle >= self.promptStallTime and _PROMPT_LIKE.search(buffer[buffer.rfind("\n") + 1:]):
+            return "unknown_prompt"
+        return None
+
+    def _take_pending(self):
+        """
+        Returns and clears the output read ahead by inputPrompts().
+        """
+        pending, self._pendingOutput = self._pendingOutput, ""
+        return pending
+
     def find_index_in_output(self, output, target_name):
         """
         Finds the index of a target name in the shell output.
@@ -208,6 +720,10 @@ class utCFramework:
         """
         Collects and interprets the results from the test execution output.
 
+        The output is parsed in one pass with utOutputParser, unless it was just read by stream_output()
+        into a new parser, whose results are used as they are. The per-test records (name, suite, status,
+        assert failures and duration) are kept in `self.records`, see export_results().
+
         Args:
             output (str): The output from the test execution.
             gtest (bool): Flag to indicate whether to parse GTest-style summary format.
@@ -215,66 +731,46 @@ class utCFramework:
         Returns:
             bool: True if the test passed successfully, False if the test failed, or None if the output format is unexpected.
         """
+        streamed = self._streamed
+        if streamed is not None and streamed[1] is output and streamed[0].gtest == gtest:
+            parser = streamed[0]
+        else:
+            parser = utOutputParser(gtest).parse(output or "")
+        self.lastParser = parser
+        self.records = parser.records
 
-        if gtest:
-            # GTest-style summary parsing
-            run_summary_found = "Run Summary:" in output
-            if not run_summary_found:
-                self.log.error("Run Summary not found.")
-                return None
-
-            # Match Suites, Tests, and Asserts lines
-            suite_line = re.search(r"Suites\s+\d+\s+\d+\s+n/a\s+n/a\s+(\d+)\s+n/a", output)
-            test_line = re.search(r"Tests\s+\d+\s+\d+\s+(\d+)\s+(\d+)\s+\d+\s+\d+", output)
-            assert_line = re.search(r"Asserts\s+\d+\s+\d+\s+(\d+)\s+(\d+)\s+\d+", output)
-
-            if suite_line and test_line and assert_line:
-                suites_inactive = int(suite_line.group(1))
-                tests_passed = int(test_line.group(1))
-                tests_failed = int(test_line.group(2))
-                asserts_passed = int(assert_line.group(1))
-                asserts_failed = int(assert_line.group(2))
-
-                if tests_failed == 0 and asserts_failed == 0 and suites_inactive == 0:
-                    self.log.info("Test passed successfully (GTest format).")
-                    return True
-                else:
-                    self.log.error(
-                        f"Test failed (GTest format). Suites inactive: {suites_inactive}, "
-                        f"Tests failed: {tests_failed}, Asserts failed: {asserts_failed}"
-                    )
-                    return False
-            else:
-                self.log.error("Unexpected GTest output format.")
-                return None
+        if not parser.summary:
+            self.log.error("Run Summary not found.")
+            return None
 
+        result = parser.verdict()
+        if result is None:
+            self.log.error("Unexpected GTest output format." if gtest else "Unexpected output format.")
+        elif result:
+            self.log.info("Test passed successfully (GTest format)." if gtest else "Test passed successfully.")
         else:
-            # cunit parsing
-            run_summary_pattern = r"Run Summary:\s+Type\s+Total\s+Ran\s+Passed\s+Failed\s+Inactive"
-            summary_match = re.search(run_summary_pattern, output)
-
-            if summary_match:
-                suite_summary_line = re.search(r"suites\s+\d+\s+\d+\s+n/a\s+(\d+)\s+\d+", output)
-                test_summary_line = re.search(r"tests\s+\d+\s+\d+\s+(\d+)\s+(\d+)\s+\d+", output)
-                assert_summary_line = re.search(r"asserts\s+\d+\s+\d+\s+(\d+)\s+(\d+)\s+n/a", output)
-
-                if suite_summary_line and test_summary_line and assert_summary_line:
-                    suites_failed = int(suite_summary_line.group(1))
-                    tests_failed = int(test_summary_line.group(2))
-                    asserts_failed = int(assert_summary_line.group(2))
-
-                    if suites_failed == 0 and tests_failed == 0 and asserts_failed == 0:
-                        self.log.info("Test passed successfully.")
-                        return True
-                    else:
-                        self.log.error("Test failed.")
-                        return False
-                else:
-                    self.log.error("Unexpected output format.")
-                    return None
-            else:
-                self.log.error("Run Summary not found.")
-                return None
+            for record in parser.records:
+                if record["status"] == "failed":
+                    failures = ", ".join(f"{failure['file']}:{failure['line']}" for failure in record["failures"])
+                    self.log.error(f"Test failed: [{record['suite']}] [{record['test']}] {failures}")
+            self.log.error("Test failed (GTest format)." if gtest else "Test failed.")
+        return result
+
+    def export_results(self, junitPath: str = None, jsonPath: str = None):
+        """
+        Exports the per-test records of the last collect_results() call.
+
+        Args:
+            junitPath (str, optional): Path for JUnit XML output. Defaults to None.
+            jsonPath (str, optional): Path for JSON lines output. Defaults to None.
+        """
+        if self.lastParser is None:
+            self.log.error("No results collected")
+            return
+        if junitPath:
+            self.lastParser.export_junit(junitPath)
+        if jsonPath:
+            self.lastParser.export_jsonl(jsonPath)
 
 class UTSuiteNavigatorClass:
 
@@ -305,6 +801,9 @@ class UTSuiteNavigatorClass:
                             - "Test 1"
                             - "Test 2"
                             - "Test 3"
+                watchdog:    # Optional, fail crashed, exited or hung tests at once (see utTestWatchdog)
+                    stallTimeout: 60    # Seconds without output before a test is hung
+                    restart: true       # Restart the binary after a failure
         ```
         Args:
             config (str): The file path to the menu configuration YAML file or a decoded object
@@ -314,13 +813,20 @@ class UTSuiteNavigatorClass:
         """
         self.session = session
         self.config = ConfigRead(config, startKey)
+        self.log = log
         if log is None:
             self.log = logModule(self.__class__.__name__)
-        self.log.setLevel( self.log.INFO )
+            self.log.setLevel( self.log.INFO )
         test_type = self.config.test.type
         if test_type == "UT-C" or test_type == "C":
             # Currently support the C Framework
-            self.framework = utCFramework(session)
+            watchdog = (self.config.fields.get("test") or {}).get("watchdog")
+            if watchdog:
+                settings = watchdog if isinstance(watchdog, dict) else {}
+                self.framework = utCFramework(session, log, utTestWatchdog(stallTimeout=settings.get("stallTimeout", 60)),
+                                              bool(settings.get("restart", False)))
+            else:
+                self.framework = utCFramework(session, log)
             self.log.info("C Framework Selected")
         else:
             self.log.error("Invalid Menu Type Configuration :{}".format(test_type))
@@ -377,7 +883,7 @@ class UTSuiteNavigatorClass:
         return result
 
     def start(self):
-        command = self.config.test.execute
+        command = self.config.resolve("test.execute")
         result = self.framework.start(command)
         self.log.debug( "result [{}]".format(result))
 
@@ -388,6 +894,23 @@ class UTSuiteNavigatorClass:
         results = self.framework.collect_results( output, gtest )
         return results
 
+    def run_batch(self, tests: list, timeout: int = 10, is_cunit: bool = True, gtest: bool = False, failFast: bool = False, results: list = None):
+        """
+        Runs a list of tests in one menu session, see utCFramework.run_batch().
+
+        Args:
+            tests (list): Entries of (suite_name, test_name, promptWithAnswers).
+            timeout (int): Time limit for each test, in seconds. Defaults to 10 seconds.
+            is_cunit (bool): Set to True if running a CUnit-based test. Defaults to True.
+            gtest (bool): Parse GTest-style summaries. Defaults to False.
+            failFast (bool): Stop at the first failed assert or test. Defaults to False.
+            results (list, optional): List to append each record to as it completes. Defaults to None.
+
+        Returns:
+            list: Per-test dictionaries with "suite", "test", "output", "result", "duration" and "error".
+        """
+        return self.framework.run_batch(tests, timeout, is_cunit, gtest, failFast, results)
+
     def run(self, suite_name, test_name=None):
         """
         Executes the specified test by navigating to it and collecting the results.
@@ -494,6 +1017,15 @@ if __name__ == '__main__':
     ]
     result = test.select( suite, "Set Audio Mixer Levels", promptWithAnswers ) # Has non matching inputs and should error
     print(result)
+
+    # Run several tests in one menu session
+    results = test.run_batch([
+        (suite, "Initialize dsAudio"),
+        (suite, "Set Audio Mixer Levels", promptWithAnswers),
+        (suite, "Terminate dsAudio"),
+    ])
+    for record in results:
+        print("[{}] [{}] result:[{}] {:.2f}s {}".format(record["suite"], record["test"], record["result"], record["duration"], record["error"] or ""))
     test.stop()
 
     #test.select( "Parent", "Child" )
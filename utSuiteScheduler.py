@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+#** *****************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2024 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+
+import sys
+import os
+import json
+import tempfile
+import threading
+from collections import deque
+
+dir_path = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(dir_path+"/../../../")
+sys.path.append(dir_path)
+
+from framework.core.logModule import logModule
+from framework.plugins.ut_raft.configRead import ConfigRead
+from framework.plugins.ut_raft.utSuiteNavigator import UTSuiteNavigatorClass, batch_record
+
+class utSuiteScheduler():
+    """
+    Runs the tests of a suite profile across several sessions at once.
+
+    Tests are split into one shard per session, balanced on their durations from previous runs
+    (longest first, each to the least loaded shard). Every session runs its own UTSuiteNavigatorClass
+    in a thread; a session that finishes its shard takes the remaining tests from the end of the
+    busiest shard, so a slow device or a badly estimated test does not hold up the whole run. When a
+    session fails, the tests still queued for it are handed to the sessions that are still running.
+
+    The sessions must be independent: identical devices, or separate InteractiveShells for vdevice.
+    """
+    defaultDuration = 1.0
+
+    def __init__(self, config, startKey:str, sessions:list, historyFile:str = None, log:logModule = None):
+        """
+        Initializes the scheduler.
+
+        Args:
+            config (str): The suite profile, as for UTSuiteNavigatorClass (file path, YAML string or ConfigRead).
+            startKey (str): Key of the profile within the config.
+            sessions (list): Console sessions to run on, one navigator is created per session.
+            historyFile (str, optional): JSON file of test durations used to balance shards, updated after each run.
+                                         Defaults to None (all tests are assumed to take the same time).
+            log (class, optional): Parent log class. Defaults to None.
+        """
+        self.log = log
+        if log is None:
+            self.log = logModule(self.__class__.__name__)
+            self.log.setLevel( self.log.INFO )
+
+        self.config = ConfigRead(config, startKey)
+        self.startKey = startKey
+        self.sessions = sessions
+        self.historyFile = historyFile
+        self.history = self._loadHistory()
+        self._lock = threading.Lock()
+        self._shards = []
+        self._active = set()
+
+    def tests(self):
+        """
+        Lists the tests of the profile in profile order.
+
+        Suites without a test list (or listing only None) are run as a whole.
+
+        Returns:
+            list: (suite_name, test_name) entries, test_name is None for whole suites.
+        """
+        entries = []
+        suites = (self.config.fields.get("test") or {}).get("suites") or {}
+        for index in suites:
+            suite = suites[index] or {}
+            name = suite.get("name")
+            if not name:
+                self.log.error(f"Invalid Format [suites.{index}]: name not found")
+                continue
+            tests = [test for test in (suite.get("tests") or []) if test not in (None, "None")]
+            if tests:
+                entries += [(name, test) for test in tests]
+            else:
+                entries.append((name, None))
+        return entries
+
+    def estimate(self, suite_name:str, test_name:str = None):
+        """
+        Returns the expected duration of a test in seconds, from the history or the average known duration.
+        """
+        duration = self.history.get(self._historyKey(suite_name, test_name))
+        if duration is not None:
+            return duration
+        if self.history:
+            return sum(self.history.values()) / len(self.history)
+        return self.defaultDuration
+
+    def plan(self, tests:list):
+        """
+        Splits tests into one shard per session.
+
+        Args:
+            tests (list): (suite_name, test_name[, promptWithAnswers]) entries.
+
+        Returns:
+            list: One deque of (position, entry) per session, each in profile order so tests of the same
+                  suite run one after the other.
+        """
+        shards = [[] for _ in self.sessions]
+        loads = [0.0] * len(self.sessions)
+        ordered = sorted(enumerate(tests), key=lambda item: -self.estimate(item[1][0], item[1][1]))
+        for position, entry in ordered:
+            shard = loads.index(min(loads))
+            shards[shard].append((position, entry))
+            loads[shard] += self.estimate(entry[0], entry[1])
+        return [deque(sorted(shard, key=lambda item: item[0])) for shard in shards]
+
+    def run(self, tests:list = None, timeout:int = 10, is_cunit:bool = True, gtest:bool = False):
+        """
+        Runs the tests on all sessions and merges the results.
+
+        Args:
+            tests (list, optional): (suite_name, test_name[, promptWithAnswers]) entries. Defaults to None (all tests of the profile).
+            timeout (int): Time limit for each test, in seconds. Defaults to 10 seconds.
+            is_cunit (bool): Set to True if running CUnit tests; False for GTest.
+            gtest (bool): Parse GTest-style summaries. Defaults to False.
+
+        Returns:
+            list: The batch_record() records in test order, each with an added "session" index (None if not run).
+        """
+        if tests is None:
+            tests = self.tests()
+        self._shards = self.plan(tests)
+        self._active = set(range(len(self.sessions)))
+        results = [None] * len(tests)
+
+        workers = []
+        for index, session in enumerate(self.sessions):
+            worker = threading.Thread(target=self._worker, args=(index, session, results, timeout, is_cunit, gtest),
+                                      name=f"utSuiteScheduler-{index}", daemon=True)
+            worker.start()
+            workers.append(worker)
+        for worker in workers:
+            worker.join()
+
+        for position, record in enumerate(results):
+            if record is None:
+                results[position] = batch_record(tests[position][0], tests[position][1], "Not run")
+                results[position]["session"] = None
+            elif record["error"] is None:
+                self.history[self._historyKey(record["suite"], record["test"])] = round(record["duration"], 3)
+        self._saveHistory()
+        return results
+
+    def _next(self, index):
+        """
+        Takes the next test for a session: the front of its own shard, otherwise the back of the busiest shard.
+        """
+        with self._lock:
+            if self._shards[index]:
+                return self._shards[index].popleft()
+            victim = max(range(len(self._shards)),
+                         key=lambda shard: sum(self.estimate(entry[0], entry[1]) for _, entry in self._shards[shard]))
+            if self._shards[victim]:
+                position, entry = self._shards[victim].pop()
+                self.log.info(f"Session [{index}] took [{entry[0]}] [{entry[1]}] from session [{victim}]")
+                return position, entry
+            self._active.discard(index)
+        return None
+
+    def _requeue(self, index):
+        """
+        Moves the tests still queued for a failed session to the least loaded sessions that are running.
+        """
+        with self._lock:
+            self._active.discard(index)
+            remaining = self._shards[index]
+            self._shards[index] = deque()
+            if not self._active:
+                self._shards[index] = remaining
+                self.log.error(f"No session left to run the {len(remaining)} tests of session [{index}]")
+                return
+            for position, entry in remaining:
+                shard = min(self._active, key=lambda active: sum(self.estimate(queued[0], queued[1]) for _, queued in self._shards[active]))
+                self._shards[shard].append((position, entry))
+                self.log.info(f"Requeued [{entry[0]}] [{entry[1]}] from session [{index}] to session [{shard}]")
+            for shard in self._active:
+                self._shards[shard] = deque(sorted(self._shards[shard], key=lambda item: item[0]))
+
+    def _worker(self, index, session, results, timeout, is_cunit, gtest):
+        taken = []
+
+        def entries():
+            while True:
+                item = self._next(index)
+                if item is None:
+                    return
+                taken.append(item)
+                yield item[1]
+
+        records = []
+        try:
+            navigator = UTSuiteNavigatorClass(self.config, None, session, self.log)
+            navigator.start()
+            navigator.run_batch(entries(), timeout, is_cunit, gtest, results=records)
+        except Exception as e:
+            # Keep what completed and hand the remaining tests to the other sessions
+            self.log.error(f"Session [{index}] failed: {e}")
+            self._requeue(index)
+            if len(taken) > len(records):
+                # The entry that was running
+                entry = taken[len(records)][1]
+                records.append(batch_record(entry[0], entry[1], f"Session failed: {e}"))
+            navigator = None
+        for (position, _), record in zip(taken, records):
+            record["session"] = index
+            results[position] = record
+        if navigator is None:
+            return
+        try:
+            navigator.stop()
+        except Exception as e:
+            self.log.error(f"Session [{index}] failed to stop: {e}")
+
+    @staticmethod
+    def _historyKey(suite_name, test_name):
+        return f"{suite_name}::{test_name if test_name is not None else '*'}"
+
+    def _loadHistory(self):
+        if not self.historyFile or not os.path.isfile(self.historyFile):
+            return {}
+        try:
+            with open(self.historyFile) as file:
+                return json.load(file)
+        except (OSError, ValueError) as e:
+            self.log.warn(f"Ignoring test duration history [{self.historyFile}]: {e}")
+            return {}
+
+    def _saveHistory(self):
+        if not self.historyFile:
+            return
+        temporaryPath = None
+        try:
+            descriptor, temporaryPath = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.historyFile)), suffix=".tmp")
+            with os.fdopen(descriptor, "w") as file:
+                json.dump(self.history, file, indent=1, sort_keys=True)
+            # Atomic replace, so a concurrent or interrupted run never leaves a partial file
+            os.replace(temporaryPath, self.historyFile)
+        except OSError as e:
+            self.log.warn(f"Failed to save test duration history [{self.historyFile}]: {e}")
+            if temporaryPath is not None and os.path.exists(temporaryPath):
+                os.unlink(temporaryPath)
+
+# Test and example usage code
+if __name__ == '__main__':
+    from framework.plugins.ut_raft.interactiveShell import InteractiveShell
+
+    suiteConfig = """
+    dsAudio:
+        test:
+            execute: "cd bin;./run.sh -p ../profiles/sink/Sink_AudioSettings.yaml"
+            type: UT-C
+            suites:
+                0:
+                    name: "L1 dsAudio - Sink"
+                    tests:
+                        - None
+                1:
+                    name: "L2 dsAudio - Sink"
+                    tests:
+                        - None
+    """
+
+    shells = [InteractiveShell() for _ in range(2)]
+    for shell in shells:
+        shell.open()
+
+    scheduler = utSuiteScheduler(suiteConfig, "dsAudio", shells, historyFile="/tmp/dsAudio_durations.json")
+    for record in scheduler.run():
+        print("session:[{}] [{}] [{}] result:[{}] {:.2f}s".format(record["session"], record["suite"], record["test"], record["result"], record["duration"]))
+
+    for shell in shells:
+        shell.close()
@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+#** *****************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2024 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+
+import sys
+import os
+import argparse
+import glob
+import json
+import platform
+import re
+import shlex
+import shutil
+import socket
+import statistics
+import subprocess
+import tempfile
+import time
+
+dir_path = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(dir_path+"/../../../")
+sys.path.append(dir_path)
+
+from framework.core.logModule import logModule
+from framework.plugins.ut_raft.utBaseUtils import utBaseUtils
+
+# Dataset name -> list of (number of files, file size in bytes)
+DATASETS = {
+    "large": [(1, 64 * 1024 * 1024)],
+    "small": [(2000, 4 * 1024)],
+    "mixed": [(1, 16 * 1024 * 1024), (200, 64 * 1024), (500, 1024)],
+}
+
+METHODS = ["scp", "sftp", "rsync", "tar", "tar_gz", "delta", "resumable"]
+
+# Methods that skip unchanged data, also measured against a target that is already in sync ("<method>_warm")
+WARM_METHODS = ["rsync", "delta"]
+
+# Messages utBaseUtils returns when a transfer fails, e.g. "TAR copy failed: ..." or "DELTA: Source not found: ..."
+FAILURE_MESSAGE = re.compile(r"^\w+ (copy|sync) failed:|^\w+: Source not found")
+
+class IncompleteTransferError(RuntimeError):
+    """
+    A transfer left the target without the whole dataset, although it reported no error.
+    """
+
+class LoopbackSshd():
+    """
+    Runs a private sshd on the loopback interface as a stand-in for a device.
+
+    The daemon runs as the current user on a free port, with a temporary host key and the
+    user's public keys (~/.ssh/*.pub) authorised, so scp, rsync and Paramiko all connect
+    with the user's default identity.
+    """
+    def __init__(self, sshd:str="/usr/sbin/sshd"):
+        """
+        Args:
+            sshd (str, optional): Path of the sshd binary. Defaults to /usr/sbin/sshd.
+        """
+        self.sshd = sshd
+        self.address = "127.0.0.1"
+        self.port = None
+        self.username = os.environ.get("USER") or os.getlogin()
+        self.process = None
+        self.directory = None
+
+    def start(self):
+        """
+        Starts the daemon and waits until it accepts connections.
+
+        Raises:
+            RuntimeError: If no public key is available or sshd does not start.
+        """
+        keys = glob.glob(os.path.expanduser("~/.ssh/*.pub"))
+        if not keys:
+            raise RuntimeError("No public key found in ~/.ssh, create one with ssh-keygen")
+
+        self.directory = tempfile.mkdtemp(prefix="ut_sshd_")
+        hostKey = os.path.join(self.directory, "host_key")
+        authorizedKeys = os.path.join(self.directory, "authorized_keys")
+        subprocess.run(["ssh-keygen", "-q", "-t", "ed25519", "-N", "", "-f", hostKey], check=True)
+        with open(authorizedKeys, "w") as output:
+            for key in keys:
+                with open(key) as source:
+                    output.write(source.read())
+        os.chmod(authorizedKeys, 0o600)
+
+        with socket.socket() as probe:
+            probe.bind((self.address, 0))
+            self.port = probe.getsockname()[1]
+
+        config = os.path.join(self.directory, "sshd_config")
+        with open(config, "w") as output:
+            output.write(f"ListenAddress {self.address}\n")
+            output.write(f"Port {self.port}\n")
+            output.write(f"HostKey {hostKey}\n")
+            output.write(f"AuthorizedKeysFile {authorizedKeys}\n")
+            output.write(f"PidFile {os.path.join(self.directory, 'sshd.pid')}\n")
+            output.write("StrictModes no\n")
+            output.write("UsePAM no\n")
+            output.write("Subsystem sftp internal-sftp\n")
+
+        self.process = subprocess.Popen([self.sshd, "-D", "-e", "-f", config], stderr=subprocess.DEVNULL)
+        deadline = time.time() + 10
+        while time.time() < deadline:
+            try:
+                with socket.create_connection((self.address, self.port), timeout=0.5):
+                    return
+            except OSError:
+                time.sleep(0.1)
+        self.stop()
+        raise RuntimeError("sshd did not start")
+
+    def stop(self):
+        """
+        Stops the daemon and removes its temporary files.
+        """
+        if self.process is not None:
+            self.process.terminate()
+            self.process.wait()
+            self.process = None
+        if self.directory is not None:
+            shutil.rmtree(self.directory, ignore_errors=True)
+            self.directory = None
+
+class utTransferBenchmark():
+    """
+    Measures the utBaseUtils transfer paths against each other.
+
+    For every dataset and method the benchmark records the elapsed time, throughput,
+    per-file overhead and host CPU time. Methods that skip unchanged data (WARM_METHODS)
+    are also measured against a target that already holds the dataset. Results are plain dictionaries that can be
+    saved as JSON and compared against a stored baseline.
+    """
+    def __init__(self, session, remoteDirectory:str="/tmp/ut_transfer_benchmark", log:logModule=None):
+        """
+        Args:
+            session (session class): The active SSH session object of the target (or loopback stand-in).
+            remoteDirectory (str, optional): Scratch directory on the target. Defaults to /tmp/ut_transfer_benchmark.
+            log (class, optional): Parent log class. Defaults to None.
+        """
+        self.log = log
+        if log is None:
+            self.log = logModule(self.__class__.__name__)
+            self.log.setLevel( self.log.INFO )
+
+        self.session = session
+        self.remoteDirectory = remoteDirectory
+        self.baseUtils = utBaseUtils(self.log)
+
+    def createDataset(self, directory:str, name:str, scale:float=1.0):
+        """
+        Generates the files of a dataset on the host.
+
+        Args:
+            directory (str): Parent directory, the dataset is created in a sub-directory called name.
+            name (str): Dataset name, a key of DATASETS.
+            scale (float, optional): Multiplier for the file sizes. Defaults to 1.0.
+
+        Returns:
+            str: Path of the dataset directory.
+        """
+        root = os.path.join(directory, name)
+        os.makedirs(root, exist_ok=True)
+        for group, (count, size) in enumerate(DATASETS[name]):
+            size = max(int(size * scale), 1)
+            for index in range(count):
+                # Spread files over sub-directories to exercise recursion
+                subdirectory = os.path.join(root, f"group{group}", f"dir{index // 100}")
+                os.makedirs(subdirectory, exist_ok=True)
+                with open(os.path.join(subdirectory, f"file{index}.bin"), "wb") as output:
+                    output.write(os.urandom(size))
+        return root
+
+    def _transfer(self, method, root, files):
+        """
+        Copies a dataset to the scratch directory using one transfer path.
+
+        Raises:
+            RuntimeError: If the transfer reports a failure.
+        """
+        destination = self.remoteDirectory
+        if method == "rsync":
+            messages = [self.baseUtils.rsync(self.session, root + "/", destination)]
+        elif method == "tar":
+            messages = [self.baseUtils.tarCopy(self.session, root + "/", destination)]
+        elif method == "tar_gz":
+            messages = [self.baseUtils.tarCopy(self.session, root + "/", destination, compress=True)]
+        elif method == "delta":
+            messages = [self.baseUtils.deltaSync(self.session, root + "/", destination)]
+        else:
+            targets = [(path, os.path.join(destination, os.path.dirname(os.path.relpath(path, root)))) for path in files]
+            # The per-file copies do not create the sub-directories of the dataset
+            directories = " ".join(shlex.quote(directory) for directory in sorted({target for _, target in targets}))
+            status, _, error = self.baseUtils._execCommand(self.session, f"mkdir -p {directories}")
+            if status != 0:
+                raise RuntimeError(f"Failed to create the target directories: {error}")
+            messages = []
+            for path, target in targets:
+                if method == "scp":
+                    messages.append(self.baseUtils.scpCopy(self.session, path, target))
+                elif method == "sftp":
+                    messages.append(self.baseUtils.sftpCopy(self.session, path, target))
+                elif method == "resumable":
+                    messages.append(self.baseUtils.resumableCopy(self.session, path, target))
+                else:
+                    raise ValueError(f"Unknown transfer method [{method}]")
+
+        for message in messages:
+            if message and FAILURE_MESSAGE.match(message):
+                raise RuntimeError(message)
+
+    def _verify(self, fileCount, totalBytes):
+        """
+        Checks that the scratch directory holds the whole dataset, as scp and rsync report no errors.
+
+        Raises:
+            IncompleteTransferError: If files or bytes are missing on the target.
+        """
+        status, output, error = self.baseUtils._execCommand(self.session,
+            f"cd {self.remoteDirectory} && find . -type f | wc -l && find . -type f -exec cat {{}} + | wc -c")
+        counts = output.split()
+        if status != 0 or len(counts) != 2 or [int(value) for value in counts if value.isdigit()] != [fileCount, totalBytes]:
+            raise IncompleteTransferError(f"Target holds [{' '.join(counts)}] files/bytes, expected [{fileCount} {totalBytes}] {error}")
+
+    def measure(self, method:str, root:str, repeat:int=3, warm:bool=False):
+        """
+        Measures one transfer path on one dataset.
+
+        Every run is checked: a transfer that reports a failure fails the measurement, and one that leaves
+        the target without the whole dataset fails the benchmark, instead of being timed as throughput.
+
+        Args:
+            method (str): Transfer method, one of METHODS.
+            root (str): Dataset directory on the host.
+            repeat (int, optional): Number of runs, the median is reported. Defaults to 3.
+            warm (bool, optional): Sync the dataset once, then time runs against the already synced target.
+                                   Defaults to False (every run starts from an empty target).
+
+        Returns:
+            dict: elapsed (s), throughput (bytes/s), perFileOverhead (s), cpu (host CPU seconds), files, bytes.
+
+        Raises:
+            RuntimeError: If a run fails.
+            IncompleteTransferError: If a run leaves files or bytes missing on the target.
+        """
+        files = [path for path, _ in self.baseUtils._listSourceFiles(root + "/")]
+        totalBytes = sum(os.path.getsize(path) for path in files)
+        elapsed = []
+        cpu = []
+        clear = f"rm -rf {self.remoteDirectory} && mkdir -p {self.remoteDirectory}"
+        if warm:
+            self.baseUtils._execCommand(self.session, clear)
+            self._transfer(method, root, files)
+            self._verify(len(files), totalBytes)
+        for run in range(repeat):
+            if not warm:
+                self.baseUtils._execCommand(self.session, clear)
+            before = os.times()
+            start = time.perf_counter()
+            try:
+                self._transfer(method, root, files)
+            except RuntimeError as e:
+                raise RuntimeError(f"Run {run + 1} failed: {e}")
+            elapsed.append(time.perf_counter() - start)
+            after = os.times()
+            cpu.append((after.user - before.user) + (after.system - before.system) +
+                       (after.children_user - before.children_user) + (after.children_system - before.children_system))
+            try:
+                self._verify(len(files), totalBytes)
+            except IncompleteTransferError as e:
+                raise IncompleteTransferError(f"[{method}] run {run + 1} incomplete: {e}")
+
+        median = statistics.median(elapsed)
+        return {
+            "elapsed": median,
+            "throughput": totalBytes / median if median > 0 else 0,
+            "perFileOverhead": median / len(files) if files else 0,
+            "cpu": statistics.median(cpu),
+            "files": len(files),
+            "bytes": totalBytes,
+        }
+
+    def run(self, datasets:list=None, methods:list=None, repeat:int=3, scale:float=1.0):
+        """
+        Runs the full matrix of datasets and methods.
+
+        Args:
+            datasets (list, optional): Dataset names, defaults to all of DATASETS.
+            methods (list, optional): Method names, defaults to all of METHODS.
+            repeat (int, optional): Runs per measurement. Defaults to 3.
+            scale (float, optional): Multiplier for the file sizes. Defaults to 1.0.
+
+        Returns:
+            dict: {"meta": {...}, "results": {dataset: {method: measurement}}}, with "<method>_warm" entries for
+                  WARM_METHODS and {"error": message} for transfers that reported a failure.
+
+        Raises:
+            IncompleteTransferError: If a transfer reported success but left files missing, as its results would be meaningless.
+        """
+        datasets = datasets or list(DATASETS)
+        methods = methods or METHODS
+        report = {
+            "meta": {
+                "host": platform.node(),
+                "python": platform.python_version(),
+                "target": f"{self.session.address}:{self.session.port}",
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "repeat": repeat,
+                "scale": scale,
+            },
+            "results": {},
+        }
+        workspace = tempfile.mkdtemp(prefix="ut_transfer_data_")
+        try:
+            for name in datasets:
+                root = self.createDataset(workspace, name, scale)
+                report["results"][name] = {}
+                runs = [(method, False) for method in methods] + [(method, True) for method in methods if method in WARM_METHODS]
+                for method, warm in runs:
+                    label = f"{method}_warm" if warm else method
+                    self.log.info(f"Benchmarking [{label}] on [{name}]")
+                    try:
+                        result = self.measure(method, root, repeat, warm)
+                    except IncompleteTransferError:
+                        raise
+                    except Exception as e:
+                        self.log.error(f"[{label}] on [{name}] failed: {e}")
+                        result = {"error": str(e)}
+                    report["results"][name][label] = result
+        finally:
+            shutil.rmtree(workspace, ignore_errors=True)
+            self.baseUtils._execCommand(self.session, f"rm -rf {self.remoteDirectory}")
+        return report
+
+    @staticmethod
+    def compare(report:dict, baseline:dict, tolerance:float=0.1):
+        """
+        Compares a report with a baseline report.
+
+        Args:
+            report (dict): Report returned by run().
+            baseline (dict): Previously saved report.
+            tolerance (float, optional): Allowed relative throughput drop. Defaults to 0.1 (10%).
+
+        Returns:
+            list: One dict per regression: dataset, method, baseline and current throughput, change.
+                  A method that worked in the baseline and now fails is a regression with a change of -1.
+        """
+        regressions = []
+        for name, methods in report["results"].items():
+            for method, result in methods.items():
+                reference = baseline.get("results", {}).get(name, {}).get(method)
+                if not reference or "throughput" not in reference:
+                    continue
+                if "error" in result:
+                    regressions.append({
+                        "dataset": name,
+                        "method": method,
+                        "baseline": reference["throughput"],
+                        "current": 0,
+                        "change": -1.0,
+                        "error": result["error"],
+                    })
+                    continue
+                if reference["throughput"] <= 0:
+                    continue
+                change = (result["throughput"] - reference["throughput"]) / reference["throughput"]
+                if change < -tolerance:
+                    regressions.append({
+                        "dataset": name,
+                        "method": method,
+                        "baseline": reference["throughput"],
+                        "current": result["throughput"],
+                        "change": change,
+                    })
+        return regressions
+
+# Test and example usage code
+if __name__ == '__main__':
+    from framework.core.commandModules.sshConsole import sshConsole
+
+    parser = argparse.ArgumentParser(description="Benchmark the utBaseUtils transfer paths")
+    parser.add_argument("--address", help="Target address, a loopback sshd is started when omitted")
+    parser.add_argument("--port", type=int, default=22)
+    parser.add_argument("--username", default="root")
+    parser.add_argument("--password", default="")
+    parser.add_argument("--datasets", nargs="+", choices=list(DATASETS), default=list(DATASETS))
+    parser.add_argument("--methods", nargs="+", choices=METHODS, default=METHODS)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiplier for the dataset file sizes")
+    parser.add_argument("--output", default="transfer_benchmark.json")
+    parser.add_argument("--baseline", help="Baseline JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.1)
+    args = parser.parse_args()
+
+    loopback = None
+    if args.address is None:
+        loopback = LoopbackSshd()
+        loopback.start()
+        args.address, args.port, args.username = loopback.address, loopback.port, loopback.username
+
+    try:
+        session = sshConsole(logModule("utTransferBenchmark"), args.address, args.username, args.password, port=args.port)
+        session.open()
+        benchmark = utTransferBenchmark(session)
+        report = benchmark.run(args.datasets, args.methods, args.repeat, args.scale)
+        session.close()
+    finally:
+        if loopback is not None:
+            loopback.stop()
+
+    with open(args.output, "w") as output:
+        json.dump(report, output, indent=2)
+    print(json.dumps(report["results"], indent=2))
+
+    if args.baseline:
+        with open(args.baseline) as source:
+            regressions = utTransferBenchmark.compare(report, json.load(source), args.tolerance)
+        for regression in regressions:
+            print("REGRESSION {dataset}/{method}: {baseline:.0f} -> {current:.0f} B/s ({change:+.1%})".format(**regression))
+        sys.exit(1 if regressions else 0)
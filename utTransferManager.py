@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+#** *****************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2024 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+
+import sys
+import os
+import threading
+import itertools
+from concurrent.futures import Future
+
+dir_path = os.path.dirname(os.path.realpath(__file__))
+sys.path.append(dir_path+"/../../../")
+sys.path.append(dir_path)
+
+from framework.core.logModule import logModule
+
+class utTransferManager():
+    """
+    Runs file transfers in the background so they overlap with test execution.
+
+    Transfers are queued with a priority and executed by a bounded pool of worker threads.
+    The number of transfers running against the same device at once is limited separately,
+    so prefetching for one device never starves the link of another.
+
+    Only helpers that use their own SSH channels (e.g. utBaseUtils.resumableCopy, tarCopy, deltaSync)
+    should be submitted; helpers that type into the interactive console would interleave with the test.
+    """
+    def __init__(self, maxWorkers:int=4, perDeviceLimit:int=2, log:logModule=None):
+        """
+        Initializes the transfer manager and starts the worker threads.
+
+        Args:
+            maxWorkers (int, optional): Maximum number of transfers running at once. Defaults to 4.
+            perDeviceLimit (int, optional): Maximum number of transfers running at once per device. Defaults to 2.
+            log (class, optional): Parent log class. Defaults to None.
+        """
+        self.log = log
+        if log is None:
+            self.log = logModule(self.__class__.__name__)
+            self.log.setLevel( self.log.INFO )
+
+        self.perDeviceLimit = perDeviceLimit
+        self._pending = []
+        self._active = {}
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._shutdown = False
+        self._workers = []
+        for index in range(maxWorkers):
+            worker = threading.Thread(target=self._worker, name=f"utTransfer-{index}", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    def submit(self, function, *args, device:str="dut", priority:int=0, **kwargs):
+        """
+        Queues a transfer for background execution.
+
+        Args:
+            function (callable): The transfer to run, e.g. utBaseUtils().resumableCopy.
+            *args: Positional arguments passed to the function.
+            device (str, optional): Device the transfer targets, used for the per-device limit. Defaults to "dut".
+            priority (int, optional): Lower values run first; equal priorities run in submission order. Defaults to 0.
+            **kwargs: Keyword arguments passed to the function.
+
+        Returns:
+            Future: Resolves to the function's return value, or raises its exception.
+
+        Raises:
+            RuntimeError: If the manager has been shut down.
+        """
+        future = Future()
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("Transfer manager has been shut down")
+            self._pending.append((priority, next(self._sequence), device, future, function, args, kwargs))
+            self._pending.sort(key=lambda job: (job[0], job[1]))
+            self._condition.notify()
+        return future
+
+    def pending(self):
+        """
+        Returns the number of transfers that are queued but not yet started.
+        """
+        with self._condition:
+            return len(self._pending)
+
+    def shutdown(self, wait:bool=True, cancelPending:bool=False):
+        """
+        Stops accepting transfers and optionally waits for the workers to finish.
+
+        Args:
+            wait (bool, optional): Block until all queued and running transfers are complete. Defaults to True.
+            cancelPending (bool, optional): Cancel transfers that have not started yet. Defaults to False.
+        """
+        with self._condition:
+            self._shutdown = True
+            if cancelPending:
+                for job in self._pending:
+                    job[3].cancel()
+                self._pending = []
+            self._condition.notify_all()
+        if wait:
+            for worker in self._workers:
+                worker.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown(wait=True)
+
+    def _nextJob(self):
+        """
+        Removes and returns the highest priority job whose device is below its limit, or None.
+        Must be called with the condition held.
+        """
+        for index, job in enumerate(self._pending):
+            device = job[2]
+            if self._active.get(device, 0) < self.perDeviceLimit:
+                del self._pending[index]
+                self._active[device] = self._active.get(device, 0) + 1
+                return job
+        return None
+
+    def _worker(self):
+        while True:
+            with self._condition:
+                job = self._nextJob()
+                while job is None:
+                    if self._shutdown and not self._pending:
+                        return
+                    self._condition.wait()
+                    job = self._nextJob()
+
+            priority, _, device, future, function, args, kwargs = job
+            if future.set_running_or_notify_cancel():
+                self.log.debug(f"Transfer started: device [{device}] priority [{priority}]")
+                try:
+                    future.set_result(function(*args, **kwargs))
+                except BaseException as e:
+                    self.log.error(f"Transfer failed on device [{device}]: {e}")
+                    future.set_exception(e)
+
+            with self._condition:
+                self._active[device] -= 1
+                self._condition.notify_all()
+
+# Test and example usage code
+if __name__ == '__main__':
+    import time
+
+    def transfer(name, duration):
+        time.sleep(duration)
+        return name
+
+    with utTransferManager(maxWorkers=3, perDeviceLimit=1) as manager:
+        futures = [
+            manager.submit(transfer, "dut-low", 0.2, device="dut", priority=5),
+            manager.submit(transfer, "dut-high", 0.2, device="dut", priority=0),
+            manager.submit(transfer, "dut2", 0.2, device="dut2"),
+        ]
+        print([future.result() for future in futures])
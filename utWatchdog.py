@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+#** *****************************************************************************
+# *
+# * If not stated otherwise in this file or this component's LICENSE file the
+# * following copyright and licenses apply:
+# *
+# * Copyright 2024 RDK Management
+# *
+# * Licensed under the Apache License, Version 2.0 (the "License");
+# * you may not use this file except in compliance with the License.
+# * You may obtain a copy of the License at
+# *
+# *
+# http://www.apache.org/licenses/LICENSE-2.0
+# *
+# * Unless required by applicable law or agreed to in writing, software
+# * distributed under the License is distributed on an "AS IS" BASIS,
+# * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# * See the License for the specific language governing permissions and
+# * limitations under the License.
+# *
+#* ******************************************************************************
+
+import re
+import time
+
+# A crash as the shell reports it, on a line of its own: "Segmentation fault (core dumped)", or with the
+# job details, e.g. "./run.sh: line 5:  1234 Aborted                 ./hal_test"
+_CRASH_NAMES = r"(?:Segmentation fault|Aborted|Bus error|Illegal instruction)"
+CRASH_PATTERN = re.compile(r"^" + _CRASH_NAMES + r"(?: \(core dumped\))?[ \t]*\r?$|^.*: line \d+: +\d+ " + _CRASH_NAMES + r"\b.*$",
+                           re.MULTILINE)
+
+# A shell prompt as the whole last line, e.g. "root@device:~# ", "/ # " or "$ "
+SHELL_PROMPT = r"(?:\A|\n)\r?(?:\S+@\S+|[/~]\S*)? ?[#$] \Z"
+
+class utTestWatchdog():
+    """
+    Watches the output of a running test for crashes, exits and hangs.
+
+    The reader feeds the watchdog with everything it receives (see feed()) and calls check() while
+    waiting, so a crash is reported as soon as it is printed instead of when the read times out:
+
+    * "crash":  the shell reported a crash (e.g. "Segmentation fault") on a line of its own.
+    * "exited": the output stopped at a shell prompt, i.e. the binary is no longer running.
+    * "hang":   no output for stallTimeout seconds.
+
+    A read that reaches its timeout while output keeps arriving is not reported here; the caller
+    reports it as a "timeout".
+    """
+    tailSize = 4096
+
+    def __init__(self, stallTimeout:float = 60, shellPrompt:str = SHELL_PROMPT, exitGrace:float = 1.0, crashPattern:re.Pattern = CRASH_PATTERN):
+        """
+        Initializes the watchdog.
+
+        Args:
+            stallTimeout (float, optional): Seconds without output before the test is considered hung,
+                                            None to disable. Defaults to 60.
+            shellPrompt (str, optional): Regular expression matching the end of the output at a shell prompt. Defaults to SHELL_PROMPT.
+            exitGrace (float, optional): Seconds the output must stay at the shell prompt before the binary is
+                                         considered to have exited. Defaults to 1.0.
+            crashPattern (re.Pattern, optional): Regular expression matching a crash report. Defaults to CRASH_PATTERN.
+        """
+        self.stallTimeout = stallTimeout
+        self.shellPrompt = re.compile(shellPrompt)
+        self.exitGrace = exitGrace
+        self.crashPattern = crashPattern
+        self.reset()
+
+    def reset(self):
+        """
+        Starts watching a new read.
+        """
+        self.tail = ""
+        self.lastData = time.monotonic()
+
+    def feed(self, data:str):
+        """
+        Records output received from the session.
+        """
+        if data:
+            self.tail = (self.tail + data)[-self.tailSize:]
+            self.lastData = time.monotonic()
+
+    def check(self):
+        """
+        Classifies the state of the test from the output received so far.
+
+        Returns:
+            tuple: (reason, detail) for a crash, exit or hang, or None if the test looks healthy.
+        """
+        match = self.crashPattern.search(self.tail)
+        if match:
+            return ("crash", match.group(0).strip())
+
+        idle = time.monotonic() - self.lastData
+        if idle >= self.exitGrace and self.shellPrompt.search(self.tail):
+            return ("exited", self.tail.rstrip().rsplit("\n", 1)[-1].strip())
+        if self.stallTimeout is not None and idle >= self.stallTimeout:
+            return ("hang", f"No output for {idle:.0f}s")
+        return None
+
+# Test and example usage code
+if __name__ == '__main__':
+    watchdog = utTestWatchdog(stallTimeout=0.2, exitGrace=0.1)
+    watchdog.feed("Running Test : Initialize dsAudio\n")
+    assert watchdog.check() is None, "Expected: healthy"
+    watchdog.feed("Segmentation fault (core dumped)\nroot@device:~# ")
+    assert watchdog.check() == ("crash", "Segmentation fault (core dumped)"), f"Unexpected: {watchdog.check()}"
+
+    # Test output mentioning a crash, or ending in "#" or "$", is not a crash or a shell prompt
+    watchdog.reset()
+    watchdog.feed("Aborted tests: 0\nSegmentation fault handler installed\nPrice in $ \nEnter channel #")
+    time.sleep(0.15)
+    assert watchdog.check() is None, f"Unexpected: {watchdog.check()}"
+    watchdog.feed("\n./run.sh: line 5:  1234 Aborted                 ./hal_test\n")
+    assert watchdog.check() == ("crash", "./run.sh: line 5:  1234 Aborted                 ./hal_test"), f"Unexpected: {watchdog.check()}"
+
+    watchdog.reset()
+    watchdog.feed("Running Test : Terminate dsAudio\nroot@device:~# ")
+    time.sleep(0.15)
+    assert watchdog.check()[0] == "exited", f"Unexpected: {watchdog.check()}"
+
+    watchdog.reset()
+    watchdog.feed("Running Test : Set Audio Delay\n")
+    time.sleep(0.25)
+    assert watchdog.check()[0] == "hang", f"Unexpected: {watchdog.check()}"